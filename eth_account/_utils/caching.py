@@ -0,0 +1,103 @@
+from collections import (
+    OrderedDict,
+)
+from collections.abc import (
+    Callable,
+    Hashable,
+)
+import threading
+from typing import (
+    Generic,
+    NamedTuple,
+    TypeVar,
+)
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    size_bytes: int
+
+
+class LRUCache(Generic[TKey, TValue]):
+    """
+    A thread-safe, size-bounded least-recently-used cache.
+
+    Entries are evicted once there are more than ``maxsize`` of them or, when
+    ``max_bytes`` is given, once the total of ``sizeof(value)`` over all entries
+    exceeds it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_bytes: int | None = None,
+        sizeof: Callable[[TValue], int] | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer, got {maxsize}")
+        if max_bytes is not None and sizeof is None:
+            raise TypeError("A sizeof function is required to limit max_bytes")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[TKey, TValue] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: TKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: TKey) -> TValue | None:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: TKey, value: TValue) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._forget(key)
+            self._entries[key] = value
+            if self._sizeof is not None:
+                self._size_bytes += self._sizeof(value)
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._size_bytes > self.max_bytes
+            ):
+                self._forget(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    def _forget(self, key: TKey) -> None:
+        value = self._entries.pop(key)
+        if self._sizeof is not None:
+            self._size_bytes -= self._sizeof(value)
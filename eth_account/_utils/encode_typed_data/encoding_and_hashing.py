@@ -1,16 +1,41 @@
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+)
+import copy
+import functools
+import itertools
+from types import (
+    MappingProxyType,
+)
 from typing import (
     Any,
+    NamedTuple,
+    cast,
 )
 
-from eth_abi import (
-    encode,
+from eth_abi.registry import (
+    registry as abi_registry,
+)
+from eth_hash.auto import (
+    keccak as keccak256,
 )
 from eth_utils import (
+    ValidationError,
     keccak,
     to_bytes,
     to_int,
 )
 
+from eth_account._utils.caching import (
+    LRUCache,
+)
 from eth_account._utils.encode_typed_data.helpers import (
     EIP712_SOLIDITY_TYPES,
     is_0x_prefixed_hexstr,
@@ -18,6 +43,29 @@ from eth_account._utils.encode_typed_data.helpers import (
     parse_core_array_type,
     parse_parent_array_type,
 )
+from eth_account._utils.raw_transactions import (
+    map_with_backpressure,
+)
+
+# Hashes of the sub-structs of a message, keyed by struct_hash_memo_key
+StructHashMemo = LRUCache[tuple[Any, ...], bytes]
+
+
+class ParallelArrayHashing(NamedTuple):
+    """
+    Encode the items of large arrays on ``executor``, ``chunksize`` items at a
+    time, for arrays of at least ``min_size`` items.
+
+    The encoded chunks are hashed in order, so the hash is the same as when the
+    items are encoded one at a time. At most ``max_pending`` chunks are read
+    ahead of the one being hashed. Arrays nested in the items of a chunk are
+    encoded serially, and without a memo.
+    """
+
+    executor: Executor
+    min_size: int = 1024
+    chunksize: int = 256
+    max_pending: int = 8
 
 
 def get_primary_type(types: dict[str, list[dict[str, str]]]) -> str:
@@ -43,43 +91,133 @@ def encode_field(
     name: str,
     type_: str,
     value: Any,
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
 ) -> tuple[str, int | bytes]:
     if type_ in types.keys():
         # type is a custom type
         if value is None:
             return ("bytes32", b"\x00" * 32)
+        elif memo is None:
+            return ("bytes32", keccak(encode_data(type_, types, value, None, parallel)))
+        else:
+            return (
+                "bytes32",
+                memoized_struct_hash(
+                    memo,
+                    encode_type(type_, types),
+                    value,
+                    lambda: keccak(encode_data(type_, types, value, memo, parallel)),
+                ),
+            )
+
+    elif value is not None and is_array_type(type_):
+        items = iter_array_items(name, type_, value)
+        parsed_type = parse_parent_array_type(type_)
+
+        def encode_item_word(item: Any) -> bytes:
+            return encode_word(
+                *encode_field(types, name, parsed_type, item, memo, parallel)
+            )
+
+        return (
+            "bytes32",
+            hash_array(types, name, parsed_type, items, encode_item_word, parallel),
+        )
+
+    return encode_atomic_field(name, type_, value)
+
+
+def iter_array_items(name: str, type_: str, value: Any) -> Iterator[Any]:
+    """
+    Return an iterator over the items of an array field's value, which may be
+    any iterable other than a string, bytes or a mapping.
+    """
+    # strings, bytes and structs are iterable, but are not arrays
+    is_array = isinstance(value, Iterable) and not isinstance(
+        value, (str, bytes, bytearray, Mapping)
+    )
+    if not is_array:
+        raise ValueError(
+            f"Invalid value for field `{name}` of type `{type_}`: "
+            f"expected array, got `{value}` of type `{type(value)}`"
+        )
+    return iter(value)
+
+
+def hash_array(
+    types: dict[str, list[dict[str, str]]],
+    name: str,
+    item_type: str,
+    items: Iterator[Any],
+    encode_item_word: Callable[[Any], bytes],
+    parallel: ParallelArrayHashing | None = None,
+) -> bytes:
+    """
+    Hash the words of an array's items as they are encoded, so the items are
+    read one at a time and never held all at once.
+    """
+    array_hash = keccak256.new(b"")
+    if parallel is not None:
+        head = list(itertools.islice(items, parallel.min_size))
+        if len(head) < parallel.min_size:
+            items = iter(head)
         else:
-            return ("bytes32", keccak(encode_data(type_, types, value)))
+            for encoded_chunk in encode_array_in_parallel(
+                parallel, types, name, item_type, itertools.chain(head, items)
+            ):
+                array_hash.update(encoded_chunk)
+            return array_hash.digest()
 
-    elif type_ in ["string", "bytes"] and value is None:
+    for item in items:
+        array_hash.update(encode_item_word(item))
+    return array_hash.digest()
+
+
+def encode_array_items(
+    types: dict[str, list[dict[str, str]]],
+    name: str,
+    item_type: str,
+    items: Iterable[Any],
+) -> bytes:
+    """
+    Encode the items of an array field as consecutive 32-byte words.
+    """
+    return b"".join(
+        encode_word(*encode_field(types, name, item_type, item)) for item in items
+    )
+
+
+def encode_array_in_parallel(
+    parallel: ParallelArrayHashing,
+    types: dict[str, list[dict[str, str]]],
+    name: str,
+    item_type: str,
+    items: Iterable[Any],
+) -> Iterator[bytes]:
+    """
+    Like :func:`encode_array_items`, but encode chunks of the items on
+    ``parallel.executor``, and yield the encoded chunks in order.
+    """
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, parallel.chunksize)), [])
+    encode_chunk = functools.partial(encode_array_items, types, name, item_type)
+    return map_with_backpressure(
+        parallel.executor, encode_chunk, chunks, parallel.max_pending
+    )
+
+
+def encode_atomic_field(name: str, type_: str, value: Any) -> tuple[str, int | bytes]:
+    """
+    Encode a field that is neither a custom type nor a non-empty array.
+    """
+    if type_ in ["string", "bytes"] and value is None:
         return ("bytes32", b"")
 
     # None is allowed only for custom and dynamic types
     elif value is None:
         raise ValueError(f"Missing value for field `{name}` of type `{type_}`")
 
-    elif is_array_type(type_):
-        # handle array type with non-array value
-        if not isinstance(value, list):
-            raise ValueError(
-                f"Invalid value for field `{name}` of type `{type_}`: "
-                f"expected array, got `{value}` of type `{type(value)}`"
-            )
-
-        parsed_type = parse_parent_array_type(type_)
-        type_value_pairs = [
-            encode_field(types, name, parsed_type, item) for item in value
-        ]
-        if not type_value_pairs:
-            # the keccak hash of `encode((), ())`
-            return (
-                "bytes32",
-                b"\xc5\xd2F\x01\x86\xf7#<\x92~}\xb2\xdc\xc7\x03\xc0\xe5\x00\xb6S\xca\x82';{\xfa\xd8\x04]\x85\xa4p",  # noqa: E501
-            )
-
-        data_types, data_hashes = zip(*type_value_pairs)
-        return ("bytes32", keccak(encode(data_types, data_hashes)))
-
     elif type_ == "bool":
         falsy_values = {"False", "false", "0"}
         return (type_, False) if not value or value in falsy_values else (type_, True)
@@ -122,6 +260,98 @@ def encode_field(
     return (type_, value)
 
 
+def encode_word(abi_type: str, value: int | bytes) -> bytes:
+    """
+    Encode a value of a static ABI type as one 32-byte word.
+
+    This gives the same result as ``eth_abi.encode([abi_type], [value])``,
+    including its validation errors, but skips the tuple encoder. Hashes and
+    in-range ``uint256`` values, the most common words, are not validated again.
+    """
+    if abi_type == "bytes32" and type(value) is bytes and len(value) == 32:
+        return value
+    elif abi_type == "uint256" and type(value) is int and 0 <= value < 2**256:
+        return value.to_bytes(32, "big")
+
+    encoder = cast(Callable[[Any], bytes], abi_registry.get_encoder(abi_type))
+    if getattr(encoder, "is_dynamic", False):
+        raise ValueError(f"Type `{abi_type}` cannot be encoded as one 32-byte word")
+    return encoder(value)
+
+
+def pack_words(abi_types: Iterable[str], values: Sequence[int | bytes]) -> bytearray:
+    """
+    Encode the values as consecutive 32-byte words.
+
+    Every member of an EIP-712 struct or array is encoded as exactly one word, so
+    this gives the same result as ``eth_abi.encode(abi_types, values)``, written
+    straight into a buffer of the right size.
+    """
+    packed = bytearray(32 * len(values))
+    offset = 0
+    for abi_type, value in zip(abi_types, values):
+        packed[offset : offset + 32] = encode_word(abi_type, value)
+        offset += 32
+    return packed
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return (
+            dict,
+            tuple(sorted((key, _freeze(item)) for key, item in value.items())),
+        )
+    elif isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in value))
+    elif value is None or isinstance(value, (str, bytes, int)):
+        # the type is part of the key, so that e.g. True and 1 are kept apart
+        return (type(value), value)
+    # other values, e.g. iterators or custom iterables used as arrays, may hash
+    # by identity while their contents change, so they are never memoized
+    raise TypeError(f"Cannot memoize a struct with a value of type {type(value)}")
+
+
+def struct_hash_memo_key(encoded_type: str, value: Any) -> tuple[Any, ...] | None:
+    """
+    Return a key for a struct value that does not depend on the order of its
+    fields, or ``None`` if one of its values is not a string, bytes, integer,
+    boolean, ``None``, list, tuple or mapping of those.
+
+    The struct is identified by its ``encode_type`` string, which spells out its
+    fields and those of its dependencies, so a memo shared by messages of
+    different types never returns the hash of a same-named, different struct.
+    """
+    try:
+        memo_key = (encoded_type, _freeze(value))
+        hash(memo_key)
+    except TypeError:
+        return None
+    return memo_key
+
+
+def memoized_struct_hash(
+    memo: StructHashMemo,
+    encoded_type: str,
+    value: Any,
+    hash_value: Callable[[], bytes],
+) -> bytes:
+    """
+    Return the hash of a struct value from ``memo``, or compute it with
+    ``hash_value`` and remember it.
+
+    Every hit in ``memo`` is a struct hash, with all of its own sub-structs,
+    that did not have to be computed again.
+    """
+    memo_key = struct_hash_memo_key(encoded_type, value)
+    if memo_key is None:
+        return hash_value()
+    struct_hash = memo.get(memo_key)
+    if struct_hash is None:
+        struct_hash = hash_value()
+        memo.put(memo_key, struct_hash)
+    return struct_hash
+
+
 def find_type_dependencies(
     type_: str,
     types: dict[str, list[dict[str, str]]],
@@ -185,39 +415,363 @@ def encode_data(
     type_: str,
     types: dict[str, list[dict[str, str]]],
     data: dict[str, Any],
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
 ) -> bytes:
     encoded_types: list[str] = ["bytes32"]
     encoded_values: list[bytes | int] = [hash_type(type_, types)]
 
     for field in types[type_]:
         type, value = encode_field(
-            types, field["name"], field["type"], data.get(field["name"])
+            types,
+            field["name"],
+            field["type"],
+            data.get(field["name"]),
+            memo,
+            parallel,
         )
         encoded_types.append(type)
         encoded_values.append(value)
 
-    return bytes(encode(encoded_types, encoded_values))
+    return bytes(pack_words(encoded_types, encoded_values))
 
 
 def hash_struct(
     type_: str,
     types: dict[str, list[dict[str, str]]],
     data: dict[str, Any],
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
 ) -> bytes:
-    encoded = encode_data(type_, types, data)
+    encoded = encode_data(type_, types, data, memo, parallel)
     return bytes(keccak(encoded))
 
 
+FieldEncoder = Callable[
+    [Any, StructHashMemo | None, ParallelArrayHashing | None], int | bytes
+]
+
+
+class CompiledStructType(NamedTuple):
+    name: str
+    encoded_type: str
+    type_hash: bytes
+    # the struct itself, then the types it references in alphabetical order
+    dependencies: tuple[str, ...]
+    field_names: tuple[str, ...]
+    abi_types: tuple[str, ...]
+    field_encoders: tuple[FieldEncoder, ...]
+
+
+class CompiledEIP712Types(NamedTuple):
+    """
+    EIP-712 message types, compiled once to encode many messages.
+
+    Create with :func:`~eth_account.messages.compile_eip712_types`. The type
+    string, type hash and dependency order of every struct are computed up front,
+    as is the encoder of every field, so encoding a message only encodes its
+    values. Instances are immutable, and pickle by recompiling from ``types``.
+    """
+
+    primary_type: str
+    # the types as compiled, including ``EIP712Domain`` if it was given, as
+    # (name, type) pairs
+    types: Mapping[str, tuple[tuple[str, str], ...]]
+    structs: Mapping[str, CompiledStructType]
+
+    @property
+    def domain_field_names(self) -> tuple[str, ...] | None:
+        """
+        The field names of the ``EIP712Domain`` type, if it was compiled.
+        """
+        if "EIP712Domain" not in self.types:
+            return None
+        return tuple(name for name, _ in self.types["EIP712Domain"])
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        types = {
+            type_: [{"name": name, "type": field_type} for name, field_type in fields]
+            for type_, fields in self.types.items()
+        }
+        return (compile_eip712_types, (types, self.primary_type))
+
+    def encode_data(
+        self,
+        data: Mapping[str, Any],
+        type_: str | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> bytes:
+        """
+        Like :func:`encode_data`, for the primary type unless ``type_`` is given.
+        """
+        struct = self.structs[self.primary_type if type_ is None else type_]
+        return _encode_compiled_struct(struct, data, memo, parallel)
+
+    def hash_struct(
+        self,
+        data: Mapping[str, Any],
+        type_: str | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> bytes:
+        """
+        Like :func:`hash_struct`, for the primary type unless ``type_`` is given.
+        """
+        return bytes(keccak(self.encode_data(data, type_, memo, parallel)))
+
+
+def _encode_compiled_struct(
+    struct: CompiledStructType,
+    data: Mapping[str, Any],
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
+) -> bytes:
+    encoded_values: list[int | bytes] = [struct.type_hash]
+    for name, encode_value in zip(struct.field_names, struct.field_encoders):
+        encoded_values.append(encode_value(data.get(name), memo, parallel))
+    return bytes(pack_words(struct.abi_types, encoded_values))
+
+
+def _compile_field(
+    compiled_types: dict[str, CompiledStructType],
+    types: dict[str, list[dict[str, str]]],
+    name: str,
+    type_: str,
+) -> tuple[str, FieldEncoder]:
+    """
+    Return the ABI type of a field and a function encoding its values, like
+    :func:`encode_field` does.
+    """
+    if type_ in types:
+
+        def encode_struct(
+            value: Any,
+            memo: StructHashMemo | None,
+            parallel: ParallelArrayHashing | None,
+        ) -> bytes:
+            struct = compiled_types[type_]
+            if value is None:
+                return b"\x00" * 32
+            elif memo is None:
+                return keccak(_encode_compiled_struct(struct, value, None, parallel))
+            return memoized_struct_hash(
+                memo,
+                struct.encoded_type,
+                value,
+                lambda: keccak(_encode_compiled_struct(struct, value, memo, parallel)),
+            )
+
+        return ("bytes32", encode_struct)
+
+    elif is_array_type(type_):
+        item_type = parse_parent_array_type(type_)
+        item_abi_type, encode_item = _compile_field(
+            compiled_types, types, name, item_type
+        )
+
+        def encode_array(
+            value: Any,
+            memo: StructHashMemo | None,
+            parallel: ParallelArrayHashing | None,
+        ) -> bytes:
+            if value is None:
+                raise ValueError(f"Missing value for field `{name}` of type `{type_}`")
+            items = iter_array_items(name, type_, value)
+
+            def encode_item_word(item: Any) -> bytes:
+                return encode_word(item_abi_type, encode_item(item, memo, parallel))
+
+            # large arrays are encoded in workers with the plain types, which gives
+            # the same words
+            return hash_array(types, name, item_type, items, encode_item_word, parallel)
+
+        return ("bytes32", encode_array)
+
+    # the ABI type of an atomic field does not depend on its value
+    abi_type = "bytes32" if type_ in ("string", "bytes") else type_
+
+    def encode_atomic(
+        value: Any,
+        memo: StructHashMemo | None,
+        parallel: ParallelArrayHashing | None,
+    ) -> int | bytes:
+        return encode_atomic_field(name, type_, value)[1]
+
+    return (abi_type, encode_atomic)
+
+
+def validate_primary_type(
+    provided_primary_type: str, derived_primary_type: str
+) -> None:
+    if derived_primary_type != provided_primary_type:
+        raise ValidationError(
+            "The provided `primaryType` does not match the derived "
+            "`primaryType`. The provided `primaryType` was "
+            f"`{provided_primary_type}`, but the derived `primaryType` was "
+            f"`{derived_primary_type}`."
+        )
+
+
+def validate_domain_fields(
+    domain_data: Mapping[str, Any], domain_field_names: Iterable[str]
+) -> None:
+    domain_data_keys = list(domain_data.keys())
+    domain_types_keys = list(domain_field_names)
+    if set(domain_data_keys) != set(domain_types_keys):
+        raise ValidationError(
+            "The fields provided in `domain` do not match the fields provided"
+            " in `types.EIP712Domain`. The fields provided in `domain` were"
+            f" `{domain_data_keys}`, but the fields provided in "
+            f"`types.EIP712Domain` were `{domain_types_keys}`."
+        )
+
+
+def compile_eip712_types(
+    types: dict[str, list[dict[str, str]]],
+    primary_type: str | None = None,
+) -> CompiledEIP712Types:
+    """
+    Compile EIP-712 message types, for encoding many messages that use them.
+
+    :param types: the custom types, as in ``message_types``, or as in the
+        ``types`` of a ``full_message``, which may include ``EIP712Domain``
+    :param primary_type: the primary type, derived from ``types`` if not given
+    :returns: the compiled types, which can be passed as ``message_types`` or as
+        the ``types`` of a ``full_message``
+    """
+    # copied, since the encoders of large arrays hand them to worker processes
+    message_types = {
+        type_: copy.deepcopy(fields)
+        for type_, fields in types.items()
+        if type_ != "EIP712Domain"
+    }
+    derived_primary_type = get_primary_type(message_types)
+    if primary_type is not None:
+        validate_primary_type(primary_type, derived_primary_type)
+
+    compiled_types: dict[str, CompiledStructType] = {}
+    for type_ in message_types:
+        dependencies = find_type_dependencies(type_, message_types)
+        dependencies.discard(type_)
+        encoded_type = encode_type(type_, message_types)
+        abi_types = ["bytes32"]
+        field_encoders = []
+        for field in message_types[type_]:
+            abi_type, field_encoder = _compile_field(
+                compiled_types, message_types, field["name"], field["type"]
+            )
+            abi_types.append(abi_type)
+            field_encoders.append(field_encoder)
+
+        compiled_types[type_] = CompiledStructType(
+            name=type_,
+            encoded_type=encoded_type,
+            type_hash=bytes(keccak(text=encoded_type)),
+            dependencies=(type_,) + tuple(sorted(dependencies)),
+            field_names=tuple(field["name"] for field in message_types[type_]),
+            abi_types=tuple(abi_types),
+            field_encoders=tuple(field_encoders),
+        )
+
+    return CompiledEIP712Types(
+        primary_type=derived_primary_type,
+        types=MappingProxyType(
+            {
+                type_: tuple((field["name"], field["type"]) for field in fields)
+                for type_, fields in types.items()
+            }
+        ),
+        structs=MappingProxyType(compiled_types),
+    )
+
+
 def hash_eip712_message(
     # returns the same hash as `hash_struct`, but automatically determines primary type
-    message_types: dict[str, list[dict[str, str]]],
+    message_types: dict[str, list[dict[str, str]]] | CompiledEIP712Types,
     message_data: dict[str, Any],
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
 ) -> bytes:
+    """
+    Hash the message as its primary type.
+
+    Pass an empty :class:`~eth_account._utils.caching.LRUCache` as ``memo`` to
+    hash each distinct sub-struct of the message only once; its ``hits`` are the
+    sub-struct hashes that were avoided. Pass a :class:`ParallelArrayHashing` as
+    ``parallel`` to encode the items of large arrays on an executor.
+    """
+    if isinstance(message_types, CompiledEIP712Types):
+        return message_types.hash_struct(message_data, memo=memo, parallel=parallel)
     primary_type = get_primary_type(message_types)
-    return bytes(keccak(encode_data(primary_type, message_types, message_data)))
+    return bytes(
+        keccak(encode_data(primary_type, message_types, message_data, memo, parallel))
+    )
+
+
+# Domain separators, keyed by the normalized domain data (off by default)
+_domain_separator_cache: LRUCache[tuple[Any, ...], bytes] | None = None
+
+
+def set_domain_separator_cache(cache: LRUCache[tuple[Any, ...], bytes] | None) -> None:
+    """
+    Cache domain separators in ``cache``, or stop caching them if it is ``None``.
+    """
+    global _domain_separator_cache
+    _domain_separator_cache = cache
+
+
+def get_domain_separator_cache() -> LRUCache[tuple[Any, ...], bytes] | None:
+    return _domain_separator_cache
+
+
+def domain_separator_cache_key(domain_data: dict[str, Any]) -> tuple[Any, ...] | None:
+    """
+    Return a key for the domain data that does not depend on the order of its
+    fields, or ``None`` if one of its values is not hashable.
+    """
+    # the type is part of the key, so that e.g. True and 1 are cached apart
+    cache_key = tuple(
+        sorted((name, type(value), value) for name, value in domain_data.items())
+    )
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
+def preload_domain_separators(domains: Iterable[dict[str, Any]]) -> None:
+    """
+    Hash each domain and store its separator in the domain separator cache,
+    without counting a miss.
+    """
+    domain_cache = _domain_separator_cache
+    if domain_cache is None:
+        raise ValueError("The domain separator cache is not enabled")
+    for domain_data in domains:
+        cache_key = domain_separator_cache_key(domain_data)
+        if cache_key is None:
+            raise TypeError(f"Domain data must have hashable values, got {domain_data}")
+        domain_cache.put(cache_key, _hash_domain(domain_data))
 
 
 def hash_domain(domain_data: dict[str, Any]) -> bytes:
+    domain_cache = _domain_separator_cache
+    if domain_cache is None:
+        return _hash_domain(domain_data)
+
+    cache_key = domain_separator_cache_key(domain_data)
+    if cache_key is None:
+        return _hash_domain(domain_data)
+    domain_separator = domain_cache.get(cache_key)
+    if domain_separator is None:
+        domain_separator = _hash_domain(domain_data)
+        domain_cache.put(cache_key, domain_separator)
+    return domain_separator
+
+
+def _hash_domain(domain_data: dict[str, Any]) -> bytes:
     eip712_domain_map = {
         "name": {"name": "name", "type": "string"},
         "version": {"name": "version", "type": "string"},
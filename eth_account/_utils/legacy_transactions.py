@@ -97,20 +97,17 @@ def encode_transaction(
     vrs: tuple[int, int, int],
 ) -> bytes:
     (v, r, s) = vrs
-    chain_naive_transaction = dissoc(unsigned_transaction.as_dict(), "v", "r", "s")
     if isinstance(unsigned_transaction, TypedTransaction):
         # Typed transaction have their own encoding format,
-        # so we must delegate the encoding.
-        chain_naive_transaction["v"] = v
-        chain_naive_transaction["r"] = r
-        chain_naive_transaction["s"] = s
-        blob_data = unsigned_transaction.blob_data
-        signed_typed_transaction = TypedTransaction.from_dict(
-            chain_naive_transaction,
-            blobs=[blob.as_bytes() for blob in blob_data.blobs] if blob_data else None,
+        # so we must delegate the encoding. The fields were already validated
+        # and formatted, and any blob sidecar used for hashing is carried over.
+        signed_typed_transaction = TypedTransaction(
+            transaction_type=unsigned_transaction.transaction_type,
+            transaction=unsigned_transaction.transaction.with_signature(v, r, s),
         )
         return signed_typed_transaction.encode()
 
+    chain_naive_transaction = dissoc(unsigned_transaction.as_dict(), "v", "r", "s")
     signed_transaction = Transaction(v=v, r=r, s=s, **chain_naive_transaction)
     # type ignored because pyrlp is not typed
     return rlp.encode(signed_transaction)  # type: ignore[no-any-return]
@@ -0,0 +1,125 @@
+from collections import (
+    deque,
+)
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import (
+    Executor,
+    Future,
+)
+import io
+from typing import (
+    IO,
+    Any,
+    TypeVar,
+)
+
+from eth_typing import (
+    HexStr,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+RawTransactionSource = Iterable[HexStr | bytes | int] | IO[Any]
+
+TItem = TypeVar("TItem")
+TResult = TypeVar("TResult")
+
+
+def _read_exactly(stream: IO[bytes], size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError(
+            f"Truncated RLP stream: expected {size} bytes, got {len(data)}"
+        )
+    return data
+
+
+def iter_rlp_stream(stream: IO[bytes]) -> Iterator[bytes]:
+    """
+    Yield the raw transactions in a stream of RLP-encoded transactions.
+
+    Each transaction is one RLP item, as in the network encoding: legacy
+    transactions are RLP lists and typed transactions are RLP strings wrapping
+    ``type || payload``. Only one transaction is held in memory at a time.
+    """
+    while True:
+        prefix = stream.read(1)
+        if not prefix:
+            return
+        first_byte = prefix[0]
+        if first_byte < 0x80:
+            raise ValueError(f"Unexpected single byte RLP item {prefix!r} in stream")
+        elif first_byte <= 0xB7:
+            # typed transaction, wrapped in a short string
+            yield _read_exactly(stream, first_byte - 0x80)
+        elif first_byte <= 0xBF:
+            # typed transaction, wrapped in a long string
+            length_bytes = _read_exactly(stream, first_byte - 0xB7)
+            yield _read_exactly(stream, int.from_bytes(length_bytes, "big"))
+        elif first_byte <= 0xF7:
+            # legacy transaction, a short list
+            yield prefix + _read_exactly(stream, first_byte - 0xC0)
+        else:
+            # legacy transaction, a long list
+            length_bytes = _read_exactly(stream, first_byte - 0xF7)
+            yield (
+                prefix
+                + length_bytes
+                + _read_exactly(stream, int.from_bytes(length_bytes, "big"))
+            )
+
+
+def iter_hex_lines(lines: Iterable[str]) -> Iterator[bytes]:
+    """
+    Yield the raw transactions in hex-encoded lines, skipping blank lines.
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield bytes(HexBytes(line))
+
+
+def iter_raw_transactions(
+    source: RawTransactionSource,
+) -> Iterator[HexStr | bytes | int]:
+    """
+    Yield the raw transactions in ``source``, lazily.
+
+    :param source: an iterable of raw transactions, a text file with one
+        hex-encoded transaction per line, or a binary file holding a stream of
+        RLP-encoded transactions
+    """
+    if isinstance(source, io.TextIOBase):
+        return iter_hex_lines(source)
+    elif isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+        return iter_rlp_stream(source)  # type: ignore[arg-type]
+    else:
+        return iter(source)
+
+
+def map_with_backpressure(
+    executor: Executor,
+    func: Callable[[TItem], TResult],
+    items: Iterable[TItem],
+    max_pending: int,
+) -> Iterator[TResult]:
+    """
+    Like ``executor.map``, but only reads ``items`` as results are consumed.
+
+    At most ``max_pending`` items are submitted ahead of the result being
+    waited on, and results are yielded in input order.
+    """
+    if max_pending < 1:
+        raise ValueError(f"max_pending must be a positive integer, got {max_pending}")
+    pending: deque[Future[TResult]] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
@@ -1,18 +1,49 @@
+from collections.abc import (
+    Mapping,
+)
 from typing import (
+    Any,
     cast,
 )
 
+from eth_keys import (
+    KeyAPI,
+)
 from eth_keys.datatypes import (
     PrivateKey,
+    PublicKey,
+    Signature,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+from eth_typing import (
+    ChecksumAddress,
+    HexStr,
 )
 from eth_utils import (
+    hexstr_if_str,
+    keccak,
     to_bytes,
+    to_canonical_address,
     to_int,
 )
 from eth_utils.toolz import (
     pipe,
 )
+from hexbytes import (
+    HexBytes,
+)
+import rlp
 
+from eth_account._utils.caching import (
+    LRUCache,
+)
+from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
+    StructHashMemo,
+)
 from eth_account._utils.legacy_transactions import (
     ChainAwareUnsignedTransaction,
     Transaction,
@@ -21,9 +52,21 @@ from eth_account._utils.legacy_transactions import (
     serializable_unsigned_transaction_from_dict,
     strip_signature,
 )
+from eth_account.datastructures import (
+    CompactSignedAuthorization,
+    CompactSignedMessage,
+    SignedSetCodeAuthorization,
+)
 from eth_account.typed_transactions import (
+    AccessListTransaction,
+    BlobTransaction,
+    DynamicFeeTransaction,
+    SetCodeTransaction,
     TypedTransaction,
 )
+from eth_account.typed_transactions.set_code_transaction import (
+    Authorization,
+)
 from eth_account.types import (
     Blobs,
     Bytes32,
@@ -38,6 +81,16 @@ PERSONAL_SIGN_VERSION = b"E"  # Hex value 0x45
 INTENDED_VALIDATOR_SIGN_VERSION = b"\x00"  # Hex value 0x00
 STRUCTURED_DATA_SIGN_VERSION = b"\x01"  # Hex value 0x01
 
+_TYPED_TRANSACTION_CLASSES = {
+    transaction_class.transaction_type: transaction_class
+    for transaction_class in (
+        AccessListTransaction,
+        DynamicFeeTransaction,
+        BlobTransaction,
+        SetCodeTransaction,
+    )
+}
+
 
 def sign_transaction_dict(
     eth_key: PrivateKey,
@@ -74,6 +127,232 @@ def sign_transaction_dict(
     return (v, r, s, encoded_transaction)
 
 
+# Recovered signers, keyed by message hash and canonical signature (off by default)
+_recovery_cache: LRUCache[tuple[bytes, bytes], ChecksumAddress] | None = None
+
+
+def set_recovery_cache(
+    cache: LRUCache[tuple[bytes, bytes], ChecksumAddress] | None
+) -> None:
+    """
+    Cache recovered signers in ``cache``, or stop caching them if it is ``None``.
+    """
+    global _recovery_cache
+    _recovery_cache = cache
+
+
+def get_recovery_cache() -> LRUCache[tuple[bytes, bytes], ChecksumAddress] | None:
+    return _recovery_cache
+
+
+def recover_signer(
+    keys: KeyAPI, message_hash: bytes, signature: Signature
+) -> ChecksumAddress:
+    """
+    Recover the checksummed address that produced ``signature`` over the 32-byte
+    ``message_hash``.
+    """
+    recovery_cache = _recovery_cache
+    if recovery_cache is not None:
+        cache_key = (bytes(message_hash), signature.to_bytes())
+        cached_address = recovery_cache.get(cache_key)
+        if cached_address is not None:
+            return cached_address
+
+    address = keys.ecdsa_recover(message_hash, signature).to_checksum_address()
+
+    if recovery_cache is not None:
+        recovery_cache.put(cache_key, address)
+    return address
+
+
+def signed_transaction_hash_and_vrs(
+    txn_bytes: bytes,
+) -> tuple[Bytes32, tuple[int, int, int]]:
+    """
+    Decode a signed transaction into the hash that was signed, and its signature
+    with a standard ``v`` of 0 or 1.
+    """
+    if len(txn_bytes) > 0 and txn_bytes[0] <= 0x7F:
+        # We are dealing with a typed transaction.
+        return typed_transaction_hash_and_vrs(txn_bytes)
+
+    txn = Transaction.from_bytes(txn_bytes)
+    return hash_of_signed_transaction(txn), (to_standard_v(txn.v), txn.r, txn.s)
+
+
+def _decode_signed_typed_transaction(
+    transaction_class: Any, transaction_payload: bytes
+) -> Any:
+    """
+    Decode a signed typed transaction payload with the signed RLP sedes of its
+    class, so its fields are validated as in ``TypedTransaction.from_bytes``.
+    """
+    if transaction_class is BlobTransaction:
+        # [tx_payload_body, (wrapper_version,) blobs, commitments, proofs]
+        for pooled_serializer in (
+            BlobTransaction._signed_pooled_transaction_serializer,
+            BlobTransaction._legacy_signed_pooled_transaction_serializer,
+        ):
+            try:
+                return rlp.decode(
+                    transaction_payload, sedes=pooled_serializer
+                ).tx_payload_body
+            except rlp.exceptions.ObjectDeserializationError:
+                pass
+    return rlp.decode(
+        transaction_payload, sedes=transaction_class._signed_transaction_serializer
+    )
+
+
+def typed_transaction_hash_and_vrs(
+    txn_bytes: bytes,
+) -> tuple[Bytes32, tuple[int, int, int]]:
+    """
+    Get the signing hash and standard signature of a signed typed transaction
+    straight from its RLP payload, without building a TypedTransaction.
+
+    The payload is decoded with the signed sedes of the transaction class, so
+    malformed fields raise ``rlp.exceptions.DeserializationError`` as they do in
+    ``TypedTransaction.from_bytes``. The signing hash is
+    ``keccak(type || rlp(payload_items[:-3]))``: the signed payload without its
+    ``yParity``, ``r`` and ``s`` items. Blob transactions in their pooled network
+    form are hashed from their ``tx_payload_body``.
+    """
+    transaction_type = txn_bytes[0]
+    transaction_class = _TYPED_TRANSACTION_CLASSES.get(transaction_type)
+    if transaction_class is None:
+        raise TypeError(f"typed transaction has unknown type: {transaction_type}")
+
+    signed = _decode_signed_typed_transaction(transaction_class, txn_bytes[1:])
+    unsigned = transaction_class._unsigned_transaction_serializer(*signed[:-3])
+    signing_hash = keccak(bytes([transaction_type]) + rlp.encode(unsigned))
+    return signing_hash, (to_standard_v(signed.v), signed.r, signed.s)
+
+
+def recover_transaction_sender(
+    keys: KeyAPI, serialized_transaction: HexStr | bytes | int
+) -> ChecksumAddress:
+    if isinstance(serialized_transaction, bytes):
+        txn_bytes = serialized_transaction
+    else:
+        txn_bytes = HexBytes(serialized_transaction)
+    msg_hash, vrs = signed_transaction_hash_and_vrs(txn_bytes)
+    return recover_signer(keys, msg_hash, keys.Signature(vrs=vrs))
+
+
+def recover_transaction_chunk(
+    keys: KeyAPI, serialized_transactions: list[HexStr | bytes | int]
+) -> list[tuple[ChecksumAddress, bytes]]:
+    """
+    Recover the sender and transaction hash of each transaction in a chunk.
+    """
+    recovered = []
+    for serialized_transaction in serialized_transactions:
+        if isinstance(serialized_transaction, bytes):
+            txn_bytes = serialized_transaction
+        else:
+            txn_bytes = HexBytes(serialized_transaction)
+        sender = recover_transaction_sender(keys, txn_bytes)
+        recovered.append((sender, keccak(txn_bytes)))
+    return recovered
+
+
+def signature_from_bytes(keys: KeyAPI, signature: HexStr | bytes | int) -> Signature:
+    """
+    Build a signature object from 65 signature bytes, with any ``v``.
+    """
+    if isinstance(signature, bytes):
+        signature_bytes = signature
+    else:
+        signature_bytes = HexBytes(signature)
+    return keys.Signature(signature_bytes=to_standard_signature_bytes(signature_bytes))
+
+
+def recover_message_signer(
+    keys: KeyAPI, message_hash: bytes, signature: HexStr | bytes | int
+) -> ChecksumAddress:
+    return recover_signer(keys, message_hash, signature_from_bytes(keys, signature))
+
+
+def verify_signer(
+    keys: KeyAPI,
+    message_hash: bytes,
+    signature: Signature,
+    expected_signer: bytes | PublicKey,
+) -> bool:
+    """
+    Check that ``signature`` over ``message_hash`` was made by ``expected_signer``,
+    given as a canonical 20-byte address or as a public key.
+
+    With a public key, the signature is verified without recovering the signer.
+    """
+    if isinstance(expected_signer, PublicKey):
+        return keys.ecdsa_verify(message_hash, signature, expected_signer)
+    try:
+        public_key = keys.ecdsa_recover(message_hash, signature)
+    except BadSignature:
+        return False
+    return public_key.to_canonical_address() == expected_signer
+
+
+def hash_authorization(chain_id: int, code_address: bytes, nonce: int) -> bytes:
+    """
+    Hash an EIP-7702 authorization, like
+    :meth:`~eth_account.typed_transactions.set_code_transaction.Authorization.hash`
+    does, without wrapping the hash in ``HexBytes``.
+
+    The fields are encoded with the ``Authorization`` sedes, so invalid values
+    raise the same ``rlp.exceptions.SerializationError`` as ``sign_authorization``.
+    """
+    return keccak(
+        bytes([Authorization.magic])
+        + rlp.encode(Authorization(chain_id, code_address, nonce))
+    )
+
+
+def sign_authorization_with_key(
+    key: PrivateKey, authorization_dict: Mapping[str, Any]
+) -> CompactSignedAuthorization:
+    if not isinstance(authorization_dict, Mapping):
+        raise TypeError(
+            f"authorization_dict must be dict-like, got {repr(authorization_dict)}"
+        )
+    chain_id = authorization_dict["chainId"]
+    code_address = to_canonical_address(authorization_dict["address"])
+    nonce = authorization_dict["nonce"]
+
+    authorization_hash = hash_authorization(chain_id, code_address, nonce)
+    (v, r, s) = key.sign_msg_hash(authorization_hash).vrs
+    return CompactSignedAuthorization(chain_id, code_address, nonce, v, r, s)
+
+
+def recover_authority(
+    keys: KeyAPI,
+    authorization: SignedSetCodeAuthorization
+    | CompactSignedAuthorization
+    | Mapping[str, Any],
+) -> bytes:
+    """
+    Recover the canonical address of the authority that signed an EIP-7702
+    authorization, given as a signed authorization or as its JSON-RPC dict.
+    """
+    if isinstance(authorization, SignedSetCodeAuthorization):
+        return authorization.authority
+    elif isinstance(authorization, CompactSignedAuthorization):
+        chain_id, code_address, nonce, y_parity, r, s = authorization
+    else:
+        chain_id, nonce, y_parity, r, s = (
+            hexstr_if_str(to_int, authorization[field])
+            for field in ("chainId", "nonce", "yParity", "r", "s")
+        )
+        code_address = to_canonical_address(authorization["address"])
+
+    authorization_hash = hash_authorization(chain_id, code_address, nonce)
+    signature = keys.Signature(vrs=(y_parity, r, s))
+    return keys.ecdsa_recover(authorization_hash, signature).to_canonical_address()
+
+
 def hash_of_signed_transaction(txn_obj: Transaction) -> Bytes32:
     """
     Regenerate the hash of the signed transaction object.
@@ -173,3 +452,23 @@ def sign_message_hash(
     v = to_eth_v(v_raw)
     eth_signature_bytes = to_bytes32(r) + to_bytes32(s) + to_bytes(v)
     return (v, r, s, eth_signature_bytes)
+
+
+def sign_typed_data_with_key(
+    key: PrivateKey,
+    compiled_types: CompiledEIP712Types,
+    domain_separator: bytes,
+    message_data: Mapping[str, Any],
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
+) -> CompactSignedMessage:
+    """
+    Sign an EIP-712 message, given its precompiled types and domain separator.
+    """
+    struct_hash = compiled_types.hash_struct(message_data, memo=memo, parallel=parallel)
+    # 0x19 || 0x01 || domainSeparator || hashStruct(message)
+    message_hash = keccak(
+        b"\x19" + STRUCTURED_DATA_SIGN_VERSION + domain_separator + struct_hash
+    )
+    (v, r, s, eth_signature_bytes) = sign_message_hash(key, message_hash)
+    return CompactSignedMessage(message_hash, r, s, v, eth_signature_bytes)
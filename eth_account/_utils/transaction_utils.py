@@ -16,6 +16,9 @@ from eth_account._utils.validation import (
     is_rpc_structured_access_list,
     is_rpc_structured_authorization_list,
 )
+from eth_account.datastructures import (
+    CompactSignedAuthorization,
+)
 from eth_account.types import (
     AccessList,
     AuthorizationList,
@@ -81,9 +84,13 @@ def json_serialize_classes_in_transaction(val: Any) -> Any:
                                 into lowerCamelCase dicts.
     - ``exclude=val._exclude:   Fields excluded for serialization are defined within a
                                 ``_exclude`` property on the pydantic model.
+
+    Compact signed authorizations are serialized with their ``as_dict`` method.
     """
     if isinstance(val, CamelModel):
         return val.model_dump(by_alias=True)
+    elif isinstance(val, CompactSignedAuthorization):
+        return val.as_dict()
     elif isinstance(val, dict):
         return {k: json_serialize_classes_in_transaction(v) for k, v in val.items()}
     elif isinstance(val, (list, tuple)):
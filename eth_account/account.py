@@ -1,9 +1,17 @@
 from collections.abc import (
+    Iterable,
+    Iterator,
     Mapping,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
 )
 from copy import (
     copy,
 )
+import functools
+import itertools
 import json
 import os
 from typing import (
@@ -29,6 +37,7 @@ from eth_keys.backends import (
 )
 from eth_keys.datatypes import (
     PrivateKey,
+    PublicKey,
 )
 from eth_keys.exceptions import (
     ValidationError,
@@ -57,16 +66,39 @@ from hexbytes import (
     HexBytes,
 )
 
-from eth_account._utils.legacy_transactions import (
-    Transaction,
-    vrs_from,
+from eth_account._utils.caching import (
+    CacheInfo,
+    LRUCache,
+)
+from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+    get_domain_separator_cache,
+    hash_domain,
+    preload_domain_separators,
+    set_domain_separator_cache,
+    validate_domain_fields,
+    validate_primary_type,
+)
+from eth_account._utils.raw_transactions import (
+    RawTransactionSource,
+    iter_raw_transactions,
+    map_with_backpressure,
 )
 from eth_account._utils.signing import (
-    hash_of_signed_transaction,
+    get_recovery_cache,
+    recover_authority,
+    recover_message_signer,
+    recover_signer,
+    recover_transaction_chunk,
+    recover_transaction_sender,
+    set_recovery_cache,
+    sign_authorization_with_key,
     sign_message_hash,
     sign_transaction_dict,
+    sign_typed_data_with_key,
+    signature_from_bytes,
     to_standard_signature_bytes,
     to_standard_v,
+    verify_signer,
 )
 from eth_account._utils.validation import (
     validate_and_set_default_kdf,
@@ -75,6 +107,9 @@ from eth_account.account_local_actions import (
     AccountLocalActions,
 )
 from eth_account.datastructures import (
+    CompactSignedAuthorization,
+    CompactSignedMessage,
+    CompactSignedTransaction,
     SignedMessage,
     SignedSetCodeAuthorization,
     SignedTransaction,
@@ -86,16 +121,17 @@ from eth_account.hdaccount import (
     seed_from_mnemonic,
 )
 from eth_account.messages import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
     SignableMessage,
+    StructHashMemo,
     _hash_eip191_message,
+    compile_eip712_types,
     encode_typed_data,
 )
 from eth_account.signers.local import (
     LocalAccount,
 )
-from eth_account.typed_transactions import (
-    TypedTransaction,
-)
 from eth_account.typed_transactions.set_code_transaction import (
     Authorization,
 )
@@ -110,6 +146,14 @@ from eth_account.types import (
 VRS = TypeVar("VRS", bytes, HexStr, int)
 
 
+def _canonical_signer(
+    expected_signer: ChecksumAddress | bytes | PublicKey,
+) -> bytes | PublicKey:
+    if isinstance(expected_signer, PublicKey):
+        return expected_signer
+    return to_canonical_address(expected_signer)
+
+
 class Account(AccountLocalActions):
     """
     The primary entry point for working with Ethereum private keys.
@@ -124,6 +168,9 @@ class Account(AccountLocalActions):
 
     _default_kdf: KDFType = validate_and_set_default_kdf()
 
+    # Parsed private keys, keyed by raw key bytes and key API (off by default)
+    _key_cache: LRUCache[tuple[bytes, Any], PrivateKey] | None = None
+
     @classmethod
     def enable_unaudited_hdwallet_features(cls) -> None:
         """
@@ -131,6 +178,109 @@ class Account(AccountLocalActions):
         """
         cls._use_unaudited_hdwallet_features = True
 
+    @classmethod
+    def enable_key_cache(cls, maxsize: int = 128) -> None:
+        """
+        Keep up to ``maxsize`` parsed private keys in memory, so that signing
+        repeatedly with the same raw key does not derive its public key on every
+        call.
+
+        .. WARNING:: Cached private keys stay in memory until they are evicted or
+            :meth:`disable_key_cache` is called.
+
+        :param int maxsize: the maximum number of private keys to keep
+        """
+        cls._key_cache = LRUCache(maxsize)
+
+    @classmethod
+    def disable_key_cache(cls) -> None:
+        """
+        Stop caching parsed private keys and drop the cached ones.
+        """
+        if cls._key_cache is not None:
+            cls._key_cache.clear()
+        cls._key_cache = None
+
+    @classmethod
+    def enable_recovery_cache(cls, maxsize: int = 1024) -> None:
+        """
+        Remember up to ``maxsize`` recovered signers, keyed by the 32-byte signed
+        hash and the 65-byte signature, so that recovering the same signed
+        message or transaction again skips the public key recovery.
+
+        This applies to every recovery method, in this process.
+
+        :param int maxsize: the maximum number of signers to remember
+        """
+        set_recovery_cache(LRUCache(maxsize))
+
+    @classmethod
+    def disable_recovery_cache(cls) -> None:
+        """
+        Stop caching recovered signers and drop the cached ones.
+        """
+        recovery_cache = get_recovery_cache()
+        if recovery_cache is not None:
+            recovery_cache.clear()
+        set_recovery_cache(None)
+
+    @classmethod
+    def recovery_cache_info(cls) -> CacheInfo | None:
+        """
+        Get the hit and miss statistics of the recovery cache.
+
+        :returns: the statistics, or ``None`` if the cache is disabled
+        """
+        recovery_cache = get_recovery_cache()
+        if recovery_cache is None:
+            return None
+        return recovery_cache.cache_info()
+
+    @classmethod
+    def enable_domain_separator_cache(
+        cls,
+        maxsize: int = 64,
+        domains: Iterable[dict[str, Any]] = (),
+    ) -> None:
+        """
+        Remember up to ``maxsize`` EIP-712 domain separators, keyed by the domain
+        data, so that encoding or signing more messages for the same domain skips
+        hashing it again.
+
+        This applies to :meth:`~eth_account.account.Account.sign_typed_data`,
+        :meth:`~eth_account.messages.encode_typed_data` and everything built on
+        them, in this process.
+
+        :param int maxsize: the maximum number of domain separators to remember
+        :param domains: domain data to hash and cache right away, e.g. the domains
+            known at startup
+        :type domains: iterable of dict
+        """
+        set_domain_separator_cache(LRUCache(maxsize))
+        preload_domain_separators(domains)
+
+    @classmethod
+    def disable_domain_separator_cache(cls) -> None:
+        """
+        Stop caching EIP-712 domain separators and drop the cached ones.
+        """
+        domain_separator_cache = get_domain_separator_cache()
+        if domain_separator_cache is not None:
+            domain_separator_cache.clear()
+        set_domain_separator_cache(None)
+
+    @classmethod
+    def domain_separator_cache_info(cls) -> CacheInfo | None:
+        """
+        Get the hit and miss statistics of the domain separator cache.
+
+        :returns: the statistics, or ``None`` if the cache is disabled
+        """
+        domain_separator_cache = get_domain_separator_cache()
+        if domain_separator_cache is None:
+            return None
+        return domain_separator_cache.cache_info()
+
     @combomethod
     def create(self, extra_entropy: str | bytes | int = "") -> LocalAccount:
         r"""
@@ -508,6 +658,240 @@ class Account(AccountLocalActions):
         message_hash = _hash_eip191_message(signable_message)
         return cast(ChecksumAddress, self._recover_hash(message_hash, vrs, signature))
 
+    @combomethod
+    def iter_recover_transactions(
+        self,
+        source: RawTransactionSource,
+        executor: Executor | None = None,
+        chunksize: int = 256,
+        max_pending_chunks: int = 4,
+    ) -> Iterator[tuple[int, ChecksumAddress, HexBytes]]:
+        """
+        Lazily recover the sender and hash of every transaction in ``source``.
+
+        Transactions are read, and results produced, a chunk at a time, so memory
+        use does not grow with the number of transactions.
+
+        :param source: an iterable of raw transactions, a text file with one
+            hex-encoded transaction per line, or a binary file holding a stream of
+            RLP-encoded transactions (legacy transactions as RLP lists, typed
+            transactions as RLP strings)
+        :param executor: optional executor to spread the recovery over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many transactions to send to a worker at once
+        :param int max_pending_chunks: how many chunks may be in flight on the
+            executor at once
+        :returns: ``(index, sender, transaction_hash)`` for each transaction, in
+            order
+
+        .. code-block:: python
+
+            >>> with open("transactions.txt") as hex_lines:
+            ...     for index, sender, tx_hash in Account.iter_recover_transactions(
+            ...         hex_lines
+            ...     ):
+            ...         ...
+        """
+        transactions = iter_raw_transactions(source)
+        chunks = iter(lambda: list(itertools.islice(transactions, chunksize)), [])
+        recover_chunk = functools.partial(recover_transaction_chunk, self._keys)
+
+        if executor is None:
+            results = itertools.chain.from_iterable(map(recover_chunk, chunks))
+        else:
+            results = itertools.chain.from_iterable(
+                map_with_backpressure(
+                    executor, recover_chunk, chunks, max_pending_chunks
+                )
+            )
+        for index, (sender, transaction_hash) in enumerate(results):
+            yield index, sender, HexBytes(transaction_hash)
+
+    @combomethod
+    def recover_authorities(
+        self,
+        authorization_list: Iterable[
+            SignedSetCodeAuthorization | CompactSignedAuthorization | dict[str, Any]
+        ],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[bytes]:
+        """
+        Get the authorities that signed each EIP-7702 authorization, in order.
+
+        :param authorization_list: the signed authorizations, as returned by
+            :meth:`~eth_account.account.Account.sign_authorization` or
+            :meth:`~eth_account.account.Account.sign_authorizations`, or as JSON-RPC
+            dicts with ``chainId``, ``address``, ``nonce``, ``yParity``, ``r`` and
+            ``s``
+        :param executor: optional executor to spread the recovery over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many authorizations to send to a process pool
+            worker at once
+        :returns: the canonical address of each authority
+        :rtype: list(bytes)
+        """
+        recover = functools.partial(recover_authority, self._keys)
+        if executor is None:
+            return list(map(recover, authorization_list))
+        return list(executor.map(recover, authorization_list, chunksize=chunksize))
+
+    @combomethod
+    def recover_messages(
+        self,
+        signable_messages: Iterable[SignableMessage],
+        signatures: Iterable[HexStr | bytes | int],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[ChecksumAddress]:
+        r"""
+        Get the addresses of the accounts that signed many messages.
+
+        Equivalent to calling :meth:`~eth_account.account.Account.recover_message`
+        with ``signature`` on each message, in order.
+
+        :param signable_messages: the messages that were signed
+        :type signable_messages: iterable of :class:`~eth_account.messages.SignableMessage`
+        :param signatures: the signature of each message, in the same order
+        :type signatures: iterable of hex str, bytes or int
+        :param executor: optional executor to spread the recovery over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many messages to send to a process pool worker
+            at once
+        :returns: the addresses of the signers, hex-encoded & checksummed
+        :rtype: list(ChecksumAddress)
+        """  # noqa: E501
+        message_hashes = []
+        signature_list = []
+        for signable_message, signature in itertools.zip_longest(
+            signable_messages, signatures, fillvalue=None
+        ):
+            if signable_message is None or signature is None:
+                raise ValueError("Each message needs exactly one signature")
+            message_hashes.append(_hash_eip191_message(signable_message))
+            signature_list.append(signature)
+
+        recover = functools.partial(recover_message_signer, self._keys)
+        if executor is None:
+            return list(map(recover, message_hashes, signature_list))
+        return list(
+            executor.map(recover, message_hashes, signature_list, chunksize=chunksize)
+        )
+
+    @combomethod
+    def verify_hash(
+        self,
+        message_hash: Hash32,
+        signature: HexStr | bytes | int,
+        expected_signer: ChecksumAddress | bytes | PublicKey,
+    ) -> bool:
+        """
+        Check that the hash was signed by ``expected_signer``.
+
+        The recovered address is compared as 20 raw bytes, without checksum
+        formatting. Given the signer's public key instead of its address, the
+        signature is verified directly, without recovering the signer.
+
+        :param message_hash: the 32-byte hash that was signed
+        :type message_hash: hex str, bytes or int
+        :param signature: the 65-byte signature, with any ``v``
+        :type signature: hex str, bytes or int
+        :param expected_signer: the address, or the public key, of the expected signer
+        :type expected_signer: hex str, bytes or :class:`eth_keys.datatypes.PublicKey`
+        :returns: whether ``expected_signer`` made the signature
+        :rtype: bool
+        """
+        hash_bytes = HexBytes(message_hash)
+        if len(hash_bytes) != 32:
+            raise ValueError("The message hash must be exactly 32-bytes")
+        return verify_signer(
+            self._keys,
+            hash_bytes,
+            signature_from_bytes(self._keys, signature),
+            _canonical_signer(expected_signer),
+        )
+
+    @combomethod
+    def verify_message(
+        self,
+        signable_message: SignableMessage,
+        signature: HexStr | bytes | int,
+        expected_signer: ChecksumAddress | bytes | PublicKey,
+    ) -> bool:
+        r"""
+        Check that the message was signed by ``expected_signer``.
+
+        This is cheaper than comparing the result of
+        :meth:`~eth_account.account.Account.recover_message`, see
+        :meth:`~eth_account.account.Account.verify_hash`.
+
+        :param signable_message: the message that was signed
+        :type signable_message: :class:`~eth_account.messages.SignableMessage`
+        :param signature: the 65-byte signature, with any ``v``
+        :type signature: hex str, bytes or int
+        :param expected_signer: the address, or the public key, of the expected signer
+        :type expected_signer: hex str, bytes or :class:`eth_keys.datatypes.PublicKey`
+        :returns: whether ``expected_signer`` signed the message
+        :rtype: bool
+
+        .. doctest:: python
+
+            >>> from eth_account.messages import encode_defunct
+            >>> from eth_account import Account
+            >>> message = encode_defunct(text="I♥SF")
+            >>> signature = '0xe6ca9bba58c88611fad66a6ce8f996908195593807c4b38bd528d2cff09d4eb33e5bfbbf4d3e39b1a2fd816a7680c19ebebaf3a141b239934ad43cb33fcec8ce1c'
+            >>> Account.verify_message(message, signature, '0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E')
+            True
+        """  # noqa: E501
+        return verify_signer(
+            self._keys,
+            _hash_eip191_message(signable_message),
+            signature_from_bytes(self._keys, signature),
+            _canonical_signer(expected_signer),
+        )
+
+    @combomethod
+    def verify_messages(
+        self,
+        signable_messages: Iterable[SignableMessage],
+        signatures: Iterable[HexStr | bytes | int],
+        expected_signer: ChecksumAddress | bytes | PublicKey,
+    ) -> list[bool]:
+        r"""
+        Check that each message was signed by ``expected_signer``, in order.
+
+        Equivalent to calling :meth:`~eth_account.account.Account.verify_message`
+        on each message, with ``expected_signer`` only parsed once.
+
+        :param signable_messages: the messages that were signed
+        :type signable_messages: iterable of :class:`~eth_account.messages.SignableMessage`
+        :param signatures: the signature of each message, in the same order
+        :type signatures: iterable of hex str, bytes or int
+        :param expected_signer: the address, or the public key, of the expected signer
+        :type expected_signer: hex str, bytes or :class:`eth_keys.datatypes.PublicKey`
+        :returns: whether ``expected_signer`` signed each message
+        :rtype: list(bool)
+        """  # noqa: E501
+        signer = _canonical_signer(expected_signer)
+        verified = []
+        for signable_message, signature in itertools.zip_longest(
+            signable_messages, signatures, fillvalue=None
+        ):
+            if signable_message is None or signature is None:
+                raise ValueError("Each message needs exactly one signature")
+            verified.append(
+                verify_signer(
+                    self._keys,
+                    _hash_eip191_message(signable_message),
+                    signature_from_bytes(self._keys, signature),
+                    signer,
+                )
+            )
+        return verified
+
     @combomethod
     def _recover_hash(
         self,
@@ -530,8 +914,7 @@ class Account(AccountLocalActions):
             )
         else:
             raise TypeError("You must supply the vrs tuple or the signature bytes")
-        pubkey = signature_obj.recover_public_key_from_msg_hash(hash_bytes)
-        return pubkey.to_checksum_address()
+        return recover_signer(self._keys, hash_bytes, signature_obj)
 
     @combomethod
     def recover_transaction(
@@ -551,17 +934,42 @@ class Account(AccountLocalActions):
             >>> Account.recover_transaction(raw_transaction)
             '0x2c7536E3605D9C16a7a3D7b1898e529396a65c23'
         """  # noqa: E501
-        txn_bytes = HexBytes(serialized_transaction)
-        if len(txn_bytes) > 0 and txn_bytes[0] <= 0x7F:
-            # We are dealing with a typed transaction.
-            typed_transaction = TypedTransaction.from_bytes(txn_bytes)
-            msg_hash = typed_transaction.hash()
-            vrs = typed_transaction.vrs()
-            return cast(ChecksumAddress, self._recover_hash(msg_hash, vrs=vrs))
-
-        txn = Transaction.from_bytes(txn_bytes)
-        msg_hash = hash_of_signed_transaction(txn)
-        return cast(ChecksumAddress, self._recover_hash(msg_hash, vrs=vrs_from(txn)))
+        return recover_transaction_sender(self._keys, serialized_transaction)
+
+    @combomethod
+    def recover_transactions(
+        self,
+        serialized_transactions: Iterable[HexStr | bytes | int],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[ChecksumAddress]:
+        """
+        Get the addresses of the accounts that signed many transactions.
+
+        Equivalent to calling
+        :meth:`~eth_account.account.Account.recover_transaction` on each
+        transaction, in order. Raw ``bytes`` transactions are decoded as is.
+
+        :param serialized_transactions: the complete signed transactions
+        :type serialized_transactions: iterable of hex str, bytes or int
+        :param executor: optional executor to spread the recovery over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many transactions to send to a process pool
+            worker at once
+        :returns: the addresses of the signers, hex-encoded & checksummed
+        :rtype: list(ChecksumAddress)
+
+        .. doctest:: python
+
+            >>> raw_transaction = '0xf86a8086d55698372431831e848094f0109fc8df283027b6285cc889f5aa624eac1f55843b9aca008025a009ebb6ca057a0535d6186462bc0b465b561c94a295bdb0621fc19208ab149a9ca0440ffd775ce91a833ab410777204d5341a6f9fa91216a6f3ee2c051fea6a0428'
+            >>> Account.recover_transactions([raw_transaction, raw_transaction])
+            ['0x2c7536E3605D9C16a7a3D7b1898e529396a65c23', '0x2c7536E3605D9C16a7a3D7b1898e529396a65c23']
+        """  # noqa: E501
+        recover = functools.partial(recover_transaction_sender, self._keys)
+        if executor is None:
+            return list(map(recover, serialized_transactions))
+        return list(executor.map(recover, serialized_transactions, chunksize=chunksize))
 
     def set_key_backend(self, backend: CoinCurveECCBackend | NativeECCBackend) -> None:
         """
@@ -649,6 +1057,61 @@ class Account(AccountLocalActions):
         """
         return cast(SignedMessage, self._sign_hash(message_hash, private_key))
 
+    @combomethod
+    def sign_messages(
+        self,
+        signable_messages: Iterable[SignableMessage],
+        private_key: PrivateKeyType,
+        compact: bool = False,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        r"""
+        Sign many messages with the same private key, in order.
+
+        Each message is signed exactly like
+        :meth:`~eth_account.account.Account.sign_message` would, but the private
+        key is parsed only once for the whole batch.
+
+        :param signable_messages: the encoded messages for signing
+        :type signable_messages: iterable of :class:`~eth_account.messages.SignableMessage`
+        :param private_key: the key to sign the messages with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param bool compact: return
+            :class:`~eth_account.datastructures.CompactSignedMessage` tuples of
+            plain bytes, which are cheaper to build, instead of
+            :class:`~eth_account.datastructures.SignedMessage`
+        :returns: the signed messages, in the same order as ``signable_messages``
+        :rtype: list(SignedMessage) or list(CompactSignedMessage)
+
+        .. doctest:: python
+
+            >>> from eth_account.messages import encode_defunct
+            >>> messages = [encode_defunct(text=text) for text in ("I♥SF", "I♥NY")]
+            >>> key = "0xb25c7db31feed9122727bf0939dc769a96564b2de4c4726d035b36ecf1e5b364"
+            >>> signed = Account.sign_messages(messages, key, compact=True)
+            >>> signed[0].to_signed_message() == Account.sign_message(messages[0], key)
+            True
+        """  # noqa: E501
+        key = self._parse_private_key(private_key)
+        signed_messages: list[Any] = []
+        for signable_message in signable_messages:
+            message_hash = _hash_eip191_message(signable_message)
+            (v, r, s, eth_signature_bytes) = sign_message_hash(key, message_hash)
+            if compact:
+                signed_messages.append(
+                    CompactSignedMessage(message_hash, r, s, v, eth_signature_bytes)
+                )
+            else:
+                signed_messages.append(
+                    SignedMessage(
+                        message_hash=HexBytes(message_hash),
+                        r=r,
+                        s=s,
+                        v=v,
+                        signature=HexBytes(eth_signature_bytes),
+                    )
+                )
+        return signed_messages
+
     @combomethod
     def _sign_hash(
         self,
@@ -697,7 +1160,8 @@ class Account(AccountLocalActions):
         :param private_key: the private key to sign the data with
         :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
         :param blobs: optional list of blobs to sign in addition to the transaction
-        :type blobs: list of bytes or HexBytes
+        :type blobs: list of bytes, HexBytes, bytearray, memoryview, mmap, or
+          paths (``os.PathLike``) to files holding the raw blob
         :returns: Various details about the signature - most
           importantly the fields: v, r, and s
         :rtype: SignedTransaction
@@ -825,16 +1289,92 @@ class Account(AccountLocalActions):
              v=1)
             >>> w3.eth.send_raw_transaction(signed_blob_tx.raw_transaction)  # doctest: +SKIP
         """  # noqa: E501
+        key = self._parse_private_key(private_key)
+        return cast(
+            SignedTransaction,
+            self._sign_transaction_with_key(key, transaction_dict, blobs=blobs),
+        )
+
+    @combomethod
+    def sign_transactions(
+        self,
+        transaction_dicts: Iterable[TransactionDictType],
+        private_key: PrivateKeyType,
+        compact: bool = False,
+    ) -> list[SignedTransaction] | list[CompactSignedTransaction]:
+        r"""
+        Sign many transactions with the same private key, in order.
+
+        Each transaction is signed exactly like
+        :meth:`~eth_account.account.Account.sign_transaction` would, but the
+        private key is parsed, and its address derived, only once for the whole
+        batch. Blob transactions that need ``blobs`` must be signed with
+        :meth:`~eth_account.account.Account.sign_transaction`.
+
+        :param transaction_dicts: the transactions to sign, e.g. with consecutive
+            nonces
+        :type transaction_dicts: iterable of dict
+        :param private_key: the private key to sign the data with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param bool compact: return
+            :class:`~eth_account.datastructures.CompactSignedTransaction` tuples of
+            plain bytes, which are cheaper to build, instead of
+            :class:`~eth_account.datastructures.SignedTransaction`
+        :returns: the signed transactions, in the same order as ``transaction_dicts``
+        :rtype: list(SignedTransaction) or list(CompactSignedTransaction)
+
+        .. doctest:: python
+
+            >>> from eth_account import Account
+            >>> transactions = [
+            ...     {
+            ...         "to": "0x09616C3d61b3331fc4109a9E41a8BDB7d9776609",
+            ...         "value": 1,
+            ...         "gas": 21000,
+            ...         "maxFeePerGas": 2000000000,
+            ...         "maxPriorityFeePerGas": 2000000000,
+            ...         "nonce": nonce,
+            ...         "chainId": 1337,
+            ...     }
+            ...     for nonce in range(3)
+            ... ]
+            >>> key = '0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318'
+            >>> signed_txs = Account.sign_transactions(transactions, key)
+            >>> signed_txs == [Account.sign_transaction(tx, key) for tx in transactions]
+            True
+        """  # noqa: E501
+        key = self._parse_private_key(private_key)
+        address: ChecksumAddress | None = None
+        signed_transactions = []
+        for transaction_dict in transaction_dicts:
+            if address is None and "from" in transaction_dict:
+                address = key.public_key.to_checksum_address()
+            signed_transactions.append(
+                self._sign_transaction_with_key(
+                    key, transaction_dict, address=address, compact=compact
+                )
+            )
+        return signed_transactions
+
+    @combomethod
+    def _sign_transaction_with_key(
+        self,
+        key: PrivateKey,
+        transaction_dict: TransactionDictType,
+        blobs: Blobs | None = None,
+        address: ChecksumAddress | None = None,
+        compact: bool = False,
+    ) -> SignedTransaction | CompactSignedTransaction:
         if not isinstance(transaction_dict, Mapping):
             raise TypeError(
                 f"transaction_dict must be dict-like, got {repr(transaction_dict)}"
             )
 
-        account = self.from_key(private_key)
-
         # allow from field, *only* if it matches the private key
         if "from" in transaction_dict:
-            if transaction_dict["from"] == account.address:
+            if address is None:
+                address = key.public_key.to_checksum_address()
+            if transaction_dict["from"] == address:
                 sanitized_transaction = dissoc(transaction_dict, "from")
             else:
                 str_from = (
@@ -843,8 +1383,7 @@ class Account(AccountLocalActions):
                     else transaction_dict["from"]
                 )
                 raise TypeError(
-                    f"from field must match key's {account.address}, but it was "
-                    f"{str_from}"
+                    f"from field must match key's {address}, but it was {str_from}"
                 )
         else:
             sanitized_transaction = transaction_dict
@@ -855,9 +1394,13 @@ class Account(AccountLocalActions):
             r,
             s,
             encoded_transaction,
-        ) = sign_transaction_dict(account._key_obj, sanitized_transaction, blobs=blobs)
+        ) = sign_transaction_dict(key, sanitized_transaction, blobs=blobs)
         transaction_hash = keccak(encoded_transaction)
 
+        if compact:
+            return CompactSignedTransaction(
+                encoded_transaction, transaction_hash, r, s, v
+            )
         return SignedTransaction(
             raw_transaction=HexBytes(encoded_transaction),
             hash=HexBytes(transaction_hash),
@@ -888,36 +1431,56 @@ class Account(AccountLocalActions):
 
         hb_key = HexBytes(key)
 
+        key_cache = self._key_cache
+        if key_cache is not None:
+            cache_key = (bytes(hb_key), self._keys)
+            cached_key = key_cache.get(cache_key)
+            if cached_key is not None:
+                return cached_key
+
         try:
-            return self._keys.PrivateKey(hb_key)
+            parsed_key = self._keys.PrivateKey(hb_key)
         except ValidationError as original_exception:
             raise ValueError(
                 "The private key must be exactly 32 bytes long, instead of "
                 f"{len(hb_key)} bytes."
             ) from original_exception
 
+        if key_cache is not None:
+            key_cache.put(cache_key, parsed_key)
+        return parsed_key
+
     @combomethod
     def sign_typed_data(
         self,
         private_key: PrivateKeyType,
         domain_data: dict[str, Any] | None = None,
-        message_types: dict[str, Any] | None = None,
+        message_types: dict[str, Any] | CompiledEIP712Types | None = None,
         message_data: dict[str, Any] | None = None,
         full_message: dict[str, Any] | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
     ) -> SignedMessage:
         r"""
         Sign the provided EIP-712 message with the provided key.
 
         :param private_key: the key to sign the message with
         :param domain_data: EIP712 domain data
-        :param message_types: custom types used by the `value` data
+        :param message_types: custom types used by the `value` data, or the same
+            types compiled with :meth:`~eth_account.messages.compile_eip712_types`
         :param message_data: data to be signed
         :param full_message: a dict containing all data and types
+        :param memo: optional memo of sub-struct hashes, as in
+            :meth:`~eth_account.messages.encode_typed_data`
+        :param parallel: optional executor settings to encode the items of large
+            arrays, as in :meth:`~eth_account.messages.encode_typed_data`
         :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
         :type domain_data: dict
-        :type message_types: dict
+        :type message_types: dict or CompiledEIP712Types
         :type message_data: dict
         :type full_message: dict
+        :type memo: ~eth_account.messages.StructHashMemo
+        :type parallel: ~eth_account.messages.ParallelArrayHashing
         :returns: Various details about the signature - most importantly the
             fields: v, r, and s
         :rtype: ~eth_account.datastructures.SignedMessage
@@ -1044,10 +1607,121 @@ class Account(AccountLocalActions):
             message_types,
             message_data,
             full_message,
+            memo=memo,
+            parallel=parallel,
         )
         message_hash = _hash_eip191_message(signable_message)
         return cast(SignedMessage, self._sign_hash(message_hash, private_key))
 
+    @combomethod
+    def sign_typed_data_batch(
+        self,
+        domain_data: dict[str, Any],
+        message_types: dict[str, Any] | CompiledEIP712Types,
+        messages: Iterable[dict[str, Any]],
+        private_key: PrivateKeyType,
+        primary_type: str | None = None,
+        executor: Executor | None = None,
+        chunksize: int = 64,
+        compact: bool = False,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        r"""
+        Sign many EIP-712 messages that share their domain and types, in order.
+
+        Each message is signed exactly like
+        :meth:`~eth_account.account.Account.sign_typed_data` would, but the work
+        that only depends on the schema is done once for the whole batch: the key
+        is parsed, the types are compiled with
+        :meth:`~eth_account.messages.compile_eip712_types` and the domain separator
+        is hashed, so only the struct hash and the signature are computed for each
+        message.
+
+        :param dict domain_data: EIP712 domain data
+        :param message_types: the custom types of the messages, which may include
+            ``EIP712Domain``, or the same types already compiled
+        :type message_types: dict or CompiledEIP712Types
+        :param messages: the data of each message to sign
+        :type messages: iterable of dict
+        :param private_key: the key to sign the messages with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param str primary_type: the expected primary type, checked against the one
+            derived from ``message_types``
+        :param executor: optional executor to spread the signing over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many messages to send to a process pool worker
+            at once
+        :param bool compact: return
+            :class:`~eth_account.datastructures.CompactSignedMessage` tuples of
+            plain bytes, which are cheaper to build, instead of
+            :class:`~eth_account.datastructures.SignedMessage`
+        :param memo: optional memo of sub-struct hashes shared by all the
+            messages, as in :meth:`~eth_account.messages.encode_typed_data`; it
+            cannot be sent to a process pool ``executor``
+        :type memo: ~eth_account.messages.StructHashMemo
+        :param parallel: optional executor settings to encode the items of large
+            arrays, as in :meth:`~eth_account.messages.encode_typed_data`; it
+            cannot be sent to a process pool ``executor`` either
+        :type parallel: ~eth_account.messages.ParallelArrayHashing
+        :returns: the signed messages, in the same order as ``messages``
+        :rtype: list(SignedMessage) or list(CompactSignedMessage)
+
+        .. doctest:: python
+
+            >>> from eth_account import Account
+            >>> domain_data = {"name": "Ether Mail", "version": "1", "chainId": 1}
+            >>> message_types = {
+            ...     "Mail": [
+            ...         {"name": "to", "type": "address"},
+            ...         {"name": "contents", "type": "string"},
+            ...     ],
+            ... }
+            >>> messages = [
+            ...     {"to": "0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB", "contents": text}
+            ...     for text in ("Hello, Bob!", "Bye, Bob!")
+            ... ]
+            >>> key = "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+            >>> signed = Account.sign_typed_data_batch(domain_data, message_types, messages, key)
+            >>> signed[1] == Account.sign_typed_data(key, domain_data, message_types, messages[1])
+            True
+        """  # noqa: E501
+        key = self._parse_private_key(private_key)
+
+        if isinstance(message_types, CompiledEIP712Types):
+            compiled_types = message_types
+            if primary_type is not None:
+                validate_primary_type(primary_type, compiled_types.primary_type)
+        else:
+            compiled_types = compile_eip712_types(message_types, primary_type)
+
+        # If EIP712Domain types were provided, check that they match the domain data
+        domain_field_names = compiled_types.domain_field_names
+        if domain_field_names is not None:
+            validate_domain_fields(domain_data, domain_field_names)
+        domain_separator = hash_domain(domain_data)
+
+        sign = functools.partial(
+            sign_typed_data_with_key,
+            key,
+            compiled_types,
+            domain_separator,
+            memo=memo,
+            parallel=parallel,
+        )
+        compact_messages: Iterator[CompactSignedMessage]
+        if executor is None:
+            compact_messages = map(sign, messages)
+        else:
+            compact_messages = executor.map(sign, messages, chunksize=chunksize)
+
+        if compact:
+            return list(compact_messages)
+        return [
+            compact_message.to_signed_message() for compact_message in compact_messages
+        ]
+
     @combomethod
     def sign_authorization(
         self,
@@ -1143,3 +1817,85 @@ class Account(AccountLocalActions):
             signature=signature,
             authorization_hash=authorization_hash,
         )
+
+    @combomethod
+    def sign_authorizations(
+        self,
+        authorization_dicts: Iterable[AuthorizationDict],
+        private_keys: PrivateKeyType | Sequence[PrivateKeyType],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[CompactSignedAuthorization]:
+        r"""
+        Sign many EIP-7702 authorizations, in order.
+
+        Each authorization is signed like
+        :meth:`~eth_account.account.Account.sign_authorization` would, but each
+        distinct private key is parsed only once for the whole batch, and the
+        results are :class:`~eth_account.datastructures.CompactSignedAuthorization`
+        tuples, which are cheaper to build and to send between processes.
+
+        :param authorization_dicts: the authorizations to sign, each with the
+            ``chainId``, ``address`` and ``nonce`` keys
+        :type authorization_dicts: iterable of dict
+        :param private_keys: the private key to sign every authorization with, or
+            a list or tuple with the private key for each authorization
+        :type private_keys: hex str, bytes, int or
+            :class:`eth_keys.datatypes.PrivateKey`, or a list of them
+        :param executor: optional executor to spread the signing over, e.g. a
+            :class:`~concurrent.futures.ProcessPoolExecutor`
+        :type executor: :class:`~concurrent.futures.Executor`
+        :param int chunksize: how many authorizations to send to a process pool
+            worker at once
+        :returns: the signed authorizations, in the same order as
+            ``authorization_dicts``, ready for an ``authorizationList``
+        :rtype: list(CompactSignedAuthorization)
+
+        .. doctest:: python
+
+            >>> from eth_account import Account
+            >>> key = "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
+            >>> auths = [
+            ...     {
+            ...         "chainId": chain_id,
+            ...         "address": "0x5ce9454909639d2d17a3f753ce7d93fa0b9ab12e",
+            ...         "nonce": 1,
+            ...     }
+            ...     for chain_id in (1, 1337)
+            ... ]
+            >>> signed_auths = Account.sign_authorizations(auths, key)
+            >>> signed_auths[1].r == Account.sign_authorization(auths[1], key).r
+            True
+        """  # noqa: E501
+        if isinstance(private_keys, (list, tuple)):
+            parsed_keys: dict[bytes, PrivateKey] = {}
+            keys = []
+            authorizations = []
+            for authorization_dict, private_key in itertools.zip_longest(
+                authorization_dicts, private_keys, fillvalue=None
+            ):
+                if authorization_dict is None or private_key is None:
+                    raise ValueError("Each authorization needs exactly one private key")
+                if isinstance(private_key, self._keys.PrivateKey):
+                    keys.append(private_key)
+                else:
+                    raw_key = bytes(HexBytes(private_key))
+                    if raw_key not in parsed_keys:
+                        parsed_keys[raw_key] = self._parse_private_key(raw_key)
+                    keys.append(parsed_keys[raw_key])
+                authorizations.append(authorization_dict)
+            key_iter: Iterable[PrivateKey] = keys
+            authorization_dicts = authorizations
+        else:
+            key_iter = itertools.repeat(self._parse_private_key(private_keys))
+
+        if executor is None:
+            return list(map(sign_authorization_with_key, key_iter, authorization_dicts))
+        return list(
+            executor.map(
+                sign_authorization_with_key,
+                key_iter,
+                authorization_dicts,
+                chunksize=chunksize,
+            )
+        )
@@ -2,6 +2,13 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Any,
 )
@@ -17,16 +24,23 @@ from eth_utils.curried import (
 )
 
 from eth_account.datastructures import (
+    CompactSignedAuthorization,
+    CompactSignedMessage,
+    CompactSignedTransaction,
     SignedMessage,
     SignedTransaction,
 )
 from eth_account.messages import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
     SignableMessage,
+    StructHashMemo,
 )
 from eth_account.typed_transactions.set_code_transaction import (
     SignedAuthorization,
 )
 from eth_account.types import (
+    AuthorizationDict,
     Blobs,
     PrivateKeyType,
     TransactionDictType,
@@ -63,6 +77,17 @@ class AccountLocalActions(ABC):
     ) -> SignedMessage:
         pass
 
+    # The batch methods are not abstract, so that subclasses written before they
+    # were added can still be instantiated.
+    @combomethod
+    def sign_messages(
+        self,
+        signable_messages: Iterable[SignableMessage],
+        private_key: PrivateKeyType,
+        compact: bool = False,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        raise NotImplementedError("sign_messages is not implemented by this account")
+
     @combomethod
     @abstractmethod
     def sign_transaction(
@@ -73,18 +98,49 @@ class AccountLocalActions(ABC):
     ) -> SignedTransaction:
         pass
 
+    @combomethod
+    def sign_transactions(
+        self,
+        transaction_dicts: Iterable[TransactionDictType],
+        private_key: PrivateKeyType,
+        compact: bool = False,
+    ) -> list[SignedTransaction] | list[CompactSignedTransaction]:
+        raise NotImplementedError(
+            "sign_transactions is not implemented by this account"
+        )
+
     @combomethod
     @abstractmethod
     def sign_typed_data(
         self,
         private_key: PrivateKeyType,
         domain_data: dict[str, Any] | None = None,
-        message_types: dict[str, Any] | None = None,
+        message_types: dict[str, Any] | CompiledEIP712Types | None = None,
         message_data: dict[str, Any] | None = None,
         full_message: dict[str, Any] | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
     ) -> SignedMessage:
         pass
 
+    @combomethod
+    def sign_typed_data_batch(
+        self,
+        domain_data: dict[str, Any],
+        message_types: dict[str, Any] | CompiledEIP712Types,
+        messages: Iterable[dict[str, Any]],
+        private_key: PrivateKeyType,
+        primary_type: str | None = None,
+        executor: Executor | None = None,
+        chunksize: int = 64,
+        compact: bool = False,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        raise NotImplementedError(
+            "sign_typed_data_batch is not implemented by this account"
+        )
+
     @combomethod
     @abstractmethod
     def sign_authorization(
@@ -93,3 +149,15 @@ class AccountLocalActions(ABC):
         authorization: dict[str, Any],
     ) -> SignedAuthorization:
         pass
+
+    @combomethod
+    def sign_authorizations(
+        self,
+        authorization_dicts: Iterable[AuthorizationDict],
+        private_keys: PrivateKeyType | Sequence[PrivateKeyType],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[CompactSignedAuthorization]:
+        raise NotImplementedError(
+            "sign_authorizations is not implemented by this account"
+        )
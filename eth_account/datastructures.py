@@ -14,6 +14,7 @@ from eth_typing import (
 from eth_utils import (
     CamelModel,
     to_checksum_address,
+    to_hex,
 )
 from hexbytes import (
     HexBytes,
@@ -90,6 +91,195 @@ class SignedMessage(
             raise TypeError("Index must be an integer, slice, or string")
 
 
+class CompactSignedTransaction(
+    NamedTuple(
+        "CompactSignedTransaction",
+        [
+            ("raw_transaction", bytes),
+            ("hash", bytes),
+            ("r", int),
+            ("s", int),
+            ("v", int),
+        ],
+    )
+):
+    """
+    A :class:`SignedTransaction` that holds plain ``bytes``, as returned when
+    signing with ``compact=True``.
+
+    Nothing is wrapped in :class:`~hexbytes.main.HexBytes` up front; the
+    hex-encoded views are only built by :meth:`as_dict` and
+    :meth:`to_signed_transaction`.
+    """
+
+    __slots__ = ()
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Any, ...]:
+        ...
+
+    @overload
+    def __getitem__(self, index: str) -> Any:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice | str) -> Any:
+        if isinstance(index, (int, slice)):
+            return super().__getitem__(index)
+        elif isinstance(index, str):
+            return getattr(self, index)
+        else:
+            raise TypeError("Index must be an integer, slice, or string")
+
+    def to_signed_transaction(self) -> SignedTransaction:
+        return SignedTransaction(
+            raw_transaction=HexBytes(self.raw_transaction),
+            hash=HexBytes(self.hash),
+            r=self.r,
+            s=self.s,
+            v=self.v,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the signed transaction as a JSON-serializable dict.
+        """
+        return {
+            "raw_transaction": to_hex(self.raw_transaction),
+            "hash": to_hex(self.hash),
+            "r": self.r,
+            "s": self.s,
+            "v": self.v,
+        }
+
+
+class CompactSignedMessage(
+    NamedTuple(
+        "CompactSignedMessage",
+        [
+            ("message_hash", bytes),
+            ("r", int),
+            ("s", int),
+            ("v", int),
+            ("signature", bytes),
+        ],
+    )
+):
+    """
+    A :class:`SignedMessage` that holds plain ``bytes``, as returned when signing
+    with ``compact=True``.
+
+    Nothing is wrapped in :class:`~hexbytes.main.HexBytes` up front; the
+    hex-encoded views are only built by :meth:`as_dict` and
+    :meth:`to_signed_message`.
+    """
+
+    __slots__ = ()
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Any, ...]:
+        ...
+
+    @overload
+    def __getitem__(self, index: str) -> Any:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice | str) -> Any:
+        if isinstance(index, (int, slice)):
+            return super().__getitem__(index)
+        elif isinstance(index, str):
+            return getattr(self, index)
+        else:
+            raise TypeError("Index must be an integer, slice, or string")
+
+    def to_signed_message(self) -> SignedMessage:
+        return SignedMessage(
+            message_hash=HexBytes(self.message_hash),
+            r=self.r,
+            s=self.s,
+            v=self.v,
+            signature=HexBytes(self.signature),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the signed message as a JSON-serializable dict.
+        """
+        return {
+            "message_hash": to_hex(self.message_hash),
+            "r": self.r,
+            "s": self.s,
+            "v": self.v,
+            "signature": to_hex(self.signature),
+        }
+
+
+class CompactSignedAuthorization(
+    NamedTuple(
+        "CompactSignedAuthorization",
+        [
+            ("chain_id", int),
+            ("address", bytes),
+            ("nonce", int),
+            ("y_parity", int),
+            ("r", int),
+            ("s", int),
+        ],
+    )
+):
+    """
+    A signed EIP-7702 authorization, as returned by
+    :meth:`~eth_account.account.Account.sign_authorizations`.
+
+    It holds only the fields that go into an ``authorizationList``, and can be
+    used there directly. Unlike :class:`SignedSetCodeAuthorization`, it does not
+    keep the signature object or authorization hash around; use
+    :meth:`~eth_account.account.Account.recover_authorities` to get the authority.
+    """
+
+    __slots__ = ()
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Any, ...]:
+        ...
+
+    @overload
+    def __getitem__(self, index: str) -> Any:
+        ...
+
+    def __getitem__(self, index: SupportsIndex | slice | str) -> Any:
+        if isinstance(index, (int, slice)):
+            return super().__getitem__(index)
+        elif isinstance(index, str):
+            return getattr(self, index)
+        else:
+            raise TypeError("Index must be an integer, slice, or string")
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Return the authorization as a JSON-RPC structured dict.
+        """
+        return {
+            "chainId": self.chain_id,
+            "address": to_checksum_address(self.address),
+            "nonce": self.nonce,
+            "yParity": self.y_parity,
+            "r": self.r,
+            "s": self.s,
+        }
+
+
 class SignedSetCodeAuthorization(CamelModel):
     chain_id: int
     address: bytes
@@ -105,6 +295,16 @@ class SignedSetCodeAuthorization(CamelModel):
     def serialize_address(cls, value: bytes) -> ChecksumAddress:
         return to_checksum_address(value)
 
+    # (signature bytes, authorization hash, authority) of the last recovery
+    _recovered_authority: tuple[bytes, bytes, bytes] | None = None
+
+    def __eq__(self, other: Any) -> bool:
+        # compare the fields only, so the recovered authority memo does not
+        # affect equality
+        if not isinstance(other, SignedSetCodeAuthorization):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
     @property
     def authority(self) -> bytes:
         """
@@ -114,7 +314,21 @@ class SignedSetCodeAuthorization(CamelModel):
         always derived from the signature and the authorization hash, rather than
         statically assigned. This value should be verified against the expected
         authority for a signed authorization.
+
+        The recovered authority is remembered, and only recovered again if the
+        signature or the authorization hash change.
         """
-        return self.signature.recover_public_key_from_msg_hash(
-            self.authorization_hash
+        signature_bytes = self.signature.to_bytes()
+        authorization_hash = bytes(self.authorization_hash)
+        recovered = self._recovered_authority
+        if recovered is not None and recovered[:2] == (
+            signature_bytes,
+            authorization_hash,
+        ):
+            return recovered[2]
+
+        authority = self.signature.recover_public_key_from_msg_hash(
+            authorization_hash
         ).to_canonical_address()
+        self._recovered_authority = (signature_bytes, authorization_hash, authority)
+        return authority
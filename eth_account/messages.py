@@ -14,14 +14,23 @@ from eth_utils.curried import (
     to_bytes,
     to_canonical_address,
 )
+from eth_utils.toolz import (
+    dissoc,
+)
 from hexbytes import (
     HexBytes,
 )
 
 from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
+    StructHashMemo,
+    compile_eip712_types as _compile_eip712_types,
     get_primary_type,
     hash_domain,
     hash_eip712_message,
+    validate_domain_fields,
+    validate_primary_type,
 )
 from eth_account._utils.validation import (
     is_valid_address,
@@ -212,9 +221,11 @@ def defunct_hash_message(
 
 def encode_typed_data(
     domain_data: dict[str, Any] | None = None,
-    message_types: dict[str, Any] | None = None,
+    message_types: dict[str, Any] | CompiledEIP712Types | None = None,
     message_data: dict[str, Any] | None = None,
     full_message: dict[str, Any] | None = None,
+    memo: StructHashMemo | None = None,
+    parallel: ParallelArrayHashing | None = None,
 ) -> SignableMessage:
     r"""
     Encode an EIP-712_ message in a manner compatible with other implementations
@@ -262,9 +273,17 @@ def encode_typed_data(
         - Custom types that are used but not defined in ``types`` will not encode.
 
     :param domain_data: EIP712 domain data
-    :param message_types: custom types used by the `value` data
+    :param message_types: custom types used by the `value` data, or the same types
+        compiled with :meth:`compile_eip712_types`
     :param message_data: data to be signed
-    :param full_message: a dict containing all data and types
+    :param full_message: a dict containing all data and types, whose ``types`` may
+        also be compiled with :meth:`compile_eip712_types`
+    :param memo: optional ``StructHashMemo(maxsize)``, to hash each distinct
+        sub-struct only once; it can be shared by many messages, and its
+        ``cache_info().hits`` count the sub-struct hashes that were avoided
+    :param parallel: optional ``ParallelArrayHashing(executor)``, to encode the
+        items of large arrays on ``executor``, e.g. a
+        :class:`~concurrent.futures.ProcessPoolExecutor`
     :returns: a ``SignableMessage``, an encoded message ready to be signed
 
 
@@ -384,37 +403,33 @@ def encode_typed_data(
                 " but not both."
             )
 
-        full_message_types = full_message["types"].copy()
+        full_message_types = full_message["types"]
         full_message_domain = full_message["domain"].copy()
 
-        # If EIP712Domain types were provided, check that they match the domain data
-        if "EIP712Domain" in full_message_types:
-            domain_data_keys = list(full_message_domain.keys())
-            domain_types_keys = [
+        if isinstance(full_message_types, CompiledEIP712Types):
+            domain_types_keys = full_message_types.domain_field_names
+        elif "EIP712Domain" in full_message_types:
+            domain_types_keys = tuple(
                 field["name"] for field in full_message_types["EIP712Domain"]
-            ]
+            )
+        else:
+            domain_types_keys = None
 
-            if set(domain_data_keys) != (set(domain_types_keys)):
-                raise ValidationError(
-                    "The fields provided in `domain` do not match the fields provided"
-                    " in `types.EIP712Domain`. The fields provided in `domain` were"
-                    f" `{domain_data_keys}`, but the fields provided in "
-                    f"`types.EIP712Domain` were `{domain_types_keys}`."
-                )
+        # If EIP712Domain types were provided, check that they match the domain data
+        if domain_types_keys is not None:
+            validate_domain_fields(full_message_domain, domain_types_keys)
 
-        full_message_types.pop("EIP712Domain", None)
+        if not isinstance(full_message_types, CompiledEIP712Types):
+            full_message_types = dissoc(full_message_types, "EIP712Domain")
 
         # If primaryType was provided, check that it matches the derived primaryType
         if "primaryType" in full_message:
-            derived_primary_type = get_primary_type(full_message_types)
-            provided_primary_type = full_message["primaryType"]
-            if derived_primary_type != provided_primary_type:
-                raise ValidationError(
-                    "The provided `primaryType` does not match the derived "
-                    "`primaryType`. The provided `primaryType` was "
-                    f"`{provided_primary_type}`, but the derived `primaryType` was "
-                    f"`{derived_primary_type}`."
-                )
+            derived_primary_type = (
+                full_message_types.primary_type
+                if isinstance(full_message_types, CompiledEIP712Types)
+                else get_primary_type(full_message_types)
+            )
+            validate_primary_type(full_message["primaryType"], derived_primary_type)
 
         parsed_domain_data = full_message_domain
         parsed_message_types = full_message_types
@@ -428,5 +443,67 @@ def encode_typed_data(
     return SignableMessage(
         HexBytes(b"\x01"),
         hash_domain(parsed_domain_data),
-        hash_eip712_message(parsed_message_types, parsed_message_data),
+        hash_eip712_message(
+            parsed_message_types, parsed_message_data, memo=memo, parallel=parallel
+        ),
     )
+
+
+def compile_eip712_types(
+    types: dict[str, Any], primary_type: str | None = None
+) -> CompiledEIP712Types:
+    r"""
+    Compile the custom types of EIP-712_ messages, to encode many messages that
+    share them.
+
+    Every struct's type string, type hash and dependency order, and every field's
+    encoder, are computed once here instead of for every message. The compiled
+    types are immutable, and can be passed wherever
+    :meth:`encode_typed_data` or :meth:`~eth_account.account.Account.sign_typed_data`
+    take ``message_types``, or as the ``types`` of a ``full_message``.
+
+    :param types: the custom types, as in ``message_types``, or as in the ``types``
+        of a ``full_message``, which may include ``EIP712Domain``
+    :param primary_type: the expected primary type, checked against the one
+        derived from ``types``
+    :returns: the compiled types
+
+    .. doctest:: python
+
+        >>> from eth_account.messages import compile_eip712_types, encode_typed_data
+        >>> message_types = {
+        ...     "Person": [
+        ...         {"name": "name", "type": "string"},
+        ...         {"name": "wallet", "type": "address"},
+        ...     ],
+        ...     "Mail": [
+        ...         {"name": "from", "type": "Person"},
+        ...         {"name": "to", "type": "Person"},
+        ...         {"name": "contents", "type": "string"},
+        ...     ],
+        ... }
+        >>> compiled_types = compile_eip712_types(message_types)
+        >>> compiled_types.primary_type
+        'Mail'
+        >>> compiled_types.structs["Mail"].encoded_type
+        'Mail(Person from,Person to,string contents)Person(string name,address wallet)'
+        >>> domain_data = {"name": "Ether Mail", "version": "1", "chainId": 1}
+        >>> message_data = {
+        ...     "from": {
+        ...         "name": "Cow",
+        ...         "wallet": "0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826",
+        ...     },
+        ...     "to": {
+        ...         "name": "Bob",
+        ...         "wallet": "0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB",
+        ...     },
+        ...     "contents": "Hello, Bob!",
+        ... }
+        >>> encode_typed_data(domain_data, compiled_types, message_data) == (
+        ...     encode_typed_data(domain_data, message_types, message_data)
+        ... )
+        True
+
+    .. _EIP-712: https://eips.ethereum.org/EIPS/eip-712
+    """  # noqa: E501
+    return _compile_eip712_types(types, primary_type)
@@ -0,0 +1,201 @@
+import asyncio
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from concurrent.futures import (
+    Executor,
+)
+import functools
+from typing import (
+    Any,
+    TypeVar,
+    cast,
+)
+
+from eth_typing import (
+    ChecksumAddress,
+    Hash32,
+)
+
+from eth_account.account import (
+    Account,
+)
+from eth_account.datastructures import (
+    CompactSignedMessage,
+    CompactSignedTransaction,
+    SignedMessage,
+    SignedSetCodeAuthorization,
+    SignedTransaction,
+)
+from eth_account.messages import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
+    SignableMessage,
+    StructHashMemo,
+)
+from eth_account.signers.local import (
+    LocalAccount,
+)
+from eth_account.types import (
+    Blobs,
+    TransactionDictType,
+)
+
+T = TypeVar("T")
+
+
+class AsyncLocalAccount:
+    r"""
+    An asyncio facade over a :class:`~eth_account.signers.local.LocalAccount`.
+
+    Every signing call runs on ``executor``, so that EC signing, blob KZG
+    computation and keyfile decryption do not block the event loop. At most
+    ``max_concurrency`` calls run at once; further calls wait for a free slot,
+    which applies backpressure to the callers.
+
+    .. code-block:: python
+
+        >>> async_account = AsyncLocalAccount(my_local_account, max_concurrency=4)
+        >>> signed_tx = await async_account.sign_transaction(transaction_dict)
+
+    .. NOTE:: The default executor is the event loop's thread pool. Native code
+        that holds the GIL, such as the KZG computation for blobs, still stalls
+        the loop from a thread; pass a
+        :class:`~concurrent.futures.ProcessPoolExecutor` to avoid that.
+
+    :param ~eth_account.signers.local.LocalAccount account: the account to sign with
+    :param executor: where to run the signing, defaults to the event loop's default
+        executor
+    :type executor: :class:`~concurrent.futures.Executor`
+    :param int max_concurrency: optional limit on the number of signing calls in
+        flight
+    """
+
+    def __init__(
+        self,
+        account: LocalAccount,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {max_concurrency}"
+            )
+        self.account = account
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        )
+
+    @classmethod
+    async def decrypt(
+        cls,
+        keyfile_json: str | dict[str, Any],
+        password: str,
+        executor: Executor | None = None,
+        max_concurrency: int | None = None,
+    ) -> "AsyncLocalAccount":
+        """
+        Decrypt a keyfile on ``executor`` and wrap the resulting account.
+
+        This uses the same structure as in
+        :meth:`~eth_account.account.Account.decrypt`.
+        """
+        loop = asyncio.get_running_loop()
+        private_key = await loop.run_in_executor(
+            executor, Account.decrypt, keyfile_json, password
+        )
+        return cls(
+            Account.from_key(private_key),
+            executor=executor,
+            max_concurrency=max_concurrency,
+        )
+
+    @property
+    def address(self) -> ChecksumAddress:
+        return self.account.address
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        if self._semaphore is None:
+            return await loop.run_in_executor(self.executor, call)
+        async with self._semaphore:
+            return await loop.run_in_executor(self.executor, call)
+
+    async def unsafe_sign_hash(self, message_hash: Hash32) -> SignedMessage:
+        return await self._run(self.account.unsafe_sign_hash, message_hash)
+
+    async def sign_message(self, signable_message: SignableMessage) -> SignedMessage:
+        return await self._run(self.account.sign_message, signable_message)
+
+    async def sign_transaction(
+        self, transaction_dict: TransactionDictType, blobs: Blobs | None = None
+    ) -> SignedTransaction:
+        return await self._run(
+            self.account.sign_transaction, transaction_dict, blobs=blobs
+        )
+
+    async def sign_messages(
+        self, signable_messages: Iterable[SignableMessage], compact: bool = False
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        return await self._run(
+            self.account.sign_messages, signable_messages, compact=compact
+        )
+
+    async def sign_transactions(
+        self, transaction_dicts: Iterable[TransactionDictType], compact: bool = False
+    ) -> list[SignedTransaction] | list[CompactSignedTransaction]:
+        return await self._run(
+            self.account.sign_transactions, transaction_dicts, compact=compact
+        )
+
+    async def sign_typed_data(
+        self,
+        domain_data: dict[str, Any] | None = None,
+        message_types: dict[str, Any] | CompiledEIP712Types | None = None,
+        message_data: dict[str, Any] | None = None,
+        full_message: dict[str, Any] | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> SignedMessage:
+        return await self._run(
+            self.account.sign_typed_data,
+            domain_data=domain_data,
+            message_types=message_types,
+            message_data=message_data,
+            full_message=full_message,
+            memo=memo,
+            parallel=parallel,
+        )
+
+    async def sign_typed_data_batch(
+        self,
+        domain_data: dict[str, Any],
+        message_types: dict[str, Any] | CompiledEIP712Types,
+        messages: Iterable[dict[str, Any]],
+        primary_type: str | None = None,
+        compact: bool = False,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        return await self._run(
+            self.account.sign_typed_data_batch,
+            domain_data,
+            message_types,
+            messages,
+            primary_type=primary_type,
+            compact=compact,
+            memo=memo,
+            parallel=parallel,
+        )
+
+    async def sign_authorization(
+        self, authorization: dict[str, Any]
+    ) -> SignedSetCodeAuthorization:
+        return cast(
+            SignedSetCodeAuthorization,
+            await self._run(self.account.sign_authorization, authorization),
+        )
@@ -1,3 +1,9 @@
+from collections.abc import (
+    Iterable,
+)
+from concurrent.futures import (
+    Executor,
+)
 from typing import (
     Any,
     cast,
@@ -18,11 +24,17 @@ from eth_account.account_local_actions import (
     AccountLocalActions,
 )
 from eth_account.datastructures import (
+    CompactSignedAuthorization,
+    CompactSignedMessage,
+    CompactSignedTransaction,
     SignedMessage,
     SignedTransaction,
 )
 from eth_account.messages import (
+    CompiledEIP712Types,
+    ParallelArrayHashing,
     SignableMessage,
+    StructHashMemo,
 )
 from eth_account.signers.base import (
     BaseAccount,
@@ -107,7 +119,7 @@ class LocalAccount(BaseAccount):
             SignedMessage,
             self._publicapi.unsafe_sign_hash(
                 message_hash,
-                private_key=self.key,
+                private_key=self._key_obj,
             ),
         )
 
@@ -121,7 +133,24 @@ class LocalAccount(BaseAccount):
         """
         return cast(
             SignedMessage,
-            self._publicapi.sign_message(signable_message, private_key=self.key),
+            self._publicapi.sign_message(signable_message, private_key=self._key_obj),
+        )
+
+    def sign_messages(
+        self, signable_messages: Iterable[SignableMessage], compact: bool = False
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        """
+        Sign many messages with the local private key, in order.
+
+        This uses the same structure as in
+        :meth:`~eth_account.account.Account.sign_messages`, but without a
+        private key argument.
+        """
+        return cast(
+            list[SignedMessage] | list[CompactSignedMessage],
+            self._publicapi.sign_messages(
+                signable_messages, self._key_obj, compact=compact
+            ),
         )
 
     def sign_transaction(
@@ -129,15 +158,36 @@ class LocalAccount(BaseAccount):
     ) -> SignedTransaction:
         return cast(
             SignedTransaction,
-            self._publicapi.sign_transaction(transaction_dict, self.key, blobs=blobs),
+            self._publicapi.sign_transaction(
+                transaction_dict, self._key_obj, blobs=blobs
+            ),
+        )
+
+    def sign_transactions(
+        self, transaction_dicts: Iterable[TransactionDictType], compact: bool = False
+    ) -> list[SignedTransaction] | list[CompactSignedTransaction]:
+        """
+        Sign many transactions with the local private key, in order.
+
+        This uses the same structure as in
+        :meth:`~eth_account.account.Account.sign_transactions`, but without a
+        private key argument.
+        """
+        return cast(
+            list[SignedTransaction] | list[CompactSignedTransaction],
+            self._publicapi.sign_transactions(
+                transaction_dicts, self._key_obj, compact=compact
+            ),
         )
 
     def sign_typed_data(
         self,
         domain_data: dict[str, Any] | None = None,
-        message_types: dict[str, Any] | None = None,
+        message_types: dict[str, Any] | CompiledEIP712Types | None = None,
         message_data: dict[str, Any] | None = None,
         full_message: dict[str, Any] | None = None,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
     ) -> SignedMessage:
         """
         Sign the provided EIP-712 message with the local private key.
@@ -149,16 +199,79 @@ class LocalAccount(BaseAccount):
         return cast(
             SignedMessage,
             self._publicapi.sign_typed_data(
-                private_key=self.key,
+                private_key=self._key_obj,
                 domain_data=domain_data,
                 message_types=message_types,
                 message_data=message_data,
                 full_message=full_message,
+                memo=memo,
+                parallel=parallel,
+            ),
+        )
+
+    def sign_typed_data_batch(
+        self,
+        domain_data: dict[str, Any],
+        message_types: dict[str, Any] | CompiledEIP712Types,
+        messages: Iterable[dict[str, Any]],
+        primary_type: str | None = None,
+        executor: Executor | None = None,
+        chunksize: int = 64,
+        compact: bool = False,
+        memo: StructHashMemo | None = None,
+        parallel: ParallelArrayHashing | None = None,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        """
+        Sign many EIP-712 messages that share their domain and types with the local
+        private key, in order.
+
+        This uses the same structure as in
+        :meth:`~eth_account.account.Account.sign_typed_data_batch`, but without a
+        private key argument.
+        """
+        return cast(
+            list[SignedMessage] | list[CompactSignedMessage],
+            self._publicapi.sign_typed_data_batch(
+                domain_data,
+                message_types,
+                messages,
+                self._key_obj,
+                primary_type=primary_type,
+                executor=executor,
+                chunksize=chunksize,
+                compact=compact,
+                memo=memo,
+                parallel=parallel,
             ),
         )
 
     def sign_authorization(self, authorization: dict[str, Any]) -> SignedMessage:
         return cast(
             SignedMessage,
-            self._publicapi.sign_authorization(authorization, private_key=self.key),
+            self._publicapi.sign_authorization(
+                authorization, private_key=self._key_obj
+            ),
+        )
+
+    def sign_authorizations(
+        self,
+        authorization_dicts: Iterable[dict[str, Any]],
+        executor: Executor | None = None,
+        chunksize: int = 64,
+    ) -> list[CompactSignedAuthorization]:
+        """
+        Sign many EIP-7702 authorizations with the local private key, in order.
+
+        This uses the same structure as in
+        :meth:`~eth_account.account.Account.sign_authorizations`, but without a
+        private key argument.
+        """
+        return cast(
+            list[CompactSignedAuthorization],
+            self._publicapi.sign_authorizations(
+                authorization_dicts,
+                self._key_obj,
+                executor=executor,
+                chunksize=chunksize,
+            ),
         )
@@ -0,0 +1,257 @@
+from collections.abc import (
+    Iterable,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+import itertools
+from types import (
+    TracebackType,
+)
+from typing import (
+    Any,
+    cast,
+)
+
+from eth_keys import (
+    KeyAPI,
+)
+from eth_keys.datatypes import (
+    PrivateKey,
+)
+from eth_typing import (
+    AnyAddress,
+    ChecksumAddress,
+)
+from eth_utils import (
+    to_checksum_address,
+)
+
+from eth_account.account import (
+    Account,
+)
+from eth_account.datastructures import (
+    CompactSignedMessage,
+    CompactSignedTransaction,
+    SignedMessage,
+    SignedTransaction,
+)
+from eth_account.messages import (
+    SignableMessage,
+)
+from eth_account.signers.local import (
+    LocalAccount,
+)
+from eth_account.types import (
+    PrivateKeyType,
+    TransactionDictType,
+)
+
+# Private keys held by a pool worker process, by address
+_worker_keys: dict[ChecksumAddress, PrivateKey] = {}
+
+
+def _init_worker(keys_api: KeyAPI, raw_keys: tuple[bytes, ...]) -> None:
+    # keys_api is the parent's Account._keys, so workers sign with its backend
+    _worker_keys.clear()
+    for raw_key in raw_keys:
+        key = keys_api.PrivateKey(raw_key, backend=keys_api.backend)
+        _worker_keys[key.public_key.to_checksum_address()] = key
+
+
+def _sign_transaction_in_worker(
+    signer: ChecksumAddress, transaction_dict: TransactionDictType
+) -> CompactSignedTransaction:
+    return cast(
+        CompactSignedTransaction,
+        Account._sign_transaction_with_key(
+            _worker_keys[signer], transaction_dict, compact=True
+        ),
+    )
+
+
+def _compact_signed_message(signed: SignedMessage) -> CompactSignedMessage:
+    return CompactSignedMessage(
+        bytes(signed.message_hash),
+        signed.r,
+        signed.s,
+        signed.v,
+        bytes(signed.signature),
+    )
+
+
+def _sign_message_in_worker(
+    signer: ChecksumAddress, signable_message: SignableMessage
+) -> CompactSignedMessage:
+    return _compact_signed_message(
+        Account.sign_message(signable_message, _worker_keys[signer])
+    )
+
+
+def _sign_typed_data_in_worker(
+    signer: ChecksumAddress, full_message: dict[str, Any]
+) -> CompactSignedMessage:
+    return _compact_signed_message(
+        Account.sign_typed_data(_worker_keys[signer], full_message=full_message)
+    )
+
+
+class SigningPool:
+    r"""
+    Spread bulk signing over a pool of worker processes.
+
+    Signing is CPU-bound, so a single Python process signs on one core at a time.
+    The private keys are sent to each worker once, when it starts, and stay
+    there; results come back as compact named tuples and are returned in input order.
+
+    .. code-block:: python
+
+        >>> with SigningPool(my_local_account, max_workers=4) as pool:
+        ...     signed_txs = pool.sign_transactions(transactions)
+
+    :param accounts: the account, or private keys, to sign with
+    :type accounts: :class:`~eth_account.signers.local.LocalAccount` or iterable
+        of private keys
+    :param int max_workers: the number of worker processes, defaults to the
+        number of CPUs
+    :param int chunksize: how many items to send to a worker at once
+    """
+
+    def __init__(
+        self,
+        accounts: LocalAccount | Iterable[PrivateKeyType],
+        max_workers: int | None = None,
+        chunksize: int = 16,
+    ) -> None:
+        if isinstance(accounts, LocalAccount):
+            accounts = [accounts.key]
+        keys = [Account._parse_private_key(key) for key in accounts]
+        if not keys:
+            raise ValueError("SigningPool needs at least one private key")
+
+        self.addresses: tuple[ChecksumAddress, ...] = tuple(
+            key.public_key.to_checksum_address() for key in keys
+        )
+        self.chunksize = chunksize
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(Account._keys, tuple(key.to_bytes() for key in keys)),
+        )
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes, and the private keys they hold.
+        """
+        self._executor.shutdown()
+
+    def _resolve_signer(self, signer: AnyAddress | str | None) -> ChecksumAddress:
+        if signer is None:
+            if len(self.addresses) != 1:
+                raise ValueError(
+                    "signer is required when the pool holds more than one key"
+                )
+            return self.addresses[0]
+        address = to_checksum_address(signer)
+        if address not in self.addresses:
+            raise ValueError(f"No private key for {address} in this pool")
+        return address
+
+    def sign_transactions(
+        self,
+        transaction_dicts: Iterable[TransactionDictType],
+        signer: AnyAddress | str | None = None,
+        compact: bool = False,
+    ) -> list[SignedTransaction] | list[CompactSignedTransaction]:
+        """
+        Sign the transactions, like
+        :meth:`~eth_account.account.Account.sign_transaction` would.
+
+        :param transaction_dicts: the transactions to sign
+        :param signer: the address to sign with, optional if the pool holds a
+            single key
+        :param bool compact: return the
+            :class:`~eth_account.datastructures.CompactSignedTransaction` tuples
+            the workers produce, instead of expanding them
+        :returns: the signed transactions, in the same order
+        """
+        address = self._resolve_signer(signer)
+        signed = self._executor.map(
+            _sign_transaction_in_worker,
+            itertools.repeat(address),
+            transaction_dicts,
+            chunksize=self.chunksize,
+        )
+        if compact:
+            return list(signed)
+        return [compact_signed.to_signed_transaction() for compact_signed in signed]
+
+    def sign_messages(
+        self,
+        signable_messages: Iterable[SignableMessage],
+        signer: AnyAddress | str | None = None,
+        compact: bool = False,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        """
+        Sign the messages, like
+        :meth:`~eth_account.account.Account.sign_message` would.
+
+        :param signable_messages: the messages to sign
+        :param signer: the address to sign with, optional if the pool holds a
+            single key
+        :param bool compact: return the
+            :class:`~eth_account.datastructures.CompactSignedMessage` tuples the
+            workers produce, instead of expanding them
+        :returns: the signed messages, in the same order
+        """
+        address = self._resolve_signer(signer)
+        signed = self._executor.map(
+            _sign_message_in_worker,
+            itertools.repeat(address),
+            signable_messages,
+            chunksize=self.chunksize,
+        )
+        if compact:
+            return list(signed)
+        return [compact_signed.to_signed_message() for compact_signed in signed]
+
+    def sign_typed_data(
+        self,
+        full_messages: Iterable[dict[str, Any]],
+        signer: AnyAddress | str | None = None,
+        compact: bool = False,
+    ) -> list[SignedMessage] | list[CompactSignedMessage]:
+        """
+        Sign the EIP-712 messages, like
+        :meth:`~eth_account.account.Account.sign_typed_data` would with
+        ``full_message``.
+
+        :param full_messages: the EIP-712 messages to sign
+        :param signer: the address to sign with, optional if the pool holds a
+            single key
+        :param bool compact: return the
+            :class:`~eth_account.datastructures.CompactSignedMessage` tuples the
+            workers produce, instead of expanding them
+        :returns: the signed messages, in the same order
+        """
+        address = self._resolve_signer(signer)
+        signed = self._executor.map(
+            _sign_typed_data_in_worker,
+            itertools.repeat(address),
+            full_messages,
+            chunksize=self.chunksize,
+        )
+        if compact:
+            return list(signed)
+        return [compact_signed.to_signed_message() for compact_signed in signed]
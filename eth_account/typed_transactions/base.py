@@ -2,10 +2,20 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from concurrent.futures import (
+    Executor,
+)
+import copy
 import hashlib
 import os
+import threading
 from typing import (
     Any,
+    TypeVar,
 )
 
 from ckzg import (
@@ -31,6 +41,7 @@ from eth_utils.curried import (
     hexstr_if_str,
 )
 from eth_utils.toolz import (
+    dissoc,
     identity,
     merge,
 )
@@ -48,6 +59,12 @@ from eth_account._utils.validation import (
     LEGACY_TRANSACTION_FORMATTERS,
 )
 
+from .blob_sidecar_cache import (
+    BlobSidecar,
+    BlobSidecarCache,
+    blob_sidecar_key,
+)
+
 TYPED_TRANSACTION_FORMATTERS = merge(
     LEGACY_TRANSACTION_FORMATTERS,
     {
@@ -96,6 +113,128 @@ TRUSTED_SETUP = os.path.join(
 )
 VERSIONED_HASH_VERSION_KZG = b"\x01"
 
+_trusted_setup: Any | None = None
+_trusted_setup_lock = threading.Lock()
+
+
+def get_kzg_trusted_setup() -> Any:
+    """
+    Return the process-wide KZG trusted setup, loading it on first use.
+
+    Parsing the trusted setup file is expensive, so the loaded handle is shared by
+    every KZG computation in the process. Loading is guarded by a lock so that
+    concurrent first calls only parse the file once.
+    """
+    global _trusted_setup
+    trusted_setup = _trusted_setup
+    if trusted_setup is None:
+        with _trusted_setup_lock:
+            if _trusted_setup is None:
+                _trusted_setup = load_trusted_setup(TRUSTED_SETUP, 0)
+            trusted_setup = _trusted_setup
+    return trusted_setup
+
+
+def preload_kzg_trusted_setup() -> None:
+    """
+    Load the shared KZG trusted setup eagerly, e.g. at service start, so that the
+    first blob transaction signed does not pay the loading cost.
+    """
+    get_kzg_trusted_setup()
+
+
+def release_kzg_trusted_setup() -> None:
+    """
+    Drop the shared KZG trusted setup. It is loaded again on the next KZG
+    computation that needs it.
+    """
+    global _trusted_setup
+    with _trusted_setup_lock:
+        _trusted_setup = None
+
+
+_kzg_executor: Executor | None = None
+
+T = TypeVar("T")
+
+
+def set_kzg_executor(executor: Executor | None) -> None:
+    """
+    Compute the KZG commitments, proofs and cell proofs of a transaction's blobs
+    concurrently on the given executor, one task per blob.
+
+    Use a ``concurrent.futures.ThreadPoolExecutor`` or a
+    ``concurrent.futures.ProcessPoolExecutor`` and size it with ``max_workers``.
+    Results are always returned in blob order, identical to the serial path. The
+    executor is not shut down by this library. Pass ``None`` to go back to
+    computing blobs serially, which is the default.
+    """
+    global _kzg_executor
+    _kzg_executor = executor
+
+
+def get_kzg_executor() -> Executor | None:
+    """
+    Return the executor used for per-blob KZG computations, if any.
+    """
+    return _kzg_executor
+
+
+def _map_over_blobs(func: Callable[..., T], *iterables: Iterable[Any]) -> list[T]:
+    executor = _kzg_executor
+    if executor is None:
+        return list(map(func, *iterables))
+    return list(executor.map(func, *iterables))
+
+
+# KZG computations are module-level functions so they can be sent to process pools.
+def _compute_blob_commitment(blob: bytes) -> bytes:
+    return bytes(blob_to_kzg_commitment(blob, get_kzg_trusted_setup()))
+
+
+def _compute_blob_proof(blob: bytes, commitment: bytes) -> bytes:
+    return bytes(compute_blob_kzg_proof(blob, commitment, get_kzg_trusted_setup()))
+
+
+def _compute_blob_cell_proofs(blob: bytes) -> list[bytes]:
+    _cells, cell_proofs = compute_cells_and_kzg_proofs(blob, get_kzg_trusted_setup())
+    return [bytes(cell_proof) for cell_proof in cell_proofs]
+
+
+def _compute_blob_sidecar(blob: bytes) -> BlobSidecar:
+    commitment = _compute_blob_commitment(blob)
+    return BlobSidecar(
+        commitment=commitment,
+        proof=_compute_blob_proof(blob, commitment),
+        cell_proofs=tuple(_compute_blob_cell_proofs(blob)),
+        versioned_hash=(
+            VERSIONED_HASH_VERSION_KZG + hashlib.sha256(commitment).digest()[1:]
+        ),
+    )
+
+
+_blob_sidecar_cache: BlobSidecarCache | None = None
+
+
+def set_blob_sidecar_cache(cache: BlobSidecarCache | None) -> None:
+    """
+    Look up the commitment, proofs and versioned hash of every blob in ``cache``
+    before computing them, keyed by the hash of the blob bytes.
+
+    On a miss, the whole sidecar of the blob is computed at once and stored, so
+    that later transactions carrying the same blob skip all KZG work. Pass ``None``
+    to stop caching, which is the default.
+    """
+    global _blob_sidecar_cache
+    _blob_sidecar_cache = cache
+
+
+def get_blob_sidecar_cache() -> BlobSidecarCache | None:
+    """
+    Return the blob sidecar cache in use, if any.
+    """
+    return _blob_sidecar_cache
+
 
 class _BlobDataElement(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -111,14 +250,57 @@ class _BlobDataElement(BaseModel):
         return HexStr(f"0x{self.as_bytes().hex()}")
 
 
+BLOB_SIZE = 4096 * 32
+
+
+def _read_blob_file(path: "os.PathLike[str]") -> bytes:
+    # check the size first so that a wrong file is rejected without reading it
+    if os.stat(path).st_size != BLOB_SIZE:
+        raise ValidationError(
+            f"Invalid Blob size in {os.fspath(path)!r}. Blob data must be comprised "
+            "of 4096 32-byte field elements."
+        )
+    with open(path, "rb") as blob_file:
+        return blob_file.read()
+
+
+def _blob_to_bytes(blob: Any) -> bytes:
+    if type(blob) is bytes:
+        return blob
+    elif isinstance(blob, str):
+        return bytes(HexBytes(blob))
+    elif isinstance(blob, os.PathLike):
+        return _read_blob_file(blob)
+    # Copy other buffers (``bytearray``, ``memoryview``, ``mmap``, ``HexBytes``)
+    # exactly once, since ckzg only accepts immutable ``bytes``.
+    return bytes(blob)
+
+
 class Blob(_BlobDataElement):
     """
     Represents a Blob.
+
+    The blob data is held as plain ``bytes``, so it is handed to ckzg and to the
+    RLP encoder without further copies. Besides ``bytes`` and hex strings, any
+    object supporting the buffer protocol is accepted, such as a ``bytearray``, a
+    ``memoryview`` or an ``mmap``, as well as the path to a file holding the raw
+    blob, given as an ``os.PathLike`` such as ``pathlib.Path``. Plain strings are
+    always read as hex, never as paths.
     """
 
+    # type ignored bc the field is narrowed to ``bytes`` to avoid ``HexBytes`` copies
+    data: bytes  # type: ignore[assignment]
+
+    @field_validator("data", mode="before")
+    def normalize_data(cls, v: Any) -> bytes:
+        return _blob_to_bytes(v)
+
+    def as_hexbytes(self) -> HexBytes:
+        return HexBytes(self.data)
+
     @field_validator("data")
     def validate_data(cls, v: HexBytes | bytes) -> HexBytes | bytes:
-        if len(v) != 4096 * 32:
+        if len(v) != BLOB_SIZE:
             raise ValidationError(
                 "Invalid Blob size. Blob data must be comprised of 4096 32-byte "
                 "field elements."
@@ -207,11 +389,49 @@ class BlobPooledTransactionData(BaseModel):
             raise ValidationError("Blob transactions cannot contain more than 6 blobs.")
         return v
 
+    def _load_sidecars(self, cache: BlobSidecarCache) -> None:
+        blobs = [blob.data for blob in self.blobs]
+        keys = [blob_sidecar_key(blob) for blob in blobs]
+        cached_sidecars = [cache.get(key) for key in keys]
+        missing = [
+            index for index, sidecar in enumerate(cached_sidecars) if sidecar is None
+        ]
+        computed_sidecars = dict(
+            zip(
+                missing,
+                _map_over_blobs(
+                    _compute_blob_sidecar, [blobs[index] for index in missing]
+                ),
+            )
+        )
+        for index, sidecar in computed_sidecars.items():
+            cache.put(keys[index], sidecar)
+        sidecars = [
+            computed_sidecars[index] if sidecar is None else sidecar
+            for index, sidecar in enumerate(cached_sidecars)
+        ]
+
+        self._commitments = [
+            BlobKZGCommitment(data=HexBytes(sidecar.commitment)) for sidecar in sidecars
+        ]
+        self._proofs = [BlobProof(data=HexBytes(sidecar.proof)) for sidecar in sidecars]
+        self._cell_proofs = [
+            BlobCellProof(data=HexBytes(cell_proof))
+            for sidecar in sidecars
+            for cell_proof in sidecar.cell_proofs
+        ]
+        self._versioned_hashes = [
+            BlobVersionedHash(data=HexBytes(sidecar.versioned_hash))
+            for sidecar in sidecars
+        ]
+
     # type ignored bc mypy does not support decorated properties
     # https://github.com/python/mypy/issues/1362
     @computed_field  # type: ignore
     @property
     def versioned_hashes(self) -> list[BlobVersionedHash]:
+        if self._versioned_hashes is None and _blob_sidecar_cache is not None:
+            self._load_sidecars(_blob_sidecar_cache)
         if self._versioned_hashes is None:
             self._versioned_hashes = [
                 BlobVersionedHash(
@@ -226,16 +446,14 @@ class BlobPooledTransactionData(BaseModel):
     @computed_field  # type: ignore
     @property
     def commitments(self) -> list[BlobKZGCommitment]:
+        if self._commitments is None and _blob_sidecar_cache is not None:
+            self._load_sidecars(_blob_sidecar_cache)
         if self._commitments is None:
             self._commitments = [
-                BlobKZGCommitment(
-                    data=HexBytes(
-                        blob_to_kzg_commitment(
-                            blob.data, load_trusted_setup(TRUSTED_SETUP, 0)
-                        )
-                    )
+                BlobKZGCommitment(data=HexBytes(commitment))
+                for commitment in _map_over_blobs(
+                    _compute_blob_commitment, [blob.data for blob in self.blobs]
                 )
-                for blob in self.blobs
             ]
         return self._commitments
 
@@ -244,18 +462,16 @@ class BlobPooledTransactionData(BaseModel):
     @computed_field  # type: ignore
     @property
     def proofs(self) -> list[BlobProof]:
+        if self._proofs is None and _blob_sidecar_cache is not None:
+            self._load_sidecars(_blob_sidecar_cache)
         if self._proofs is None:
             self._proofs = [
-                BlobProof(
-                    data=HexBytes(
-                        compute_blob_kzg_proof(
-                            blob.data,
-                            commitment.data,
-                            load_trusted_setup(TRUSTED_SETUP, 0),
-                        )
-                    )
+                BlobProof(data=HexBytes(proof))
+                for proof in _map_over_blobs(
+                    _compute_blob_proof,
+                    [blob.data for blob in self.blobs],
+                    [commitment.data for commitment in self.commitments],
                 )
-                for blob, commitment in zip(self.blobs, self.commitments)
             ]
         return self._proofs
 
@@ -264,19 +480,24 @@ class BlobPooledTransactionData(BaseModel):
     @computed_field  # type: ignore
     @property
     def cell_proofs(self) -> list[BlobCellProof]:
+        if self._cell_proofs is None and _blob_sidecar_cache is not None:
+            self._load_sidecars(_blob_sidecar_cache)
         if self._cell_proofs is None:
-            self._cell_proofs = []
-            for blob in self.blobs:
-                cells, cell_proofs = compute_cells_and_kzg_proofs(
-                    blob.data, load_trusted_setup(TRUSTED_SETUP, 0)
-                )
-                self._cell_proofs.extend(
-                    BlobCellProof(data=HexBytes(cell_proof))
-                    for cell_proof in cell_proofs
+            self._cell_proofs = [
+                BlobCellProof(data=HexBytes(cell_proof))
+                for blob_cell_proofs in _map_over_blobs(
+                    _compute_blob_cell_proofs, [blob.data for blob in self.blobs]
                 )
+                for cell_proof in blob_cell_proofs
+            ]
         return self._cell_proofs
 
 
+TTypedTransaction = TypeVar(
+    "TTypedTransaction", bound="_TypedTransactionImplementation"
+)
+
+
 class _TypedTransactionImplementation(ABC):
     """
     Abstract class that every typed transaction must implement.
@@ -284,6 +505,21 @@ class _TypedTransactionImplementation(ABC):
     """
 
     blob_data: BlobPooledTransactionData | None = None
+    dictionary: dict[str, Any]
+
+    def with_signature(
+        self: TTypedTransaction, v: int, r: int, s: int
+    ) -> TTypedTransaction:
+        """
+        Return a copy of this transaction carrying the signature ``(v, r, s)``.
+
+        The fields were already validated and formatted when this transaction was
+        built, so they are not validated again.
+        """
+        signed_transaction = copy.copy(self)
+        signed_transaction.dictionary = dissoc(self.as_dict(), "type")
+        signed_transaction.dictionary.update(v=v, r=r, s=s)
+        return signed_transaction
 
     @abstractmethod
     def hash(self) -> bytes:
@@ -0,0 +1,189 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+import hashlib
+import os
+import tempfile
+import threading
+from typing import (
+    NamedTuple,
+)
+
+from eth_account._utils.caching import (
+    LRUCache,
+)
+
+_KZG_COMMITMENT_SIZE = 48
+_KZG_PROOF_SIZE = 48
+_VERSIONED_HASH_SIZE = 32
+# the number of cells, and so of cell proofs, per blob (EIP-7594)
+_CELL_PROOFS_PER_BLOB = 128
+
+
+class BlobSidecar(NamedTuple):
+    """
+    The KZG data computed from a single blob.
+    """
+
+    commitment: bytes
+    proof: bytes
+    cell_proofs: tuple[bytes, ...]
+    versioned_hash: bytes
+
+    def to_bytes(self) -> bytes:
+        return b"".join(
+            (self.commitment, self.proof, self.versioned_hash) + self.cell_proofs
+        )
+
+    @classmethod
+    def from_bytes(cls, encoded: bytes) -> "BlobSidecar":
+        header_size = _KZG_COMMITMENT_SIZE + _KZG_PROOF_SIZE + _VERSIONED_HASH_SIZE
+        if len(encoded) != header_size + _KZG_PROOF_SIZE * _CELL_PROOFS_PER_BLOB:
+            raise ValueError(f"Invalid encoded blob sidecar of {len(encoded)} bytes")
+        commitment_end = _KZG_COMMITMENT_SIZE
+        proof_end = commitment_end + _KZG_PROOF_SIZE
+        return cls(
+            commitment=encoded[:commitment_end],
+            proof=encoded[commitment_end:proof_end],
+            versioned_hash=encoded[proof_end:header_size],
+            cell_proofs=tuple(
+                encoded[start : start + _KZG_PROOF_SIZE]
+                for start in range(header_size, len(encoded), _KZG_PROOF_SIZE)
+            ),
+        )
+
+
+def blob_sidecar_key(blob: bytes) -> bytes:
+    """
+    Return the content address of a blob: the sha256 digest of its bytes.
+    """
+    return hashlib.sha256(blob).digest()
+
+
+def _sidecar_size(sidecar: BlobSidecar) -> int:
+    return (
+        _KZG_COMMITMENT_SIZE
+        + _KZG_PROOF_SIZE
+        + _VERSIONED_HASH_SIZE
+        + _KZG_PROOF_SIZE * len(sidecar.cell_proofs)
+    )
+
+
+class BlobSidecarStore(ABC):
+    """
+    A persistent tier behind a :class:`BlobSidecarCache`, e.g. on disk.
+    """
+
+    @abstractmethod
+    def get(self, key: bytes) -> BlobSidecar | None:
+        """
+        Return the sidecar stored for the blob hash ``key``, if any.
+        """
+
+    @abstractmethod
+    def put(self, key: bytes, sidecar: BlobSidecar) -> None:
+        """
+        Store the sidecar for the blob hash ``key``.
+        """
+
+
+class DirectoryBlobSidecarStore(BlobSidecarStore):
+    """
+    Stores each blob sidecar as a file named after its blob hash in ``directory``.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: bytes) -> str:
+        return os.path.join(self.directory, f"{key.hex()}.sidecar")
+
+    def get(self, key: bytes) -> BlobSidecar | None:
+        try:
+            with open(self._path(key), "rb") as sidecar_file:
+                return BlobSidecar.from_bytes(sidecar_file.read())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: bytes, sidecar: BlobSidecar) -> None:
+        # write to a temporary file first so readers never see a partial sidecar
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(sidecar.to_bytes())
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class BlobSidecarCacheInfo(NamedTuple):
+    hits: int
+    store_hits: int
+    misses: int
+    currsize: int
+    size_bytes: int
+
+
+class BlobSidecarCache:
+    """
+    A bounded LRU cache of blob sidecars, keyed by the sha256 hash of the blob.
+
+    Re-signing a transaction that carries the same blobs, e.g. a fee bump, then
+    only costs a hash per blob instead of recomputing its KZG commitment and
+    proofs.
+
+    :param int max_entries: the maximum number of sidecars kept in memory
+    :param int max_bytes: optional limit on the total size of the sidecars kept in
+        memory, roughly 6KB per blob
+    :param BlobSidecarStore store: optional persistent tier, consulted on memory
+        misses and written through on every insert
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int | None = None,
+        store: BlobSidecarStore | None = None,
+    ) -> None:
+        self._memory: LRUCache[bytes, BlobSidecar] = LRUCache(
+            max_entries, max_bytes=max_bytes, sizeof=_sidecar_size
+        )
+        self.store = store
+        self._lock = threading.Lock()
+        self.store_hits = 0
+
+    def get(self, key: bytes) -> BlobSidecar | None:
+        sidecar = self._memory.get(key)
+        if sidecar is None and self.store is not None:
+            sidecar = self.store.get(key)
+            if sidecar is not None:
+                with self._lock:
+                    self.store_hits += 1
+                self._memory.put(key, sidecar)
+        return sidecar
+
+    def put(self, key: bytes, sidecar: BlobSidecar) -> None:
+        self._memory.put(key, sidecar)
+        if self.store is not None:
+            self.store.put(key, sidecar)
+
+    def clear(self) -> None:
+        """
+        Empty the in-memory tier and reset the counters. The store is left as is.
+        """
+        self._memory.clear()
+        with self._lock:
+            self.store_hits = 0
+
+    def cache_info(self) -> BlobSidecarCacheInfo:
+        memory_info = self._memory.cache_info()
+        return BlobSidecarCacheInfo(
+            hits=memory_info.hits,
+            store_hits=self.store_hits,
+            misses=memory_info.misses - self.store_hits,
+            currsize=memory_info.currsize,
+            size_bytes=memory_info.size_bytes,
+        )
@@ -48,6 +48,7 @@ from eth_account.typed_transactions.base import (
     TYPED_TRANSACTION_FORMATTERS,
     Blob,
     BlobPooledTransactionData,
+    _blob_to_bytes,
     _TypedTransactionImplementation,
 )
 from eth_account.types import (
@@ -163,7 +164,7 @@ class BlobTransaction(_TypedTransactionImplementation):
 
         if blobs is not None:
             self.blob_data = BlobPooledTransactionData(
-                blobs=[Blob(data=HexBytes(blob_data)) for blob_data in blobs]
+                blobs=[Blob(data=_blob_to_bytes(blob_data)) for blob_data in blobs]
             )
             if "blobVersionedHashes" in dictionary:
                 self._validate_versioned_hashes_against_blob_data(
@@ -2,6 +2,8 @@ from collections.abc import (
     Sequence,
 )
 import enum
+import mmap
+import os
 from typing import (
     Any,
     TypedDict,
@@ -19,7 +21,9 @@ from hexbytes import (
     HexBytes,
 )
 
-Blobs = Sequence[Union[bytes, HexBytes]]
+Blobs = Sequence[
+    Union[bytes, bytearray, memoryview, mmap.mmap, HexBytes, "os.PathLike[str]"]
+]
 Bytes32 = bytes
 PrivateKeyType = Union[Bytes32, int, HexStr, PrivateKey]
 
@@ -0,0 +1,81 @@
+"""
+Compare serial and executor-backed KZG computation for blob transactions.
+
+Usage: python scripts/benchmark/blob_kzg.py [--workers N] [--rounds N]
+"""
+import argparse
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import os
+import time
+
+from eth_account import (
+    Account,
+)
+from eth_account.typed_transactions.base import (
+    preload_kzg_trusted_setup,
+    set_kzg_executor,
+)
+
+TX_DICT = {
+    "chainId": 1,
+    "nonce": 1,
+    "maxPriorityFeePerGas": 50,
+    "maxFeePerGas": 1000,
+    "gas": 100000,
+    "to": "0x45Ae5777c9b35Eb16280e423b0d7c91C06C66B58",
+    "value": 1,
+    "data": "0x52fdfc072182654f",
+    "maxFeePerBlobGas": 100,
+}
+KEY = "0x4646464646464646464646464646464646464646464646464646464646464646"
+
+
+def random_blob() -> bytes:
+    # keep every field element below the BLS modulus by zeroing its top byte
+    return b"".join(b"\x00" + os.urandom(31) for _ in range(4096))
+
+
+def time_signing(blobs: list[bytes], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        Account.sign_transaction(TX_DICT, KEY, blobs=blobs)
+    return (time.perf_counter() - start) / rounds
+
+
+def _warm_up_worker() -> None:
+    preload_kzg_trusted_setup()
+
+
+def run(label: str, executor: Executor | None, rounds: int) -> None:
+    set_kzg_executor(executor)
+    try:
+        for blob_count in range(1, 7):
+            blobs = [random_blob() for _ in range(blob_count)]
+            seconds = time_signing(blobs, rounds)
+            print(f"{label:>8} | {blob_count} blob(s) | {seconds * 1000:9.1f} ms/tx")
+    finally:
+        set_kzg_executor(None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    preload_kzg_trusted_setup()
+    run("serial", None, args.rounds)
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        run("threads", executor, args.rounds)
+    with ProcessPoolExecutor(
+        max_workers=args.workers, initializer=_warm_up_worker
+    ) as executor:
+        run("procs", executor, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
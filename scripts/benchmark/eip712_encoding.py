@@ -0,0 +1,143 @@
+"""
+Compare hashing EIP-712 messages with eth_abi.encode for every struct and array
+item with packing their 32-byte words directly, as hash_eip712_message now does.
+
+Covers a deeply nested message and messages with large arrays, through both the
+plain types and the compiled types.
+
+Usage: python scripts/benchmark/eip712_encoding.py [--rounds N] [--depth N]
+    [--array-size N]
+"""
+import argparse
+from collections.abc import (
+    Callable,
+    Iterable,
+    Sequence,
+)
+import time
+from typing import (
+    Any,
+)
+
+from eth_abi import (
+    encode,
+)
+
+from eth_account._utils.encode_typed_data import (
+    encoding_and_hashing,
+)
+from eth_account.messages import (
+    compile_eip712_types,
+)
+
+PERSON = {"name": "Cow", "wallet": "0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"}
+
+
+def nested_message(depth: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    types = {
+        "Node": [
+            {"name": "id", "type": "uint256"},
+            {"name": "owner", "type": "address"},
+            {"name": "label", "type": "string"},
+            {"name": "child", "type": "Node"},
+        ],
+    }
+    message: dict[str, Any] | None = None
+    for level in range(depth):
+        message = {
+            "id": level,
+            "owner": PERSON["wallet"],
+            "label": f"level {level}",
+            "child": message,
+        }
+    assert message is not None
+    return types, message
+
+
+def struct_array_message(size: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    types = {
+        "Person": [
+            {"name": "name", "type": "string"},
+            {"name": "wallet", "type": "address"},
+        ],
+        "Mail": [
+            {"name": "from", "type": "Person"},
+            {"name": "cc", "type": "Person[]"},
+            {"name": "contents", "type": "string"},
+        ],
+    }
+    message = {"from": PERSON, "cc": [PERSON] * size, "contents": "Hello, Bob!"}
+    return types, message
+
+
+def atomic_array_message(size: int) -> tuple[dict[str, Any], dict[str, Any]]:
+    types = {
+        "Batch": [
+            {"name": "amounts", "type": "uint256[]"},
+            {"name": "recipients", "type": "address[]"},
+            {"name": "ids", "type": "bytes32[]"},
+        ],
+    }
+    message = {
+        "amounts": list(range(size)),
+        "recipients": [PERSON["wallet"]] * size,
+        "ids": [i.to_bytes(32, "big") for i in range(size)],
+    }
+    return types, message
+
+
+def abi_encode(abi_types: Iterable[str], values: Sequence[int | bytes]) -> bytes:
+    return encode([abi_type for abi_type, _ in zip(abi_types, values)], values)
+
+
+def abi_encode_word(abi_type: str, value: int | bytes) -> bytes:
+    return encode([abi_type], [value])
+
+
+def per_call(func: Callable[..., Any], args: tuple[Any, ...], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(*args)
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=64)
+    parser.add_argument("--array-size", type=int, default=512)
+    args = parser.parse_args()
+
+    cases = [
+        (f"nested, depth {args.depth}", *nested_message(args.depth)),
+        (f"Person[{args.array_size}]", *struct_array_message(args.array_size)),
+        (f"atomic arrays [{args.array_size}]", *atomic_array_message(args.array_size)),
+    ]
+    pack_words = encoding_and_hashing.pack_words
+    encode_word = encoding_and_hashing.encode_word
+    for label, types, message in cases:
+        compiled_types = compile_eip712_types(types)
+        for kind, message_types in (("plain", types), ("compiled", compiled_types)):
+            hash_args = (message_types, message)
+            encoding_and_hashing.pack_words = abi_encode  # type: ignore[assignment]
+            encoding_and_hashing.encode_word = abi_encode_word
+            try:
+                expected = encoding_and_hashing.hash_eip712_message(*hash_args)
+                slow = per_call(
+                    encoding_and_hashing.hash_eip712_message, hash_args, args.rounds
+                )
+            finally:
+                encoding_and_hashing.pack_words = pack_words
+                encoding_and_hashing.encode_word = encode_word
+            assert encoding_and_hashing.hash_eip712_message(*hash_args) == expected
+            fast = per_call(
+                encoding_and_hashing.hash_eip712_message, hash_args, args.rounds
+            )
+            print(
+                f"{label:>24}, {kind:>8} | eth_abi {slow * 1_000:8.2f} ms"
+                f" | words {fast * 1_000:8.2f} ms | {slow / fast:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare getting the signing hash of typed transactions through TypedTransaction
+with hashing their RLP items directly, as recover_transaction now does.
+
+Usage: python scripts/benchmark/recover_transaction.py [--rounds N]
+"""
+import argparse
+import time
+from typing import (
+    Any,
+)
+
+from hexbytes import (
+    HexBytes,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account._utils.signing import (
+    typed_transaction_hash_and_vrs,
+)
+from eth_account.typed_transactions import (
+    TypedTransaction,
+)
+
+KEY = "0x4646464646464646464646464646464646464646464646464646464646464646"
+BASE_TX = {
+    "chainId": 1,
+    "nonce": 0,
+    "gas": 100000,
+    "to": "0x45Ae5777c9b35Eb16280e423b0d7c91C06C66B58",
+    "value": 1,
+    "data": "0x52fdfc072182654f",
+    "accessList": [
+        {
+            "address": "0x0000000000000000000000000000000000000001",
+            "storageKeys": ["0x" + "01" * 32, "0x" + "02" * 32],
+        }
+    ],
+}
+FEES = {"maxFeePerGas": 1000, "maxPriorityFeePerGas": 50}
+TRANSACTIONS: list[tuple[str, dict[str, Any], Any]] = [
+    ("type 1", dict(BASE_TX, gasPrice=1000), None),
+    ("type 2", dict(BASE_TX, **FEES), None),
+    (
+        "type 3",
+        # BlobTransaction.from_bytes rejects its own non-empty access lists
+        dict(BASE_TX, accessList=[], maxFeePerBlobGas=100, **FEES),
+        [b"\x00" * 131072],
+    ),
+    (
+        "type 4",
+        dict(
+            BASE_TX,
+            authorizationList=[
+                Account.sign_authorization(
+                    {
+                        "chainId": 1,
+                        "address": "0x45Ae5777c9b35Eb16280e423b0d7c91C06C66B58",
+                        "nonce": 1,
+                    },
+                    KEY,
+                )
+            ],
+            **FEES,
+        ),
+        None,
+    ),
+]
+
+
+def per_call(func: Any, arg: Any, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(arg)
+    return (time.perf_counter() - start) / rounds
+
+
+def via_typed_transaction(raw_transaction: HexBytes) -> Any:
+    typed_transaction = TypedTransaction.from_bytes(raw_transaction)
+    return typed_transaction.hash(), typed_transaction.vrs()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    for label, transaction, blobs in TRANSACTIONS:
+        raw_transaction = Account.sign_transaction(
+            transaction, KEY, blobs=blobs
+        ).raw_transaction
+        # a pooled blob transaction recomputes its KZG sidecar when decoded
+        rounds = max(1, args.rounds // 100) if blobs else args.rounds
+        slow = per_call(via_typed_transaction, raw_transaction, rounds)
+        fast = per_call(typed_transaction_hash_and_vrs, bytes(raw_transaction), rounds)
+        print(
+            f"{label} | from_bytes {slow * 1_000_000:10.1f} us"
+            f" | rlp items {fast * 1_000_000:8.1f} us | {slow / fast:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
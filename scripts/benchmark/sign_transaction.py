@@ -0,0 +1,73 @@
+"""
+Measure the per-signature cost of ``sign_transaction`` with a raw private key.
+
+Usage: python scripts/benchmark/sign_transaction.py [--rounds N]
+"""
+import argparse
+import time
+from typing import (
+    Any,
+)
+
+from eth_account import (
+    Account,
+)
+
+KEY = "0x4646464646464646464646464646464646464646464646464646464646464646"
+TX_DICT = {
+    "chainId": 1,
+    "nonce": 0,
+    "maxPriorityFeePerGas": 50,
+    "maxFeePerGas": 1000,
+    "gas": 21000,
+    "to": "0x45Ae5777c9b35Eb16280e423b0d7c91C06C66B58",
+    "value": 1,
+}
+
+
+def time_signing(sign: Any, transaction: dict[str, Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        sign(transaction)
+    return (time.perf_counter() - start) / rounds
+
+
+def report(label: str, seconds: float) -> None:
+    print(f"{label:>32} | {seconds * 1_000_000:9.1f} us/tx")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    with_from = dict(TX_DICT, **{"from": Account.from_key(KEY).address})
+
+    def sign_with_raw_key(transaction: dict[str, Any]) -> Any:
+        return Account.sign_transaction(transaction, KEY)
+
+    for cached in (False, True):
+        if cached:
+            Account.enable_key_cache()
+        label = "raw key, cached" if cached else "raw key"
+        report(label, time_signing(sign_with_raw_key, TX_DICT, args.rounds))
+        report(
+            f"{label}, with from",
+            time_signing(sign_with_raw_key, with_from, args.rounds),
+        )
+    Account.disable_key_cache()
+
+    local_account = Account.from_key(KEY)
+    report(
+        "LocalAccount",
+        time_signing(local_account.sign_transaction, TX_DICT, args.rounds),
+    )
+
+    batch = [dict(TX_DICT, nonce=nonce) for nonce in range(args.rounds)]
+    start = time.perf_counter()
+    Account.sign_transactions(batch, KEY)
+    report("sign_transactions, raw key", (time.perf_counter() - start) / args.rounds)
+
+
+if __name__ == "__main__":
+    main()
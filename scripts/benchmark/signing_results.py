@@ -0,0 +1,100 @@
+"""
+Compare the full and compact result types of the batch signing methods.
+
+For each method, report how many signed results are produced per second, and
+how many bytes the results hold on to per signature.
+
+Usage: python scripts/benchmark/signing_results.py [--count N]
+"""
+import argparse
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Callable,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account.messages import (
+    encode_defunct,
+)
+
+KEY = "0x4646464646464646464646464646464646464646464646464646464646464646"
+TX_DICT = {
+    "chainId": 1,
+    "maxPriorityFeePerGas": 50,
+    "maxFeePerGas": 1000,
+    "gas": 21000,
+    "to": "0x45Ae5777c9b35Eb16280e423b0d7c91C06C66B58",
+    "value": 1,
+}
+AUTHORIZATION = {
+    "chainId": 1,
+    "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+}
+
+
+def measure(
+    sign_batch: Callable[..., list[Any]], *args: Any, **kwargs: Any
+) -> tuple[float, float]:
+    start = time.perf_counter()
+    count = len(sign_batch(*args, **kwargs))
+    per_second = count / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    results = sign_batch(*args, **kwargs)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return per_second, retained / count
+
+
+def report(label: str, per_second: float, bytes_per_signature: float) -> None:
+    print(
+        f"{label:>36} | {per_second:9.0f} results/s"
+        f" | {bytes_per_signature:7.0f} bytes/signature"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200)
+    args = parser.parse_args()
+
+    # parse the key up front, so only signing and result building is measured
+    key = Account._parse_private_key(KEY)
+    transactions = [dict(TX_DICT, nonce=nonce) for nonce in range(args.count)]
+    messages = [encode_defunct(text=f"message {i}") for i in range(args.count)]
+    authorizations = [dict(AUTHORIZATION, nonce=nonce) for nonce in range(args.count)]
+
+    for compact in (False, True):
+        label = "compact" if compact else "full"
+        report(
+            f"sign_transactions, {label}",
+            *measure(Account.sign_transactions, transactions, key, compact=compact),
+        )
+        report(
+            f"sign_messages, {label}",
+            *measure(Account.sign_messages, messages, key, compact=compact),
+        )
+
+    def sign_authorizations_one_at_a_time() -> list[Any]:
+        return [
+            Account.sign_authorization(authorization, key)
+            for authorization in authorizations
+        ]
+
+    report(
+        "sign_authorization, one at a time",
+        *measure(sign_authorizations_one_at_a_time),
+    )
+    report(
+        "sign_authorizations, compact",
+        *measure(Account.sign_authorizations, authorizations, key),
+    )
+
+
+if __name__ == "__main__":
+    main()
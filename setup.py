@@ -52,6 +52,7 @@ setup(
     install_requires=[
         "bitarray>=2.4.0",
         "eth-abi>=4.0.0-b.2",
+        "eth-hash>=0.3.1",
         "eth-keyfile>=0.9.0",
         "eth-keys>=0.4.0",
         "eth-rlp>=2.1.0",
@@ -1,4 +1,9 @@
 import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import io
 import os
 
 from eth_keyfile.keyfile import (
@@ -7,8 +12,13 @@ from eth_keyfile.keyfile import (
 from eth_keys import (
     keys,
 )
+from eth_keys.datatypes import (
+    Signature,
+)
 from eth_utils import (
+    ValidationError,
     is_checksum_address,
+    keccak,
     to_bytes,
     to_checksum_address,
     to_hex,
@@ -24,11 +34,18 @@ from hypothesis import (
     given,
     strategies as st,
 )
+import rlp
 
 from eth_account import (
     Account,
 )
+from eth_account._utils.encode_typed_data import (
+    encoding_and_hashing,
+)
 from eth_account.messages import (
+    ParallelArrayHashing,
+    StructHashMemo,
+    compile_eip712_types,
     defunct_hash_message,
     encode_defunct,
     encode_intended_validator,
@@ -330,6 +347,116 @@ def test_eth_account_recover_signature_bytes(acct, signature_bytes):
     assert from_account == "0x2c7536E3605D9C16a7a3D7b1898e529396a65c23"
 
 
+def test_eth_account_recover_messages(acct):
+    messages = [encode_defunct(text=f"message {i}") for i in range(4)]
+    signatures = [
+        acct.sign_message(message, key).signature
+        for message, key in zip(
+            messages, [PRIVATE_KEY_AS_BYTES, PRIVATE_KEY_AS_BYTES_ALT] * 2
+        )
+    ]
+    # mix the accepted signature formats
+    signatures[1] = signatures[1].to_0x_hex()
+    signatures[2] = bytes(signatures[2])
+    expected = [ACCT_ADDRESS, ACCT_ADDRESS_ALT] * 2
+
+    assert acct.recover_messages(messages, signatures) == expected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            acct.recover_messages(messages, signatures, executor=executor) == expected
+        )
+
+    with pytest.raises(ValueError, match="exactly one signature"):
+        acct.recover_messages(messages, signatures[:-1])
+
+
+@pytest.mark.parametrize(
+    "expected_signer",
+    (
+        ACCT_ADDRESS,
+        ACCT_ADDRESS.lower(),
+        to_bytes(hexstr=ACCT_ADDRESS),
+        PRIVATE_KEY_AS_OBJ.public_key,
+    ),
+    ids=["checksum", "lowercase", "bytes", "public_key"],
+)
+def test_eth_account_verify_message(acct, expected_signer):
+    message = encode_defunct(text="I♥SF")
+    signed = acct.sign_message(message, PRIVATE_KEY_AS_BYTES)
+    other_signed = acct.sign_message(message, PRIVATE_KEY_AS_BYTES_ALT)
+
+    assert acct.verify_message(message, signed.signature, expected_signer) is True
+    assert acct.verify_message(message, signed.signature.to_0x_hex(), expected_signer)
+    assert not acct.verify_message(message, other_signed.signature, expected_signer)
+    assert not acct.verify_message(
+        encode_defunct(text="I♥NYC"), signed.signature, expected_signer
+    )
+
+    assert acct.verify_hash(signed.message_hash, signed.signature, expected_signer)
+    assert not acct.verify_hash(
+        signed.message_hash, other_signed.signature, expected_signer
+    )
+
+    assert acct.verify_messages(
+        [message, message, encode_defunct(text="I♥NYC")],
+        [signed.signature, other_signed.signature, signed.signature],
+        expected_signer,
+    ) == [True, False, False]
+
+
+def test_eth_account_verify_invalid_input(acct):
+    message = encode_defunct(text="I♥SF")
+    signed = acct.sign_message(message, PRIVATE_KEY_AS_BYTES)
+    with pytest.raises(ValueError, match="exactly 32-bytes"):
+        acct.verify_hash(signed.message_hash[:31], signed.signature, ACCT_ADDRESS)
+    with pytest.raises(ValueError, match="exactly one signature"):
+        acct.verify_messages([message, message], [signed.signature], ACCT_ADDRESS)
+
+
+def test_eth_account_recovery_cache(acct, monkeypatch):
+    recoveries = []
+    original_ecdsa_recover = acct._keys.ecdsa_recover
+
+    def counting_ecdsa_recover(message_hash, signature):
+        recoveries.append(message_hash)
+        return original_ecdsa_recover(message_hash, signature)
+
+    monkeypatch.setattr(acct._keys, "ecdsa_recover", counting_ecdsa_recover)
+    message = encode_defunct(text="I♥SF")
+    signed_message = acct.sign_message(message, PRIVATE_KEY_AS_BYTES)
+    raw_txn = ETH_TEST_TRANSACTIONS[0]["signed"]
+    expected_sender = acct.recover_transaction(raw_txn)
+    assert acct.recovery_cache_info() is None
+
+    Account.enable_recovery_cache(maxsize=8)
+    try:
+        recoveries.clear()
+        for _ in range(3):
+            assert (
+                acct.recover_message(message, signature=signed_message.signature)
+                == ACCT_ADDRESS
+            )
+            # the same signature, with a chain-naive v
+            assert (
+                acct.recover_message(
+                    message,
+                    vrs=(signed_message.v, signed_message.r, signed_message.s),
+                )
+                == ACCT_ADDRESS
+            )
+            assert acct.recover_transaction(raw_txn) == expected_sender
+        assert acct.recover_transactions([raw_txn]) == [expected_sender]
+        assert len(recoveries) == 2
+        cache_info = acct.recovery_cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (8, 2, 2)
+    finally:
+        Account.disable_recovery_cache()
+
+    assert acct.recovery_cache_info() is None
+    acct.recover_transaction(raw_txn)
+    assert len(recoveries) == 3
+
+
 @pytest.mark.parametrize("raw_v", (0, 27))
 @pytest.mark.parametrize("as_hex", (False, True))
 def test_eth_account_recover_vrs(acct, raw_v, as_hex):
@@ -424,6 +551,29 @@ def test_sign_message_against_sign_hash_as_bytes(keyed_acct, message_bytes):
     assert signed_via_hash == signed_via_message
 
 
+def test_sign_messages(acct):
+    messages = [encode_defunct(text=text) for text in ("", "I♥SF", "I♥NY")]
+    expected = [
+        acct.sign_message(message, PRIVATE_KEY_AS_HEXSTR) for message in messages
+    ]
+
+    assert acct.sign_messages(iter(messages), PRIVATE_KEY_AS_HEXSTR) == expected
+    assert acct.from_key(PRIVATE_KEY_AS_HEXSTR).sign_messages(messages) == expected
+
+    compact = acct.sign_messages(messages, PRIVATE_KEY_AS_HEXSTR, compact=True)
+    assert [signed.to_signed_message() for signed in compact] == expected
+    for compact_signed, signed in zip(compact, expected):
+        assert type(compact_signed.signature) is bytes
+        assert compact_signed["v"] == signed.v
+        assert compact_signed.as_dict() == {
+            "message_hash": signed.message_hash.to_0x_hex(),
+            "r": signed.r,
+            "s": signed.s,
+            "v": signed.v,
+            "signature": signed.signature.to_0x_hex(),
+        }
+
+
 @given(st.binary())
 def test_sign_message_against_sign_hash_as_hex(keyed_acct, message_bytes):
     message_hex = to_hex(message_bytes)
@@ -674,6 +824,21 @@ def test_eth_account_sign_transaction(
 
     account = acct.from_key(private_key)
     assert account.sign_transaction(txn) == signed
+    assert acct.sign_transactions([txn, txn], private_key) == [signed, signed]
+    assert account.sign_transactions([txn]) == [signed]
+
+    [compact] = acct.sign_transactions([txn], private_key, compact=True)
+    assert compact == (bytes(expected_raw_tx), bytes(tx_hash), r, s, v)
+    assert compact["raw_transaction"] == compact.raw_transaction
+    assert compact.to_signed_transaction() == signed
+    assert compact.as_dict() == {
+        "raw_transaction": signed.raw_transaction.to_0x_hex(),
+        "hash": signed.hash.to_0x_hex(),
+        "r": r,
+        "s": s,
+        "v": v,
+    }
+    assert account.sign_transactions([txn], compact=True) == [compact]
 
 
 @pytest.mark.parametrize(
@@ -709,6 +874,182 @@ def test_eth_account_recover_transaction_from_eth_test(acct, transaction):
     assert acct.recover_transaction(raw_txn) == expected_sender
 
 
+def test_eth_account_recover_transactions_from_eth_test(acct):
+    raw_txns = [transaction["signed"] for transaction in ETH_TEST_TRANSACTIONS]
+    raw_txns.append(HexBytes(raw_txns[0]))
+    raw_txns.append(bytes(HexBytes(raw_txns[0])))
+    expected = [acct.recover_transaction(raw_txn) for raw_txn in raw_txns]
+
+    assert acct.recover_transactions(raw_txns) == expected
+    assert acct.recover_transactions(iter(raw_txns)) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            acct.recover_transactions(raw_txns, executor=executor, chunksize=2)
+            == expected
+        )
+
+
+def _signed_transactions_of_each_kind(acct):
+    base_txn = {
+        "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+        "value": 1,
+        "gas": 100000,
+        "chainId": 1,
+    }
+    txns = [
+        dict(base_txn, nonce=0, gasPrice=1),
+        dict(base_txn, nonce=1, maxFeePerGas=2, maxPriorityFeePerGas=1),
+        dict(base_txn, nonce=2, gasPrice=1, accessList=[], data="0x" + "ab" * 100),
+    ]
+    signed_txns = acct.sign_transactions(txns, PRIVATE_KEY_AS_HEXSTR)
+    raw_txns = [transaction["signed"] for transaction in ETH_TEST_TRANSACTIONS]
+    raw_txns.extend(signed.raw_transaction for signed in signed_txns)
+    return [HexBytes(raw_txn) for raw_txn in raw_txns]
+
+
+def test_eth_account_iter_recover_transactions(acct):
+    raw_txns = _signed_transactions_of_each_kind(acct)
+    expected = [
+        (index, acct.recover_transaction(raw_txn), HexBytes(keccak(raw_txn)))
+        for index, raw_txn in enumerate(raw_txns)
+    ]
+
+    hex_lines = io.StringIO(
+        "\n".join(raw_txn.to_0x_hex() for raw_txn in raw_txns) + "\n\n"
+    )
+    rlp_stream = io.BytesIO(
+        b"".join(
+            bytes(raw_txn) if raw_txn[0] >= 0xC0 else rlp.encode(bytes(raw_txn))
+            for raw_txn in raw_txns
+        )
+    )
+    for source in (raw_txns, hex_lines, rlp_stream):
+        assert list(acct.iter_recover_transactions(source, chunksize=2)) == expected
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert (
+            list(
+                acct.iter_recover_transactions(
+                    iter(raw_txns), executor=executor, chunksize=2
+                )
+            )
+            == expected
+        )
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+def test_eth_account_iter_recover_transactions_is_lazy(acct, use_executor):
+    raw_txns = _signed_transactions_of_each_kind(acct)
+    consumed = []
+
+    def source():
+        for raw_txn in raw_txns * 3:
+            consumed.append(raw_txn)
+            yield raw_txn
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = acct.iter_recover_transactions(
+            source(),
+            executor=executor if use_executor else None,
+            chunksize=2,
+            max_pending_chunks=2,
+        )
+        assert next(results)[0] == 0
+        assert len(consumed) <= 4
+        assert len(list(results)) == len(raw_txns) * 3 - 1
+
+
+def test_eth_account_iter_recover_transactions_truncated_stream(acct):
+    raw_txn = bytes(HexBytes(ETH_TEST_TRANSACTIONS[0]["signed"]))
+    with pytest.raises(ValueError, match="Truncated RLP stream"):
+        list(acct.iter_recover_transactions(io.BytesIO(raw_txn[:-1])))
+
+
+def test_eth_account_sign_transaction_from_field(acct):
+    txn = {
+        "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+        "value": 1000000000,
+        "gas": 2000000,
+        "gasPrice": 234567897654321,
+        "nonce": 0,
+        "chainId": 1,
+    }
+    expected = acct.sign_transaction(txn, PRIVATE_KEY_AS_HEXSTR)
+    assert (
+        acct.sign_transaction(
+            dict(txn, **{"from": ACCT_ADDRESS}), PRIVATE_KEY_AS_HEXSTR
+        )
+        == expected
+    )
+    with pytest.raises(TypeError, match=f"from field must match key's {ACCT_ADDRESS}"):
+        acct.sign_transaction(
+            dict(txn, **{"from": ACCT_ADDRESS_ALT}), PRIVATE_KEY_AS_HEXSTR
+        )
+
+
+def test_eth_account_sign_transactions_mixed_types(acct):
+    base_txn = {
+        "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+        "value": 1,
+        "gas": 100000,
+        "chainId": 1,
+    }
+    txns = [
+        dict(base_txn, nonce=0, gasPrice=1),
+        dict(base_txn, nonce=1, maxFeePerGas=2, maxPriorityFeePerGas=1),
+        dict(base_txn, nonce=2, gasPrice=1, accessList=[], **{"from": ACCT_ADDRESS}),
+        dict(base_txn, nonce=3, maxFeePerGas=2, maxPriorityFeePerGas=1),
+    ]
+    signed_txns = acct.sign_transactions(iter(txns), PRIVATE_KEY_AS_HEXSTR)
+    assert signed_txns == [
+        acct.sign_transaction(txn, PRIVATE_KEY_AS_HEXSTR) for txn in txns
+    ]
+    assert [
+        acct.recover_transaction(signed.raw_transaction) for signed in signed_txns
+    ] == [ACCT_ADDRESS] * len(txns)
+
+    with pytest.raises(TypeError, match=f"from field must match key's {ACCT_ADDRESS}"):
+        acct.sign_transactions(
+            txns + [dict(txns[0], **{"from": ACCT_ADDRESS_ALT})],
+            PRIVATE_KEY_AS_HEXSTR,
+        )
+
+
+def test_eth_account_key_cache(acct, monkeypatch):
+    parsed_keys = []
+
+    class CountingPrivateKey(keys.PrivateKey):
+        def __init__(self, *args, **kwargs):
+            parsed_keys.append(args)
+            super().__init__(*args, **kwargs)
+
+    txn = {
+        "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+        "value": 1000000000,
+        "gas": 2000000,
+        "gasPrice": 234567897654321,
+        "nonce": 0,
+        "chainId": 1,
+        "from": ACCT_ADDRESS,
+    }
+    expected = acct.sign_transaction(txn, PRIVATE_KEY_AS_HEXSTR)
+
+    Account.enable_key_cache(maxsize=2)
+    try:
+        monkeypatch.setattr(acct._keys, "PrivateKey", CountingPrivateKey)
+        for _ in range(3):
+            assert acct.sign_transaction(txn, PRIVATE_KEY_AS_HEXSTR) == expected
+            assert acct.sign_transaction(txn, PRIVATE_KEY_AS_BYTES) == expected
+        assert len(parsed_keys) == 1
+        assert Account._key_cache.cache_info().hits == 5
+    finally:
+        Account.disable_key_cache()
+
+    assert Account._key_cache is None
+    acct.sign_transaction(txn, PRIVATE_KEY_AS_HEXSTR)
+    assert len(parsed_keys) == 2
+
+
 def get_encrypt_test_params():
     """
     Params for testing Account#encrypt. Due to not being able to provide fixtures to
@@ -922,6 +1263,288 @@ def test_sign_typed_data_produces_expected_hash(
         ).signature
         == expected_sig
     )
+    assert (
+        acct.sign_typed_data(
+            PRIVATE_KEY_AS_HEXSTR,
+            domain_data,
+            compile_eip712_types(message_types),
+            message_data,
+        ).signature
+        == expected_sig
+    )
+
+
+BATCH_DOMAIN = {
+    "name": "Ether Mail",
+    "version": "1",
+    "chainId": 1,
+    "verifyingContract": "0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC",
+}
+BATCH_MESSAGE_TYPES = {
+    "Person": [
+        {"name": "name", "type": "string"},
+        {"name": "wallet", "type": "address"},
+    ],
+    "Mail": [
+        {"name": "from", "type": "Person"},
+        {"name": "to", "type": "Person"},
+        {"name": "cc", "type": "Person[]"},
+        {"name": "contents", "type": "string"},
+    ],
+}
+BATCH_MESSAGES = [
+    {
+        "from": {"name": "Cow", "wallet": "0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"},
+        "to": {"name": "Bob", "wallet": "0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB"},
+        "cc": [
+            {"name": "Alice", "wallet": "0xaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"}
+        ]
+        * cc_count,
+        "contents": f"Hello, Bob! #{cc_count}",
+    }
+    for cc_count in range(5)
+]
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+@pytest.mark.parametrize("compiled", (False, True))
+def test_sign_typed_data_batch(acct, use_executor, compiled):
+    message_types = (
+        compile_eip712_types(BATCH_MESSAGE_TYPES) if compiled else BATCH_MESSAGE_TYPES
+    )
+    expected = [
+        acct.sign_typed_data(
+            PRIVATE_KEY_AS_HEXSTR, BATCH_DOMAIN, BATCH_MESSAGE_TYPES, message_data
+        )
+        for message_data in BATCH_MESSAGES
+    ]
+
+    if use_executor:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            signed = acct.sign_typed_data_batch(
+                BATCH_DOMAIN,
+                message_types,
+                iter(BATCH_MESSAGES),
+                PRIVATE_KEY_AS_HEXSTR,
+                executor=executor,
+                chunksize=2,
+            )
+            signed_compact = acct.sign_typed_data_batch(
+                BATCH_DOMAIN,
+                message_types,
+                BATCH_MESSAGES,
+                PRIVATE_KEY_AS_HEXSTR,
+                executor=executor,
+                chunksize=2,
+                compact=True,
+            )
+    else:
+        signed = acct.sign_typed_data_batch(
+            BATCH_DOMAIN, message_types, iter(BATCH_MESSAGES), PRIVATE_KEY_AS_HEXSTR
+        )
+        signed_compact = acct.sign_typed_data_batch(
+            BATCH_DOMAIN,
+            message_types,
+            BATCH_MESSAGES,
+            PRIVATE_KEY_AS_HEXSTR,
+            compact=True,
+        )
+
+    assert signed == expected
+    assert [message.to_signed_message() for message in signed_compact] == expected
+
+
+def test_sign_typed_data_batch_with_eip712_domain_type(acct):
+    message_types = dict(
+        BATCH_MESSAGE_TYPES,
+        EIP712Domain=[
+            {"name": "name", "type": "string"},
+            {"name": "version", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+            {"name": "verifyingContract", "type": "address"},
+        ],
+    )
+    expected = [
+        acct.sign_typed_data(
+            PRIVATE_KEY_AS_HEXSTR,
+            full_message={
+                "types": message_types,
+                "primaryType": "Mail",
+                "domain": BATCH_DOMAIN,
+                "message": message_data,
+            },
+        )
+        for message_data in BATCH_MESSAGES
+    ]
+    assert (
+        acct.sign_typed_data_batch(
+            BATCH_DOMAIN,
+            message_types,
+            BATCH_MESSAGES,
+            PRIVATE_KEY_AS_HEXSTR,
+            primary_type="Mail",
+        )
+        == expected
+    )
+
+    local_acct = Account.from_key(PRIVATE_KEY_AS_HEXSTR)
+    assert (
+        local_acct.sign_typed_data_batch(
+            BATCH_DOMAIN, compile_eip712_types(message_types), BATCH_MESSAGES
+        )
+        == expected
+    )
+
+    with pytest.raises(ValidationError, match="The fields provided in `domain`"):
+        acct.sign_typed_data_batch(
+            dissoc(BATCH_DOMAIN, "verifyingContract"),
+            message_types,
+            BATCH_MESSAGES,
+            PRIVATE_KEY_AS_HEXSTR,
+        )
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_sign_typed_data_batch_primary_type_mismatch(acct, compiled):
+    message_types = (
+        compile_eip712_types(BATCH_MESSAGE_TYPES) if compiled else BATCH_MESSAGE_TYPES
+    )
+    with pytest.raises(ValidationError, match="The provided `primaryType`"):
+        acct.sign_typed_data_batch(
+            BATCH_DOMAIN,
+            message_types,
+            BATCH_MESSAGES,
+            PRIVATE_KEY_AS_HEXSTR,
+            primary_type="Person",
+        )
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_sign_typed_data_with_memo_and_parallel(acct, compiled):
+    message_types = (
+        compile_eip712_types(BATCH_MESSAGE_TYPES) if compiled else BATCH_MESSAGE_TYPES
+    )
+    expected = [
+        acct.sign_typed_data(
+            PRIVATE_KEY_AS_HEXSTR, BATCH_DOMAIN, BATCH_MESSAGE_TYPES, message_data
+        )
+        for message_data in BATCH_MESSAGES
+    ]
+    local_acct = Account.from_key(PRIVATE_KEY_AS_HEXSTR)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = ParallelArrayHashing(executor, min_size=2, chunksize=1)
+        memo = StructHashMemo(maxsize=64)
+        for message_data, expected_message in zip(BATCH_MESSAGES, expected):
+            assert encode_typed_data(
+                BATCH_DOMAIN, message_types, message_data, memo=memo, parallel=parallel
+            ) == encode_typed_data(BATCH_DOMAIN, message_types, message_data)
+            assert (
+                acct.sign_typed_data(
+                    PRIVATE_KEY_AS_HEXSTR,
+                    BATCH_DOMAIN,
+                    message_types,
+                    message_data,
+                    memo=memo,
+                    parallel=parallel,
+                )
+                == expected_message
+            )
+            assert (
+                local_acct.sign_typed_data(
+                    BATCH_DOMAIN,
+                    message_types,
+                    message_data,
+                    memo=memo,
+                    parallel=parallel,
+                )
+                == expected_message
+            )
+        # the sender and recipient are hashed once for all the messages
+        assert memo.cache_info().currsize == 3
+
+        batch_memo = StructHashMemo(maxsize=64)
+        assert (
+            acct.sign_typed_data_batch(
+                BATCH_DOMAIN,
+                message_types,
+                BATCH_MESSAGES,
+                PRIVATE_KEY_AS_HEXSTR,
+                memo=batch_memo,
+                parallel=parallel,
+            )
+            == expected
+        )
+        assert batch_memo.cache_info().hits > 0
+        assert (
+            local_acct.sign_typed_data_batch(
+                BATCH_DOMAIN,
+                message_types,
+                BATCH_MESSAGES,
+                memo=batch_memo,
+                parallel=parallel,
+            )
+            == expected
+        )
+
+
+def test_eth_account_domain_separator_cache(acct, monkeypatch):
+    hashed_domains = []
+    original_hash_domain = encoding_and_hashing._hash_domain
+
+    def counting_hash_domain(domain_data):
+        hashed_domains.append(domain_data)
+        return original_hash_domain(domain_data)
+
+    monkeypatch.setattr(encoding_and_hashing, "_hash_domain", counting_hash_domain)
+    message_types = {"Mail": [{"name": "contents", "type": "string"}]}
+    message_data = {"contents": "Hello, Bob!"}
+    domain = {"name": "Ether Mail", "version": "1", "chainId": 1}
+    reordered_domain = {"chainId": 1, "version": "1", "name": "Ether Mail"}
+    other_domain = {"name": "Ether Mail", "version": "1", "chainId": "0x1"}
+    expected = [
+        acct.sign_typed_data(PRIVATE_KEY_AS_HEXSTR, d, message_types, message_data)
+        for d in (domain, other_domain)
+    ]
+    assert acct.domain_separator_cache_info() is None
+
+    Account.enable_domain_separator_cache(maxsize=4, domains=[domain])
+    try:
+        hashed_domains.clear()
+        for _ in range(3):
+            for domain_data, signed in zip(
+                (domain, reordered_domain, other_domain), expected + expected[:1]
+            ):
+                assert (
+                    acct.sign_typed_data(
+                        PRIVATE_KEY_AS_HEXSTR, domain_data, message_types, message_data
+                    )
+                    == signed
+                )
+        assert encode_typed_data(
+            full_message={
+                "types": message_types,
+                "primaryType": "Mail",
+                "domain": reordered_domain,
+                "message": message_data,
+            }
+        ) == encode_typed_data(domain, message_types, message_data)
+        # only the domain that was not preloaded was hashed
+        assert hashed_domains == [other_domain]
+        cache_info = acct.domain_separator_cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (10, 1, 2)
+
+        with pytest.raises(ValueError, match="Invalid domain key"):
+            encode_typed_data(dict(domain, extra=1), message_types, message_data)
+        with pytest.raises(ValueError, match="Invalid domain key"):
+            Account.enable_domain_separator_cache(domains=[{"extra": 1}])
+    finally:
+        Account.disable_domain_separator_cache()
+
+    assert acct.domain_separator_cache_info() is None
+    hashed_domains.clear()
+    acct.sign_typed_data(PRIVATE_KEY_AS_HEXSTR, domain, message_types, message_data)
+    assert hashed_domains == [domain]
 
 
 def test_sign_authorization(acct):
@@ -966,3 +1589,216 @@ def test_sign_authorization_from_local_acct():
     assert Account._recover_hash(
         signed_auth.authorization_hash, vrs=signed_auth.signature.vrs
     ) == to_checksum_address(signed_auth.authority)
+
+
+def test_sign_authorization_authority_is_memoized(acct, monkeypatch):
+    auth = {
+        "chainId": 1,
+        "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+        "nonce": 0,
+    }
+    signed_auth = acct.sign_authorization(auth, PRIVATE_KEY_AS_HEXSTR)
+    unmemoized_copy = signed_auth.model_copy()
+
+    recover = Signature.recover_public_key_from_msg_hash
+    recoveries = []
+
+    def counting_recover(self, message_hash):
+        recoveries.append(message_hash)
+        return recover(self, message_hash)
+
+    monkeypatch.setattr(Signature, "recover_public_key_from_msg_hash", counting_recover)
+
+    assert signed_auth.authority == to_bytes(hexstr=ACCT_ADDRESS)
+    assert signed_auth.authority == to_bytes(hexstr=ACCT_ADDRESS)
+    assert len(recoveries) == 1
+    # the memo is a private attribute, out of the fields, the dump and equality
+    assert "_recovered_authority" not in signed_auth.__dict__
+    assert signed_auth.model_dump() == unmemoized_copy.model_dump()
+    assert signed_auth == unmemoized_copy
+    assert signed_auth != unmemoized_copy.model_copy(update={"nonce": 1})
+
+    # the authority is still derived from the current signature
+    other_signed_auth = acct.sign_authorization(auth, "0x" + "01" * 32)
+    signed_auth.signature = other_signed_auth.signature
+    assert signed_auth.authority == other_signed_auth.authority
+    assert signed_auth.authority != to_bytes(hexstr=ACCT_ADDRESS)
+    assert len(recoveries) == 3
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+def test_sign_authorizations(acct, use_executor):
+    other_key = "0x" + "01" * 32
+    auths = [
+        {
+            "chainId": chain_id,
+            "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+            "nonce": nonce,
+        }
+        for chain_id, nonce in ((1, 0), (0, 7), (1337, 2**64 - 1))
+    ]
+    keys = [PRIVATE_KEY_AS_HEXSTR, other_key, PRIVATE_KEY_AS_OBJ]
+
+    if use_executor:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            signed_with_one_key = acct.sign_authorizations(
+                auths, PRIVATE_KEY_AS_HEXSTR, executor=executor, chunksize=2
+            )
+            signed_with_many_keys = acct.sign_authorizations(
+                iter(auths), keys, executor=executor, chunksize=2
+            )
+    else:
+        signed_with_one_key = acct.sign_authorizations(auths, PRIVATE_KEY_AS_HEXSTR)
+        signed_with_many_keys = acct.sign_authorizations(iter(auths), keys)
+
+    for signed_auths, auth_keys in (
+        (signed_with_one_key, [PRIVATE_KEY_AS_HEXSTR] * len(auths)),
+        (signed_with_many_keys, keys),
+    ):
+        assert len(signed_auths) == len(auths)
+        for signed_auth, auth, key in zip(signed_auths, auths, auth_keys):
+            expected = acct.sign_authorization(auth, key)
+            assert signed_auth == (
+                expected.chain_id,
+                expected.address,
+                expected.nonce,
+                expected.y_parity,
+                expected.r,
+                expected.s,
+            )
+            assert signed_auth["y_parity"] == expected.y_parity
+            assert signed_auth.as_dict() == expected.model_dump(by_alias=True)
+
+        assert acct.recover_authorities(signed_auths) == [
+            to_bytes(hexstr=Account.from_key(key).address) for key in auth_keys
+        ]
+
+
+def test_sign_authorizations_in_transaction(acct):
+    auth = {
+        "chainId": 1337,
+        "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+        "nonce": 1,
+    }
+    tx = {
+        "gas": 100000,
+        "maxFeePerGas": 2000000000,
+        "maxPriorityFeePerGas": 2000000000,
+        "data": "0x",
+        "nonce": 0,
+        "to": "0x09616C3d61b3331fc4109a9E41a8BDB7d9776609",
+        "value": 0,
+        "accessList": (),
+        "chainId": 1337,
+    }
+    [compact_auth] = acct.sign_authorizations([auth], PRIVATE_KEY_AS_HEXSTR)
+    signed_auth = acct.sign_authorization(auth, PRIVATE_KEY_AS_HEXSTR)
+
+    assert acct.sign_transaction(
+        dict(tx, authorizationList=[compact_auth]), PRIVATE_KEY_AS_HEXSTR
+    ) == acct.sign_transaction(
+        dict(tx, authorizationList=[signed_auth]), PRIVATE_KEY_AS_HEXSTR
+    )
+
+
+def test_sign_authorizations_from_local_acct():
+    local_acct = Account.from_key(PRIVATE_KEY_AS_HEXSTR)
+    auths = [
+        {
+            "chainId": 1,
+            "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+            "nonce": nonce,
+        }
+        for nonce in range(3)
+    ]
+    expected = Account.sign_authorizations(auths, PRIVATE_KEY_AS_HEXSTR)
+    assert local_acct.sign_authorizations(auths) == expected
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert (
+            local_acct.sign_authorizations(auths, executor=executor, chunksize=2)
+            == expected
+        )
+
+
+def test_sign_authorizations_invalid_input(acct):
+    auth = {
+        "chainId": 1,
+        "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+        "nonce": 0,
+    }
+    with pytest.raises(ValueError, match="exactly one private key"):
+        acct.sign_authorizations([auth, auth], [PRIVATE_KEY_AS_HEXSTR])
+    with pytest.raises(ValueError, match="exactly one private key"):
+        acct.sign_authorizations([auth], [PRIVATE_KEY_AS_HEXSTR] * 2)
+    with pytest.raises(TypeError, match="must be dict-like"):
+        acct.sign_authorizations([auth, "not an auth"], PRIVATE_KEY_AS_HEXSTR)
+
+
+@pytest.mark.parametrize(
+    "invalid_fields,match",
+    (
+        ({"chainId": "0x1"}, "field chainId"),
+        ({"chainId": True}, "field chainId"),
+        ({"chainId": -1}, "field chainId"),
+        ({"nonce": 1.0}, "field nonce"),
+    ),
+)
+def test_sign_authorizations_rejects_invalid_fields_like_sign_authorization(
+    acct, invalid_fields, match
+):
+    auth = {
+        "chainId": 1,
+        "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+        "nonce": 0,
+        **invalid_fields,
+    }
+    with pytest.raises(rlp.exceptions.SerializationError, match=match):
+        acct.sign_authorization(auth, PRIVATE_KEY_AS_HEXSTR)
+    with pytest.raises(rlp.exceptions.SerializationError, match=match):
+        acct.sign_authorizations([auth], PRIVATE_KEY_AS_HEXSTR)
+
+
+@pytest.mark.parametrize("use_executor", (False, True))
+def test_recover_authorities(acct, use_executor):
+    other_key = "0x" + "01" * 32
+    signed_auths = [
+        acct.sign_authorization(
+            {
+                "chainId": chain_id,
+                "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+                "nonce": nonce,
+            },
+            key,
+        )
+        for chain_id, nonce, key in (
+            (1, 0, PRIVATE_KEY_AS_HEXSTR),
+            (0, 7, other_key),
+            (1337, 2**64 - 1, PRIVATE_KEY_AS_HEXSTR),
+        )
+    ]
+    # authorizations as found in a JSON-RPC authorizationList
+    rpc_auths = [
+        {
+            "chainId": hex(signed_auth.chain_id),
+            "address": to_checksum_address(signed_auth.address),
+            "nonce": hex(signed_auth.nonce),
+            "yParity": hex(signed_auth.y_parity),
+            "r": hex(signed_auth.r),
+            "s": hex(signed_auth.s),
+        }
+        for signed_auth in signed_auths
+    ]
+    expected = [
+        to_bytes(hexstr=ACCT_ADDRESS),
+        to_bytes(hexstr=Account.from_key(other_key).address),
+        to_bytes(hexstr=ACCT_ADDRESS),
+    ]
+
+    if use_executor:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            authorities = acct.recover_authorities(
+                signed_auths + rpc_auths, executor=executor, chunksize=2
+            )
+    else:
+        authorities = acct.recover_authorities(signed_auths + rpc_auths)
+    assert authorities == expected + expected
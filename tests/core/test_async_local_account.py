@@ -0,0 +1,138 @@
+import pytest
+import asyncio
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import threading
+
+from eth_account import (
+    Account,
+    account as account_module,
+)
+from eth_account.messages import (
+    StructHashMemo,
+    encode_defunct,
+)
+from eth_account.signers.async_local import (
+    AsyncLocalAccount,
+)
+from tests.eip712_messages import (
+    ALL_VALID_EIP712_MESSAGES,
+)
+
+PRIVATE_KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+TRANSACTION = {
+    "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+    "value": 1,
+    "gas": 21000,
+    "maxFeePerGas": 2000000000,
+    "maxPriorityFeePerGas": 2000000000,
+    "nonce": 0,
+    "chainId": 1,
+}
+AUTHORIZATION = {
+    "chainId": 1,
+    "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+    "nonce": 0,
+}
+
+
+@pytest.mark.parametrize(
+    "executor_class", (None, ThreadPoolExecutor, ProcessPoolExecutor)
+)
+def test_async_local_account_signs_like_local_account(executor_class):
+    # look Account up at call time, other tests reload its module and process
+    # pools can only pickle the current class
+    account = account_module.Account.from_key(PRIVATE_KEY)
+    message = encode_defunct(text="hello")
+    typed_data = next(iter(ALL_VALID_EIP712_MESSAGES.values()))
+
+    async def sign_all(executor):
+        async_account = AsyncLocalAccount(account, executor=executor)
+        assert async_account.address == account.address
+        return await asyncio.gather(
+            async_account.sign_transaction(TRANSACTION),
+            async_account.sign_transactions([TRANSACTION]),
+            async_account.sign_message(message),
+            async_account.sign_typed_data(full_message=typed_data),
+            async_account.sign_authorization(AUTHORIZATION),
+        )
+
+    if executor_class is None:
+        results = asyncio.run(sign_all(None))
+    else:
+        with executor_class(max_workers=2) as executor:
+            results = asyncio.run(sign_all(executor))
+
+    assert results == [
+        account.sign_transaction(TRANSACTION),
+        account.sign_transactions([TRANSACTION]),
+        account.sign_message(message),
+        account.sign_typed_data(full_message=typed_data),
+        account.sign_authorization(AUTHORIZATION),
+    ]
+
+
+def test_async_local_account_passes_struct_hash_memo():
+    account = Account.from_key(PRIVATE_KEY)
+    typed_data = next(iter(ALL_VALID_EIP712_MESSAGES.values()))
+    memo = StructHashMemo(maxsize=64)
+
+    async def sign_with_memo():
+        async_account = AsyncLocalAccount(account)
+        return await async_account.sign_typed_data(full_message=typed_data, memo=memo)
+
+    assert asyncio.run(sign_with_memo()) == account.sign_typed_data(
+        full_message=typed_data
+    )
+    assert memo.cache_info().misses > 0
+
+
+def test_async_local_account_max_concurrency(monkeypatch):
+    account = Account.from_key(PRIVATE_KEY)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    original_sign_transaction = Account.sign_transaction
+
+    def tracking_sign_transaction(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            return original_sign_transaction(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    monkeypatch.setattr(
+        account._publicapi, "sign_transaction", tracking_sign_transaction
+    )
+
+    async def sign_many():
+        async_account = AsyncLocalAccount(account, executor=executor, max_concurrency=2)
+        return await asyncio.gather(
+            *(
+                async_account.sign_transaction(dict(TRANSACTION, nonce=nonce))
+                for nonce in range(8)
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        signed = asyncio.run(sign_many())
+
+    assert len(signed) == 8
+    assert peak <= 2
+
+
+def test_async_local_account_invalid_max_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency must be a positive integer"):
+        AsyncLocalAccount(Account.from_key(PRIVATE_KEY), max_concurrency=0)
+
+
+def test_async_local_account_decrypt():
+    keyfile = Account.encrypt(PRIVATE_KEY, "password", kdf="pbkdf2", iterations=2)
+    async_account = asyncio.run(AsyncLocalAccount.decrypt(keyfile, "password"))
+    assert async_account.address == Account.from_key(PRIVATE_KEY).address
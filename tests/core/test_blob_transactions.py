@@ -1,6 +1,11 @@
 import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 import glob
 import json
+import mmap
 import os
 
 from eth_utils import (
@@ -17,8 +22,28 @@ from toolz import (
 from eth_account import (
     Account,
 )
+from eth_account._utils.signing import (
+    typed_transaction_hash_and_vrs,
+)
 from eth_account.typed_transactions import (
     BlobTransaction,
+    base as typed_transactions_base,
+)
+from eth_account.typed_transactions.base import (
+    get_blob_sidecar_cache,
+    get_kzg_executor,
+    get_kzg_trusted_setup,
+    preload_kzg_trusted_setup,
+    release_kzg_trusted_setup,
+    set_blob_sidecar_cache,
+    set_kzg_executor,
+)
+from eth_account.typed_transactions.blob_sidecar_cache import (
+    BlobSidecar,
+    BlobSidecarCache,
+    BlobSidecarCacheInfo,
+    DirectoryBlobSidecarStore,
+    blob_sidecar_key,
 )
 
 TEST_DATA_PATH = os.path.join(os.path.dirname(__file__), "_test_data")
@@ -112,6 +137,36 @@ def test_sign_blob_transaction_matches_expected_bytes():
     assert signed_tx.raw_transaction == HexBytes(expected_tx_bytes)
 
 
+@pytest.mark.parametrize(
+    "signed_tx_path",
+    (SIGNED_TX_PATH, BLOB_DATA_1_SIGNED_PATH, ZERO_BLOB_EIP7594_SIGNED_PATH),
+)
+def test_signing_hash_from_pooled_blob_transaction_bytes(signed_tx_path):
+    with open(signed_tx_path) as signed_tx_file:
+        tx_bytes = to_bytes(hexstr=signed_tx_file.read().strip("\n"))
+
+    tx = BlobTransaction.from_bytes(HexBytes(tx_bytes))
+    signing_hash, (v, r, s) = typed_transaction_hash_and_vrs(tx_bytes)
+    assert signing_hash == tx.hash()
+    assert (v, r, s) == tx.vrs()
+
+
+def test_recover_pooled_blob_transaction_with_access_list():
+    tx_dict = merge(
+        BLOB_TX_DICT,
+        {
+            "accessList": [
+                {
+                    "address": "0x0000000000000000000000000000000000000001",
+                    "storageKeys": [f"0x{'01' * 32}"],
+                }
+            ]
+        },
+    )
+    signed_tx = TEST_ACCT.sign_transaction(tx_dict, blobs=[ZERO_BLOB])
+    assert Account.recover_transaction(signed_tx.raw_transaction) == TEST_ACCT.address
+
+
 def test_blob_transaction_calculation_with_nonzero_blob():
     with open(BLOB_DATA_1_PATH) as blob_data_1_file:
         blob_data_1 = to_bytes(hexstr=blob_data_1_file.read().strip("\n"))
@@ -150,6 +205,259 @@ def test_high_and_low_blob_count_limit_validation():
         BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[to_bytes(hexstr=ZERO_BLOB)] * 7)
 
 
+def test_kzg_trusted_setup_is_loaded_once_and_shared(monkeypatch):
+    load_calls = []
+    original_load_trusted_setup = typed_transactions_base.load_trusted_setup
+
+    def counting_load_trusted_setup(*args):
+        load_calls.append(args)
+        return original_load_trusted_setup(*args)
+
+    monkeypatch.setattr(
+        typed_transactions_base, "load_trusted_setup", counting_load_trusted_setup
+    )
+    release_kzg_trusted_setup()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        handles = list(executor.map(lambda _: get_kzg_trusted_setup(), range(16)))
+    assert len(load_calls) == 1
+    assert all(handle is handles[0] for handle in handles)
+
+    # every blob computation reuses the shared handle
+    tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[to_bytes(hexstr=ZERO_BLOB)] * 2)
+    assert len(tx.blob_data.proofs) == len(tx.blob_data.commitments) == 2
+    assert len(tx.blob_data.cell_proofs) == 256
+    assert len(load_calls) == 1
+
+
+def test_kzg_trusted_setup_preload_and_release(monkeypatch):
+    load_calls = []
+    original_load_trusted_setup = typed_transactions_base.load_trusted_setup
+
+    def counting_load_trusted_setup(*args):
+        load_calls.append(args)
+        return original_load_trusted_setup(*args)
+
+    monkeypatch.setattr(
+        typed_transactions_base, "load_trusted_setup", counting_load_trusted_setup
+    )
+    release_kzg_trusted_setup()
+
+    preload_kzg_trusted_setup()
+    first_handle = get_kzg_trusted_setup()
+    assert len(load_calls) == 1
+
+    release_kzg_trusted_setup()
+    second_handle = get_kzg_trusted_setup()
+    assert len(load_calls) == 2
+    assert second_handle is not first_handle
+
+
+def test_signing_blob_transaction_computes_kzg_data_once_per_blob(monkeypatch):
+    calls = {"commitments": 0, "cell_proofs": 0}
+    original_blob_to_kzg_commitment = typed_transactions_base.blob_to_kzg_commitment
+    original_compute_cells_and_kzg_proofs = (
+        typed_transactions_base.compute_cells_and_kzg_proofs
+    )
+
+    def counting_blob_to_kzg_commitment(*args):
+        calls["commitments"] += 1
+        return original_blob_to_kzg_commitment(*args)
+
+    def counting_compute_cells_and_kzg_proofs(*args):
+        calls["cell_proofs"] += 1
+        return original_compute_cells_and_kzg_proofs(*args)
+
+    monkeypatch.setattr(
+        typed_transactions_base,
+        "blob_to_kzg_commitment",
+        counting_blob_to_kzg_commitment,
+    )
+    monkeypatch.setattr(
+        typed_transactions_base,
+        "compute_cells_and_kzg_proofs",
+        counting_compute_cells_and_kzg_proofs,
+    )
+
+    with open(ZERO_BLOB_EIP7594_SIGNED_PATH) as f:
+        expected_tx_bytes = to_bytes(hexstr=f.read().strip("\n"))
+
+    signed_tx = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[ZERO_BLOB])
+    assert signed_tx.raw_transaction == HexBytes(expected_tx_bytes)
+    assert calls == {"commitments": 1, "cell_proofs": 1}
+
+
+@pytest.mark.parametrize("executor_class", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_kzg_executor_matches_serial_computation(executor_class):
+    with open(BLOB_DATA_1_PATH) as blob_data_1_file:
+        blob_data_1 = to_bytes(hexstr=blob_data_1_file.read().strip("\n"))
+    blobs = [blob_data_1, to_bytes(hexstr=ZERO_BLOB), blob_data_1]
+
+    serial_tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=blobs)
+    serial_signed = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=blobs)
+
+    with executor_class(max_workers=2) as executor:
+        set_kzg_executor(executor)
+        try:
+            assert get_kzg_executor() is executor
+            parallel_tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=blobs)
+            assert parallel_tx.blob_data.commitments == serial_tx.blob_data.commitments
+            assert parallel_tx.blob_data.proofs == serial_tx.blob_data.proofs
+            assert parallel_tx.blob_data.cell_proofs == serial_tx.blob_data.cell_proofs
+            parallel_signed = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=blobs)
+        finally:
+            set_kzg_executor(None)
+
+    assert get_kzg_executor() is None
+    assert parallel_signed == serial_signed
+
+
+@pytest.fixture
+def blob_sidecar_cache():
+    cache = BlobSidecarCache(max_entries=4)
+    set_blob_sidecar_cache(cache)
+    yield cache
+    set_blob_sidecar_cache(None)
+
+
+def test_blob_sidecar_cache_skips_kzg_work_when_resigning(
+    monkeypatch, blob_sidecar_cache
+):
+    blob = to_bytes(hexstr=ZERO_BLOB)
+    uncached_tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[blob])
+    assert get_blob_sidecar_cache() is blob_sidecar_cache
+
+    first_signed = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob])
+    assert blob_sidecar_cache.cache_info() == BlobSidecarCacheInfo(
+        hits=0, store_hits=0, misses=1, currsize=1, size_bytes=6272
+    )
+
+    def fail(*args):
+        raise AssertionError("KZG data should have been served from the cache")
+
+    monkeypatch.setattr(typed_transactions_base, "blob_to_kzg_commitment", fail)
+    monkeypatch.setattr(typed_transactions_base, "compute_blob_kzg_proof", fail)
+    monkeypatch.setattr(typed_transactions_base, "compute_cells_and_kzg_proofs", fail)
+
+    bumped_tx_dict = merge(BLOB_TX_DICT, {"maxFeePerGas": 2000})
+    bumped_signed = TEST_ACCT.sign_transaction(bumped_tx_dict, blobs=[blob])
+    assert blob_sidecar_cache.cache_info().hits == 1
+    assert bumped_signed.raw_transaction != first_signed.raw_transaction
+    assert TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob]) == first_signed
+
+    cached_tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[blob])
+    assert cached_tx.blob_data.commitments == uncached_tx.blob_data.commitments
+    assert cached_tx.blob_data.proofs == uncached_tx.blob_data.proofs
+    assert cached_tx.blob_data.cell_proofs == uncached_tx.blob_data.cell_proofs
+    assert (
+        cached_tx.blob_data.versioned_hashes == uncached_tx.blob_data.versioned_hashes
+    )
+
+
+def test_blob_sidecar_cache_reads_through_to_store(tmp_path, blob_sidecar_cache):
+    blob = to_bytes(hexstr=ZERO_BLOB)
+    blob_sidecar_cache.store = DirectoryBlobSidecarStore(tmp_path)
+    signed = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob])
+
+    key = blob_sidecar_key(blob)
+    stored_sidecar = blob_sidecar_cache.store.get(key)
+    assert isinstance(stored_sidecar, BlobSidecar)
+    assert stored_sidecar.versioned_hash == HexBytes(ZERO_BLOB_VERSIONED_HASH)
+    assert len(stored_sidecar.cell_proofs) == 128
+
+    # a fresh cache backed by the same directory is served from the store
+    fresh_cache = BlobSidecarCache(store=DirectoryBlobSidecarStore(tmp_path))
+    set_blob_sidecar_cache(fresh_cache)
+    assert TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob]) == signed
+    assert fresh_cache.cache_info().store_hits == 1
+    assert fresh_cache.cache_info().misses == 0
+
+
+def test_blob_sidecar_byte_encoding_roundtrip():
+    sidecar = BlobSidecar(
+        commitment=b"\x01" * 48,
+        proof=b"\x02" * 48,
+        cell_proofs=(b"\x03" * 48, b"\x04" * 48) * 64,
+        versioned_hash=b"\x01" + b"\x05" * 31,
+    )
+    assert BlobSidecar.from_bytes(sidecar.to_bytes()) == sidecar
+    with pytest.raises(ValueError, match="Invalid encoded blob sidecar"):
+        BlobSidecar.from_bytes(sidecar.to_bytes()[:-1])
+    # exactly one cell proof per cell of the blob
+    for cell_proofs in (sidecar.cell_proofs[:2], sidecar.cell_proofs * 2, ()):
+        with pytest.raises(ValueError, match="Invalid encoded blob sidecar"):
+            BlobSidecar.from_bytes(sidecar._replace(cell_proofs=cell_proofs).to_bytes())
+
+
+def test_directory_blob_sidecar_store_ignores_wrong_cell_proof_count(tmp_path):
+    store = DirectoryBlobSidecarStore(tmp_path)
+    sidecar = BlobSidecar(
+        commitment=b"\x01" * 48,
+        proof=b"\x02" * 48,
+        cell_proofs=(b"\x03" * 48,) * 128,
+        versioned_hash=b"\x01" + b"\x05" * 31,
+    )
+    store.put(b"\x0a" * 32, sidecar)
+    assert store.get(b"\x0a" * 32) == sidecar
+
+    store.put(b"\x0b" * 32, sidecar._replace(cell_proofs=sidecar.cell_proofs[:2]))
+    assert store.get(b"\x0b" * 32) is None
+
+
+def test_blob_bytes_are_not_copied():
+    blob = to_bytes(hexstr=ZERO_BLOB)
+    tx = BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[blob])
+    assert tx.blob_data.blobs[0].data is blob
+    assert tx.blob_data.blobs[0].as_bytes() is blob
+    assert tx.blob_data.blobs[0].as_hexbytes() == HexBytes(blob)
+
+
+@pytest.mark.parametrize("buffer_type", (bytearray, memoryview, HexBytes))
+def test_sign_blob_transaction_with_buffer_blobs(buffer_type):
+    with open(ZERO_BLOB_EIP7594_SIGNED_PATH) as f:
+        expected_tx_bytes = to_bytes(hexstr=f.read().strip("\n"))
+
+    blob = buffer_type(to_bytes(hexstr=ZERO_BLOB))
+    signed_tx = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob])
+    assert signed_tx.raw_transaction == HexBytes(expected_tx_bytes)
+
+
+def test_sign_blob_transaction_with_mmap_blob(tmp_path):
+    with open(ZERO_BLOB_EIP7594_SIGNED_PATH) as f:
+        expected_tx_bytes = to_bytes(hexstr=f.read().strip("\n"))
+
+    blob_path = tmp_path / "blob.bin"
+    blob_path.write_bytes(to_bytes(hexstr=ZERO_BLOB))
+    with open(blob_path, "rb") as blob_file:
+        with mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            signed_tx = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[blob])
+    assert signed_tx.raw_transaction == HexBytes(expected_tx_bytes)
+
+
+def test_sign_blob_transaction_with_blob_file_paths(tmp_path):
+    with open(BLOB_DATA_1_PATH) as blob_data_1_file:
+        blob_data_1 = to_bytes(hexstr=blob_data_1_file.read().strip("\n"))
+    zero_blob = to_bytes(hexstr=ZERO_BLOB)
+
+    zero_blob_path = tmp_path / "zero.blob"
+    zero_blob_path.write_bytes(zero_blob)
+    blob_data_1_path = tmp_path / "blob_data_1.blob"
+    blob_data_1_path.write_bytes(blob_data_1)
+
+    expected = TEST_ACCT.sign_transaction(BLOB_TX_DICT, blobs=[zero_blob, blob_data_1])
+    signed_tx = TEST_ACCT.sign_transaction(
+        BLOB_TX_DICT, blobs=[zero_blob_path, blob_data_1_path]
+    )
+    assert signed_tx == expected
+
+
+def test_blob_file_with_invalid_size_is_rejected(tmp_path):
+    blob_path = tmp_path / "short.blob"
+    blob_path.write_bytes(b"\x00" * 32)
+    with pytest.raises(ValidationError, match="Invalid Blob size"):
+        BlobTransaction.from_dict(BLOB_TX_DICT, blobs=[blob_path])
+
+
 # --- EIP-7594 PeerDAS Cell Proofs Tests ---
 
 
@@ -0,0 +1,50 @@
+import pytest
+
+from eth_account._utils.caching import (
+    CacheInfo,
+    LRUCache,
+)
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == CacheInfo(
+        hits=3, misses=1, maxsize=2, currsize=2, size_bytes=0
+    )
+
+
+def test_lru_cache_evicts_by_size_in_bytes():
+    cache = LRUCache(maxsize=10, max_bytes=5, sizeof=len)
+    cache.put("a", b"123")
+    cache.put("b", b"45")
+    assert cache.cache_info().size_bytes == 5
+
+    cache.put("c", b"6")
+    assert "a" not in cache
+    assert cache.cache_info().size_bytes == 3
+
+    # replacing an entry accounts for the size of the old value
+    cache.put("b", b"4")
+    assert cache.cache_info().size_bytes == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=0, maxsize=10, currsize=0, size_bytes=0
+    )
+
+
+def test_lru_cache_invalid_limits():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        LRUCache(maxsize=0)
+    with pytest.raises(TypeError, match="A sizeof function is required"):
+        LRUCache(maxsize=1, max_bytes=10)
@@ -4,11 +4,18 @@ from copy import (
 )
 import json
 
+from eth_abi import (
+    encode,
+)
 from eth_utils import (
     ValidationError,
 )
 
+from eth_account._utils.encode_typed_data import (
+    encoding_and_hashing,
+)
 from eth_account.messages import (
+    compile_eip712_types,
     encode_typed_data,
 )
 from tests.eip712_messages import (
@@ -36,11 +43,55 @@ def test_valid_messages(message):
     )
 
 
+@pytest.mark.parametrize("message", all_valid)
+def test_valid_messages_with_compiled_types(message):
+    full_message = all_valid[message]
+    compiled_types = compile_eip712_types(full_message["types"])
+    expected = encode_typed_data(full_message=full_message)
+
+    assert (
+        encode_typed_data(full_message=dict(full_message, types=compiled_types))
+        == expected
+    )
+    domain_data, _, message_data = convert_to_3_arg(full_message)
+    assert encode_typed_data(domain_data, compiled_types, message_data) == expected
+
+
+@pytest.mark.parametrize("message", all_valid)
+def test_valid_messages_match_eth_abi_encoding(message, monkeypatch):
+    full_message = all_valid[message]
+    compiled_message = dict(
+        full_message, types=compile_eip712_types(full_message["types"])
+    )
+    packed = encode_typed_data(full_message=full_message)
+    packed_compiled = encode_typed_data(full_message=compiled_message)
+
+    def abi_encode(abi_types, values):
+        return encode([abi_type for abi_type, _ in zip(abi_types, values)], values)
+
+    monkeypatch.setattr(encoding_and_hashing, "pack_words", abi_encode)
+    monkeypatch.setattr(
+        encoding_and_hashing,
+        "encode_word",
+        lambda abi_type, value: abi_encode([abi_type], [value]),
+    )
+    assert encode_typed_data(full_message=full_message) == packed
+    assert encode_typed_data(full_message=compiled_message) == packed_compiled
+
+
 @pytest.mark.parametrize("message", invalid)
 def test_invalid_messages(message):
     with pytest.raises(ValueError):
         encode_typed_data(full_message=invalid[message])
 
+    with pytest.raises(ValueError):
+        full_message = invalid[message]
+        encode_typed_data(
+            full_message=dict(
+                full_message, types=compile_eip712_types(full_message["types"])
+            )
+        )
+
     with pytest.raises(ValueError):
         encode_typed_data(*convert_to_3_arg(invalid[message]))
 
@@ -49,4 +100,13 @@ def test_invalid_messages(message):
 def test_messages_that_are_only_invalid_for_one_arg_encoding(message):
     with pytest.raises(ValidationError):
         encode_typed_data(full_message=one_arg_invalid[message])
+
+    with pytest.raises(ValidationError):
+        full_message = one_arg_invalid[message]
+        encode_typed_data(
+            full_message=dict(
+                full_message, types=compile_eip712_types(full_message["types"])
+            )
+        )
+
     encode_typed_data(*convert_to_3_arg(one_arg_invalid[message]))
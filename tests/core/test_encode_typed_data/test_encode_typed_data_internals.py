@@ -1,21 +1,50 @@
 import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+from copy import (
+    deepcopy,
+)
+import pickle
 import re
 
+from eth_abi import (
+    encode,
+)
 from eth_abi.exceptions import (
     EncodingTypeError,
     ValueOutOfBounds,
 )
+from eth_utils import (
+    ValidationError,
+)
 
+from eth_account._utils.caching import (
+    CacheInfo,
+    LRUCache,
+)
+from eth_account._utils.encode_typed_data import (
+    encoding_and_hashing,
+)
 from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+    ParallelArrayHashing,
+    compile_eip712_types,
+    domain_separator_cache_key,
     encode_data,
     encode_field,
     encode_type,
+    encode_word,
     find_type_dependencies,
+    get_domain_separator_cache,
     get_primary_type,
     hash_domain,
     hash_eip712_message,
     hash_struct,
     hash_type,
+    pack_words,
+    preload_domain_separators,
+    set_domain_separator_cache,
+    struct_hash_memo_key,
 )
 
 
@@ -882,6 +911,8 @@ def test_encode_type_pass_and_hash_type(
 def test_encode_type_fail(primary_type, types, expected):
     with pytest.raises(**expected):
         encode_type(primary_type, types)
+    with pytest.raises(**expected):
+        compile_eip712_types(types)
 
 
 @pytest.mark.parametrize(
@@ -989,6 +1020,37 @@ def test_hash_domain_fail(domain_data, expected):
         hash_domain(domain_data)
 
 
+def test_domain_separator_cache_key():
+    domain = {"name": "Ether Mail", "chainId": 1, "salt": b"decafbeef"}
+    reordered_domain = {"salt": b"decafbeef", "chainId": 1, "name": "Ether Mail"}
+    assert domain_separator_cache_key(domain) == domain_separator_cache_key(
+        reordered_domain
+    )
+    assert domain_separator_cache_key(domain) != domain_separator_cache_key(
+        dict(domain, chainId=True)
+    )
+    assert domain_separator_cache_key(dict(domain, salt=bytearray(b"1"))) is None
+
+
+def test_hash_domain_with_cache():
+    domain = {"name": "Ether Mail", "chainId": 1}
+    unhashable_domain = {"name": "Ether Mail", "salt": bytearray(b"decafbeef")}
+    expected = [hash_domain(domain), hash_domain(unhashable_domain)]
+
+    with pytest.raises(ValueError, match="not enabled"):
+        preload_domain_separators([domain])
+
+    set_domain_separator_cache(LRUCache(2))
+    try:
+        with pytest.raises(TypeError, match="hashable values"):
+            preload_domain_separators([unhashable_domain])
+        for _ in range(2):
+            assert [hash_domain(domain), hash_domain(unhashable_domain)] == expected
+        assert get_domain_separator_cache().cache_info()[:2] == (1, 1)
+    finally:
+        set_domain_separator_cache(None)
+
+
 @pytest.mark.parametrize(
     "type_,message, types, encode_data_expected, hash_struct_expected",
     (
@@ -1166,6 +1228,11 @@ def test_encode_data_pass_and_hash_struct_and_hash_eip712_message(
     assert hash_struct(type_, types, message).hex() == hash_struct_expected
     assert hash_eip712_message(types, message).hex() == hash_struct_expected
 
+    compiled_types = compile_eip712_types(types, primary_type=type_)
+    assert compiled_types.encode_data(message).hex() == encode_data_expected
+    assert compiled_types.hash_struct(message).hex() == hash_struct_expected
+    assert hash_eip712_message(compiled_types, message).hex() == hash_struct_expected
+
 
 @pytest.mark.parametrize(
     "type_,message, types, expected_error",
@@ -1267,3 +1334,382 @@ def test_encode_data_pass_and_hash_struct_and_hash_eip712_message(
 def test_encode_data_fail(type_, message, types, expected_error):
     with pytest.raises(**expected_error):
         encode_data(type_, types, message)
+    with pytest.raises(**expected_error):
+        compile_eip712_types(types).encode_data(message, type_)
+
+
+@pytest.mark.parametrize(
+    "abi_type, value",
+    (
+        ("bytes32", b"\x01" * 32),
+        ("bytes32", b""),
+        ("bytes8", b"\x01\x02"),
+        ("uint256", 0),
+        ("uint256", 2**256 - 1),
+        ("uint", 7),
+        ("uint8", 255),
+        ("int256", -1),
+        ("int16", -32768),
+        ("bool", True),
+        ("bool", False),
+        ("address", "0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"),
+        ("address", b"\xcd" * 20),
+    ),
+)
+def test_encode_word_matches_eth_abi(abi_type, value):
+    assert encode_word(abi_type, value) == encode([abi_type], [value])
+
+
+def test_pack_words():
+    abi_types = ("bytes32", "uint8", "address", "bool")
+    values = (b"\xff" * 32, 3, "0x" + "cd" * 20, True)
+    assert pack_words(abi_types, values) == encode(abi_types, values)
+    assert pack_words((), ()) == b""
+
+
+def test_encode_word_fail():
+    with pytest.raises(ValueOutOfBounds):
+        encode_word("uint256", 2**256)
+    with pytest.raises(ValueOutOfBounds):
+        encode_word("uint256", -1)
+    with pytest.raises(EncodingTypeError):
+        encode_word("uint256", True)
+    with pytest.raises(ValueError, match="cannot be encoded as one 32-byte word"):
+        encode_word("string", "not a word")
+
+
+MAIL_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+    ],
+    "Person": [
+        {"name": "name", "type": "string"},
+        {"name": "wallets", "type": "address[]"},
+    ],
+    "Mail": [
+        {"name": "from", "type": "Person"},
+        {"name": "to", "type": "Person[]"},
+        {"name": "attachments", "type": "Attachment[2]"},
+        {"name": "contents", "type": "string"},
+    ],
+    "Attachment": [
+        {"name": "kind", "type": "uint8"},
+        {"name": "data", "type": "bytes"},
+    ],
+}
+
+
+def test_compile_eip712_types():
+    compiled_types = compile_eip712_types(MAIL_TYPES)
+    message_types = {k: v for k, v in MAIL_TYPES.items() if k != "EIP712Domain"}
+
+    assert compiled_types.primary_type == "Mail"
+    assert compiled_types.domain_field_names == ("name", "chainId")
+    assert set(compiled_types.structs) == set(message_types)
+    for type_, struct in compiled_types.structs.items():
+        assert struct.name == type_
+        assert struct.encoded_type == encode_type(type_, message_types)
+        assert struct.type_hash == hash_type(type_, message_types)
+        assert struct.field_names == tuple(f["name"] for f in message_types[type_])
+    assert compiled_types.structs["Mail"].dependencies == (
+        "Mail",
+        "Attachment",
+        "Person",
+    )
+    assert compiled_types.structs["Mail"].abi_types == ("bytes32",) * 5
+
+    message = {
+        "from": {"name": "Cow", "wallets": []},
+        "to": [
+            {"name": "Bob", "wallets": ["0x" + "bb" * 20, "0x" + "cc" * 20]},
+            None,
+        ],
+        "attachments": [{"kind": 1, "data": "0x1234"}, {"kind": "0x2", "data": b""}],
+        "contents": "Hello, Bob!",
+    }
+    assert compiled_types.encode_data(message) == encode_data(
+        "Mail", message_types, message
+    )
+    assert compiled_types.hash_struct(message["from"], "Person") == hash_struct(
+        "Person", message_types, message["from"]
+    )
+
+
+def test_compile_eip712_types_does_not_depend_on_input():
+    types = deepcopy(MAIL_TYPES)
+    compiled_types = compile_eip712_types(types)
+    types["Person"].append({"name": "age", "type": "uint8"})
+    del types["Attachment"]
+
+    assert compiled_types.types == compile_eip712_types(MAIL_TYPES).types
+    assert compiled_types.structs["Person"].encoded_type == (
+        "Person(string name,address[] wallets)"
+    )
+    with pytest.raises(TypeError):
+        compiled_types.types["Person"] = ()
+    with pytest.raises(AttributeError):
+        compiled_types.primary_type = "Person"
+
+
+def test_compile_eip712_types_pickles():
+    compiled_types = compile_eip712_types(MAIL_TYPES, primary_type="Mail")
+    unpickled_types = pickle.loads(pickle.dumps(compiled_types))
+
+    assert unpickled_types.types == compiled_types.types
+    assert unpickled_types.primary_type == compiled_types.primary_type
+    person = {"name": "Cow", "wallets": ["0x" + "cd" * 20]}
+    assert unpickled_types.hash_struct(person, "Person") == (
+        compiled_types.hash_struct(person, "Person")
+    )
+
+
+def test_compile_eip712_types_fail():
+    with pytest.raises(ValidationError, match="does not match the derived"):
+        compile_eip712_types(MAIL_TYPES, primary_type="Person")
+    with pytest.raises(ValueError, match="Unable to determine primary type"):
+        compile_eip712_types(
+            {"A": [{"name": "a", "type": "uint8"}], "B": [{"name": "b", "type": "B"}]}
+        )
+
+    compiled_types = compile_eip712_types(MAIL_TYPES)
+    with pytest.raises(ValueError, match="Missing value for field `to`"):
+        compiled_types.encode_data({"from": None, "contents": ""})
+    with pytest.raises(ValueError, match="expected array"):
+        compiled_types.encode_data({"from": None, "to": {}, "contents": ""})
+
+
+def test_struct_hash_memo_key():
+    person_type = "Person(string name,address[] wallets)"
+    person = {"name": "Cow", "wallets": ["0x" + "cd" * 20]}
+    reordered_person = {"wallets": ["0x" + "cd" * 20], "name": "Cow"}
+    assert struct_hash_memo_key(person_type, person) == struct_hash_memo_key(
+        person_type, reordered_person
+    )
+    assert struct_hash_memo_key(person_type, person) != struct_hash_memo_key(
+        "Person(string name,address[] wallets,string note)", person
+    )
+    attachment_type = "Attachment(uint8 kind,bytes data)"
+    assert struct_hash_memo_key(attachment_type, {"kind": 1}) != struct_hash_memo_key(
+        attachment_type, {"kind": True}
+    )
+    assert struct_hash_memo_key(attachment_type, {"data": bytearray(b"1")}) is None
+
+
+class MutableRows:
+    """An iterable array value, hashed by identity, whose contents may change."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_struct_hash_memo_skips_identity_hashed_iterables(compiled):
+    types = {
+        "Table": [{"name": "rows", "type": "uint256[]"}],
+        "Report": [
+            {"name": "first", "type": "Table"},
+            {"name": "second", "type": "Table"},
+        ],
+    }
+    message_types = compile_eip712_types(types) if compiled else types
+    rows = MutableRows([1, 2])
+    assert struct_hash_memo_key("Table(uint256[] rows)", {"rows": rows}) is None
+    assert struct_hash_memo_key("Table(uint256[] rows)", {"rows": iter([])}) is None
+
+    memo = LRUCache(maxsize=64)
+    message = {"first": {"rows": rows}, "second": {"rows": [3]}}
+    first_hash = hash_eip712_message(message_types, message, memo=memo)
+    assert first_hash == hash_eip712_message(message_types, message)
+    rows.rows = [4, 5]
+    second_hash = hash_eip712_message(message_types, message, memo=memo)
+    assert second_hash == hash_eip712_message(message_types, message)
+    assert second_hash != first_hash
+
+    # the same iterator twice is exhausted the second time, with or without a memo
+    def shared_iterator_message():
+        shared = iter([1, 2])
+        return {"first": {"rows": shared}, "second": {"rows": shared}}
+
+    assert hash_eip712_message(
+        message_types, shared_iterator_message(), memo=LRUCache(maxsize=64)
+    ) == hash_eip712_message(message_types, shared_iterator_message())
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_hash_eip712_message_with_struct_hash_memo(compiled):
+    types = deepcopy(MAIL_TYPES)
+    del types["EIP712Domain"]
+    message_types = compile_eip712_types(types) if compiled else types
+    cow = {"name": "Cow", "wallets": ["0x" + "cd" * 20]}
+    bob = {"name": "Bob", "wallets": ["0x" + "bb" * 20, "0x" + "cd" * 20]}
+    message = {
+        "from": cow,
+        "to": [bob, dict(cow), bob, {"wallets": cow["wallets"], "name": "Cow"}],
+        "attachments": [
+            {"kind": 1, "data": b"\x01"},
+            {"kind": 1, "data": bytearray(b"\x01")},
+        ],
+        "contents": "Hello, Bob!",
+    }
+    expected = hash_eip712_message(message_types, message)
+
+    memo = LRUCache(maxsize=64)
+    assert hash_eip712_message(message_types, message, memo=memo) == expected
+    # the second Attachment is not hashable, so it is not memoized
+    assert memo.cache_info() == CacheInfo(
+        hits=3, misses=3, maxsize=64, currsize=3, size_bytes=0
+    )
+
+    # the memo has every sub-struct of a repeated message
+    assert hash_eip712_message(message_types, message, memo=memo) == expected
+    assert memo.cache_info().hits == 9
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_struct_hash_memo_reused_across_types(compiled):
+    short_types = {
+        "Person": [{"name": "name", "type": "string"}],
+        "Mail": [{"name": "from", "type": "Person"}],
+    }
+    long_types = {
+        "Person": [
+            {"name": "name", "type": "string"},
+            {"name": "note", "type": "string"},
+        ],
+        "Mail": [{"name": "from", "type": "Person"}],
+    }
+    # a missing struct field is encoded like an empty value, so both messages
+    # have the same Person value
+    message = {"from": {"name": "Cow"}}
+
+    memo = LRUCache(maxsize=64)
+    for types in (short_types, long_types, short_types):
+        message_types = compile_eip712_types(types) if compiled else types
+        assert hash_eip712_message(
+            message_types, message, memo=memo
+        ) == hash_eip712_message(message_types, message)
+    assert memo.cache_info().hits == 1
+    assert memo.cache_info().currsize == 2
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_hash_eip712_message_with_parallel_array_hashing(compiled):
+    types = {
+        "Leaf": [
+            {"name": "account", "type": "address"},
+            {"name": "amounts", "type": "uint256[]"},
+        ],
+        "Claims": [
+            {"name": "leaves", "type": "Leaf[]"},
+            {"name": "ids", "type": "bytes32[]"},
+            {"name": "few", "type": "uint8[]"},
+        ],
+    }
+    message_types = compile_eip712_types(types) if compiled else types
+    message = {
+        "leaves": [
+            {"account": "0x" + f"{i:040x}", "amounts": list(range(i % 7))}
+            for i in range(37)
+        ],
+        "ids": [i.to_bytes(32, "big") for i in range(20)],
+        "few": [1, 2, 3],
+    }
+    expected = hash_eip712_message(message_types, message)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for chunksize in (1, 5, 64):
+            parallel = ParallelArrayHashing(executor, min_size=4, chunksize=chunksize)
+            assert (
+                hash_eip712_message(message_types, message, parallel=parallel)
+                == expected
+            )
+
+        message["leaves"][30]["amounts"] = [-1]
+        with pytest.raises(ValueOutOfBounds):
+            hash_eip712_message(
+                message_types,
+                message,
+                parallel=ParallelArrayHashing(executor, min_size=4, chunksize=5),
+            )
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_hash_eip712_message_with_iterable_arrays(compiled):
+    types = deepcopy(MAIL_TYPES)
+    del types["EIP712Domain"]
+    message_types = compile_eip712_types(types) if compiled else types
+    people = [
+        {"name": f"Person {i}", "wallets": ["0x" + f"{j:040x}" for j in range(i)]}
+        for i in range(5)
+    ]
+    attachments = [{"kind": 1, "data": b"\x01"}, {"kind": 2, "data": b""}]
+    message = {
+        "from": people[0],
+        "to": people,
+        "attachments": attachments,
+        "contents": "Hello, Bob!",
+    }
+    expected = hash_eip712_message(message_types, message)
+
+    def streamed_people():
+        for person in people:
+            yield dict(person, wallets=iter(person["wallets"]))
+
+    streamed_message = {
+        "from": people[0],
+        "to": streamed_people(),
+        "attachments": tuple(attachments),
+        "contents": "Hello, Bob!",
+    }
+    assert hash_eip712_message(message_types, streamed_message) == expected
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = ParallelArrayHashing(
+            executor, min_size=2, chunksize=2, max_pending=1
+        )
+        streamed_message["to"] = streamed_people()
+        assert (
+            hash_eip712_message(message_types, streamed_message, parallel=parallel)
+            == expected
+        )
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+def test_hash_eip712_message_reads_iterable_arrays_lazily(compiled, monkeypatch):
+    types = {"Batch": [{"name": "amounts", "type": "uint256[]"}]}
+    message_types = compile_eip712_types(types) if compiled else types
+    amounts = list(range(10))
+    expected = hash_eip712_message(message_types, {"amounts": amounts})
+
+    encoded = []
+    original_encode_word = encoding_and_hashing.encode_word
+
+    def recording_encode_word(abi_type, value):
+        encoded.append(value)
+        return original_encode_word(abi_type, value)
+
+    def streamed_amounts():
+        for amount in amounts:
+            # every earlier amount is hashed before the next one is read
+            assert encoded == amounts[:amount]
+            yield amount
+
+    monkeypatch.setattr(encoding_and_hashing, "encode_word", recording_encode_word)
+    assert (
+        hash_eip712_message(message_types, {"amounts": streamed_amounts()}) == expected
+    )
+    # followed by the words of the Batch struct itself
+    assert encoded[: len(amounts)] == amounts
+
+
+@pytest.mark.parametrize("compiled", (False, True))
+@pytest.mark.parametrize("value", ("abc", b"abc", {"amount": 1}, 1))
+def test_hash_eip712_message_rejects_non_array_iterables(compiled, value):
+    types = {"Batch": [{"name": "amounts", "type": "uint256[]"}]}
+    message_types = compile_eip712_types(types) if compiled else types
+    with pytest.raises(ValueError, match="expected array"):
+        hash_eip712_message(message_types, {"amounts": value})
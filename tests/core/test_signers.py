@@ -1,6 +1,14 @@
+import pytest
+
 from eth_account import (
     Account,
 )
+from eth_account.account_local_actions import (
+    AccountLocalActions,
+)
+from eth_account.messages import (
+    encode_defunct,
+)
 from tests.eip712_messages import (
     ALL_VALID_EIP712_MESSAGES,
 )
@@ -12,3 +20,33 @@ def test_sign_typed_data_signing_same_for_account_and_local_account():
         assert Account.sign_typed_data(
             new_local_account.key, full_message=message
         ) == new_local_account.sign_typed_data(full_message=message)
+
+
+def test_account_local_actions_subclass_without_batch_methods():
+    class SingleSigner(AccountLocalActions):
+        def encrypt(self, private_key, password, kdf=None, iterations=None):
+            return {}
+
+        def unsafe_sign_hash(self, message_hash, private_key):
+            return Account.unsafe_sign_hash(message_hash, private_key)
+
+        def sign_message(self, signable_message, private_key):
+            return Account.sign_message(signable_message, private_key)
+
+        def sign_transaction(self, transaction_dict, private_key, blobs=None):
+            return Account.sign_transaction(transaction_dict, private_key, blobs)
+
+        def sign_typed_data(self, private_key, *args, **kwargs):
+            return Account.sign_typed_data(private_key, *args, **kwargs)
+
+        def sign_authorization(self, private_key, authorization):
+            return Account.sign_authorization(authorization, private_key)
+
+    signer = SingleSigner()
+    message = encode_defunct(text="hello")
+    key = Account.create().key
+    assert signer.sign_message(message, key) == Account.sign_message(message, key)
+    with pytest.raises(NotImplementedError, match="sign_messages"):
+        signer.sign_messages([message], key)
+    with pytest.raises(NotImplementedError, match="sign_authorizations"):
+        signer.sign_authorizations([], key)
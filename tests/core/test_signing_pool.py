@@ -0,0 +1,128 @@
+import pytest
+
+from eth_keys import (
+    KeyAPI,
+)
+from eth_keys.backends import (
+    NativeECCBackend,
+)
+from eth_utils import (
+    to_bytes,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account.messages import (
+    encode_defunct,
+)
+from eth_account.signers.pool import (
+    SigningPool,
+    _init_worker,
+    _worker_keys,
+)
+from tests.eip712_messages import (
+    ALL_VALID_EIP712_MESSAGES,
+)
+
+PRIVATE_KEY = "0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318"
+PRIVATE_KEY_ALT = b"rainbows" * 4
+
+TRANSACTIONS = [
+    {
+        "to": "0xF0109fC8DF283027b6285cc889F5aA624EaC1F55",
+        "value": 1,
+        "gas": 21000,
+        "maxFeePerGas": 2000000000,
+        "maxPriorityFeePerGas": 2000000000,
+        "nonce": nonce,
+        "chainId": 1,
+    }
+    for nonce in range(5)
+]
+
+
+@pytest.fixture(scope="module")
+def signing_pool():
+    with SigningPool(
+        [PRIVATE_KEY, PRIVATE_KEY_ALT], max_workers=2, chunksize=2
+    ) as pool:
+        yield pool
+
+
+def test_signing_pool_sign_transactions(signing_pool):
+    signer = Account.from_key(PRIVATE_KEY_ALT).address
+    assert signing_pool.sign_transactions(TRANSACTIONS, signer=signer) == [
+        Account.sign_transaction(txn, PRIVATE_KEY_ALT) for txn in TRANSACTIONS
+    ]
+
+
+def test_signing_pool_compact_results(signing_pool):
+    signer = Account.from_key(PRIVATE_KEY).address
+    messages = [encode_defunct(text=f"message {i}") for i in range(5)]
+    assert signing_pool.sign_transactions(
+        TRANSACTIONS, signer=signer, compact=True
+    ) == Account.sign_transactions(TRANSACTIONS, PRIVATE_KEY, compact=True)
+    assert signing_pool.sign_messages(
+        messages, signer=signer, compact=True
+    ) == Account.sign_messages(messages, PRIVATE_KEY, compact=True)
+
+
+def test_signing_pool_sign_messages(signing_pool):
+    signer = Account.from_key(PRIVATE_KEY).address
+    messages = [encode_defunct(text=f"message {i}") for i in range(5)]
+    assert signing_pool.sign_messages(messages, signer=signer) == [
+        Account.sign_message(message, PRIVATE_KEY) for message in messages
+    ]
+
+
+def test_signing_pool_sign_typed_data(signing_pool):
+    signer = Account.from_key(PRIVATE_KEY).address
+    messages = list(ALL_VALID_EIP712_MESSAGES.values())
+    assert signing_pool.sign_typed_data(messages, signer=signer) == [
+        Account.sign_typed_data(PRIVATE_KEY, full_message=message)
+        for message in messages
+    ]
+
+
+def test_signing_pool_signer_validation(signing_pool):
+    with pytest.raises(ValueError, match="signer is required"):
+        signing_pool.sign_transactions(TRANSACTIONS)
+    with pytest.raises(ValueError, match="No private key for"):
+        signing_pool.sign_transactions(
+            TRANSACTIONS, signer="0xF0109fC8DF283027b6285cc889F5aA624EaC1F55"
+        )
+
+
+def test_signing_pool_normalizes_signer(signing_pool):
+    account = Account.from_key(PRIVATE_KEY)
+    expected = [Account.sign_transaction(txn, PRIVATE_KEY) for txn in TRANSACTIONS]
+    for signer in (account.address.lower(), to_bytes(hexstr=account.address)):
+        assert signing_pool.sign_transactions(TRANSACTIONS, signer=signer) == expected
+
+
+class WorkerBackend(NativeECCBackend):
+    pass
+
+
+def test_signing_pool_worker_keys_use_account_backend():
+    address = Account.from_key(PRIVATE_KEY).address
+    try:
+        _init_worker(KeyAPI(WorkerBackend), (to_bytes(hexstr=PRIVATE_KEY),))
+        assert isinstance(_worker_keys[address].backend, WorkerBackend)
+    finally:
+        _worker_keys.clear()
+
+
+def test_signing_pool_from_local_account():
+    account = Account.from_key(PRIVATE_KEY)
+    with SigningPool(account, max_workers=1) as pool:
+        assert pool.addresses == (account.address,)
+        assert pool.sign_transactions(TRANSACTIONS) == account.sign_transactions(
+            TRANSACTIONS
+        )
+
+
+def test_signing_pool_requires_a_key():
+    with pytest.raises(ValueError, match="at least one private key"):
+        SigningPool([])
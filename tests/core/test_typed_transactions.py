@@ -6,7 +6,12 @@ from eth_keys.datatypes import (
 from hexbytes import (
     HexBytes,
 )
+import rlp
 
+from eth_account._utils.signing import (
+    to_standard_v,
+    typed_transaction_hash_and_vrs,
+)
 from eth_account.datastructures import (
     SignedSetCodeAuthorization,
 )
@@ -531,6 +536,42 @@ def test_encode(test_case):
     assert actual == expected
 
 
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_CASE_IDS)
+def test_signing_hash_from_bytes(test_case):
+    raw_transaction = HexBytes(test_case["expected_raw_transaction"])
+    decoded = TypedTransaction.from_bytes(raw_transaction)
+    (v, r, s) = decoded.vrs()
+    assert typed_transaction_hash_and_vrs(bytes(raw_transaction)) == (
+        decoded.hash(),
+        (to_standard_v(v), r, s),
+    )
+
+
+def test_signing_hash_from_bytes_invalid():
+    raw_transaction = HexBytes(TEST_CASES[0]["expected_raw_transaction"])
+    with pytest.raises(TypeError, match="unknown type: 5"):
+        typed_transaction_hash_and_vrs(b"\x05" + raw_transaction[1:])
+    # a dynamic fee transaction relabelled as an access list transaction
+    relabelled = b"\x01" + HexBytes(TEST_CASES[5]["expected_raw_transaction"])[1:]
+    with pytest.raises(rlp.exceptions.DeserializationError):
+        TypedTransaction.from_bytes(HexBytes(relabelled))
+    with pytest.raises(rlp.exceptions.DeserializationError):
+        typed_transaction_hash_and_vrs(relabelled)
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_CASE_IDS)
+def test_signing_hash_from_bytes_validates_fields(test_case):
+    raw_transaction = HexBytes(test_case["expected_raw_transaction"])
+    items = rlp.decode(raw_transaction[1:])
+    # a 19-byte ``to`` address
+    items[4 if raw_transaction[0] == 1 else 5] = b"\x11" * 19
+    malformed = raw_transaction[:1] + rlp.encode(items)
+    with pytest.raises(rlp.exceptions.DeserializationError, match="field to"):
+        TypedTransaction.from_bytes(HexBytes(malformed))
+    with pytest.raises(rlp.exceptions.DeserializationError, match="field to"):
+        typed_transaction_hash_and_vrs(malformed)
+
+
 @pytest.mark.parametrize("test_case", TEST_CASES, ids=TEST_CASE_IDS)
 def test_decode_encode(test_case):
     raw_transaction = test_case["expected_raw_transaction"]